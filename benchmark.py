@@ -0,0 +1,415 @@
+# Performans ölçüm takımı: editörün sık kullanılan yollarının dosya boyutuyla nasıl ölçeklendiği
+# Test değildir; ekranı olmayan Linux makinede Xvfb altında çalıştırılır:
+#   xvfb-run -a python benchmark.py --baseline benchmark-baseline.json
+# 1 bin - 1 milyon satırlık yapay Python dosyaları üretilir ve gerçek NotepadPlusPlusApp /
+# EditorTab örnekleri üzerinde açma, tuş vuruşu dizileri, kaydırma, renklendirme, arama,
+# Tümünü Değiştir, karşılaştırma ve kaydetme ölçülür. Her boyut ayrı bir alt süreçte
+# çalışır; böylece en yüksek bellek (RSS) değerleri birbirine karışmaz. Sonuçlar JSON
+# olarak yazılır ve verilen temel sonuçlarla karşılaştırılır; eşiği aşan gerileme varsa
+# çıkış kodu 1 olur.
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_VERSION = 1
+DEFAULT_SIZES = (1000, 10000, 100000, 1000000)
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.25   # Temelden %25 yavaşlama gerileme sayılır
+MIN_REGRESSION_MS = 2.0    # Bundan küçük mutlak farklar ölçüm gürültüsü sayılır
+MIN_REGRESSION_MB = 5.0
+WORKER_TIMEOUT_S = 30 * 60
+SEED = 1234
+
+KEYSTROKES = 200      # Tek dizideki tuş vuruşu sayısı
+SCROLL_STEPS = 50
+DIFF_EDITS = 2000     # Karşılaştırmada kopyada değiştirilen satır sayısı
+SEARCH_PATTERN = "value"
+REPLACE_PATTERN = "amount"
+PERCENTILES = (50, 95, 99)
+
+_WORDS = ("value", "total", "index", "buffer", "result", "count", "name", "items", "offset", "line")
+
+
+def synthetic_line(rng, lineno):
+    # Renklendiricinin bütün kurallarını çalıştıran, gerçeğe yakın Python satırları
+    word = rng.choice(_WORDS)
+    kind = lineno % 10
+    if kind == 0:
+        return f"def {word}_{lineno}(self, {rng.choice(_WORDS)}=None):"
+    if kind == 1:
+        return f'    """{word} için açıklama satırı {lineno}"""'
+    if kind == 2:
+        return f"    # {word} hesaplanıyor ({lineno})"
+    if kind == 3:
+        return f"    {word} = {rng.randint(0, 100000)} + len('{rng.choice(_WORDS)}')"
+    if kind == 4:
+        return f"    if {word} is not None and {word} > {rng.random():.3f}:"
+    if kind == 5:
+        return f'        return "{word}-{lineno}"'
+    if kind == 6:
+        return f"    for {word} in range({rng.randint(1, 50)}):"
+    if kind == 7:
+        return f"        self.{word}.append({word} * 2)"
+    if kind == 8:
+        return "class Item%d(object):" % lineno
+    return ""
+
+
+def write_synthetic(path, lines, seed=SEED):
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        block = []
+        for lineno in range(lines):
+            block.append(synthetic_line(rng, lineno))
+            if len(block) == 10000:
+                f.write("\n".join(block) + "\n")
+                block = []
+        f.write("\n".join(block) + "\n" if block else "")
+
+
+def summarize(samples):
+    # Milisaniye cinsinden yüzdelikler (en yakın sıra yöntemi)
+    ordered = sorted(samples)
+    result = {"n": len(ordered)}
+    for p in PERCENTILES:
+        rank = max(0, min(len(ordered) - 1, -(-p * len(ordered) // 100) - 1))
+        result[f"p{p}"] = round(ordered[rank], 3) if ordered else None
+    result["max"] = round(ordered[-1], 3) if ordered else None
+    return result
+
+
+def peak_rss_mb():
+    # Linux'ta ru_maxrss KB cinsindendir
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+class Bench:
+    # Tek bir dosya boyutu için ölçümler; alt süreçte çalışır
+    def __init__(self, lines, repeat, workdir):
+        self.lines = lines
+        self.repeat = repeat
+        self.workdir = workdir
+        self.samples = {}
+        # Oturum ve kurtarma dosyaları kullanıcının gerçek klasörüne yazılmasın
+        os.environ["HOME"] = os.path.join(workdir, "home")
+        os.makedirs(os.environ["HOME"], exist_ok=True)
+        self.path = os.path.join(workdir, f"bench_{lines}.py")
+        write_synthetic(self.path, lines)
+
+        import tkinter as tk
+        import main
+        self.tk = tk
+        self.main = main
+        try:
+            self.root = tk.Tk()
+        except tk.TclError as e:
+            sys.exit(f"Tk başlatılamadı ({e}); ekranı olmayan makinede xvfb-run ile çalıştırın")
+        self.root.geometry("1000x700+0+0")
+        self.app = main.NotepadPlusPlusApp(self.root)
+        self.pump(lambda: "ready" in self.app.profile.events)
+
+    def add(self, name, seconds):
+        self.samples.setdefault(name, []).append(seconds * 1000)
+
+    def pump(self, condition, timeout=600):
+        # condition sağlanana kadar Tk olaylarını işle
+        deadline = time.perf_counter() + timeout
+        while not condition():
+            if time.perf_counter() > deadline:
+                raise RuntimeError("Zaman aşımı")
+            self.root.update()
+
+    def viewport_clean(self, editor):
+        return editor._first_dirty_in(*editor._visible_lines()) is None
+
+    def loaded(self, editor):
+        # Dosya arka planda açılır: metnin tamamı gelene ve görünen alan boyanana kadar
+        return editor.loader is None and self.viewport_clean(editor)
+
+    def settle(self, editor):
+        # Yükleme, renklendirme ve satır numarası işleri bitene kadar bekle
+        self.pump(lambda: editor.loader is None and editor._highlight_job is None
+                  and editor._gutter_job is None and not editor._dirty_ranges)
+
+    def run(self):
+        editor = self.bench_open()
+        self.bench_highlight(editor)
+        self.bench_scroll(editor)
+        self.bench_keystrokes(editor)
+        self.bench_brackets(editor)
+        self.bench_complete(editor)
+        self.bench_diff()
+        self.bench_find(editor)
+        self.bench_replace_all(editor)
+        self.bench_save(editor)
+        metrics = {name: summarize(samples) for name, samples in self.samples.items()}
+        metrics["peak_rss_mb"] = peak_rss_mb()
+        for editor in self.app.iter_editors():
+            if editor.journal is not None:
+                editor.journal.discard()
+        self.root.destroy()
+        return metrics
+
+    def bench_open(self):
+        # Dosyayı açıp tamamı yüklenene ve ilk ekran renklendirilene kadar geçen süre
+        for i in range(self.repeat):
+            started = time.perf_counter()
+            self.app.open_file(self.path)
+            editor = self.app.get_current_editor()
+            self.root.update_idletasks()
+            self.pump(lambda: self.loaded(editor))
+            self.add("open", time.perf_counter() - started)
+            if i < self.repeat - 1:
+                self.settle(editor)
+                self.app.close_current_tab()
+        self.settle(editor)
+        return editor
+
+    def bench_highlight(self, editor):
+        # highlight_syntax: görünen alanın boyanması (her tekrarda) ve belgenin tamamı (bir kez)
+        text = editor.text
+        rng = random.Random(SEED)
+        for _ in range(self.repeat):
+            text.yview_moveto(rng.random())
+            self.root.update_idletasks()
+            started = time.perf_counter()
+            editor.highlight_syntax()
+            self.pump(lambda: self.viewport_clean(editor))
+            self.add("highlight_viewport", time.perf_counter() - started)
+            self.settle(editor)
+        started = time.perf_counter()
+        editor.highlight_syntax()
+        self.settle(editor)
+        self.add("highlight_full", time.perf_counter() - started)
+
+    def bench_scroll(self, editor):
+        # Sayfa sayfa ve rastgele konumlara kaydırma; satır numaraları dahil
+        text = editor.text
+        rng = random.Random(SEED + 1)
+        text.yview_moveto(0)
+        for step in range(SCROLL_STEPS * self.repeat):
+            started = time.perf_counter()
+            if step % 5 == 4:
+                text.yview_moveto(rng.random())
+            else:
+                text.yview_scroll(1, "pages")
+            self.root.update_idletasks()
+            self.add("scroll", time.perf_counter() - started)
+        for _ in range(SCROLL_STEPS):
+            started = time.perf_counter()
+            editor._gutter_key = None
+            editor._redraw_linenumbers()
+            self.add("update_linenumbers", time.perf_counter() - started)
+
+    def bench_keystrokes(self, editor):
+        # Belgenin ortasında tuş vuruşu dizileri; her 40 karakterde bir satır sonu
+        text = editor.text
+        for burst in range(self.repeat):
+            text.mark_set("insert", f"{self.lines // 2 + burst}.0")
+            text.see("insert")
+            self.settle(editor)
+            for i in range(KEYSTROKES):
+                char = "\n" if i % 40 == 39 else "x"
+                started = time.perf_counter()
+                text.insert("insert", char)
+                text.see("insert")
+                editor.on_key_release()
+                self.root.update_idletasks()
+                self.add("keystroke", time.perf_counter() - started)
+            started = time.perf_counter()
+            self.settle(editor)
+            self.add("keystroke_settle", time.perf_counter() - started)
+
+    def bench_brackets(self, editor):
+        # Rastgele satır sonlarında imleçteki ayracın eşini bulma (dizin tamken)
+        text = editor.text
+        rng = random.Random(SEED + 2)
+        self.settle(editor)
+        for _ in range(SCROLL_STEPS * self.repeat):
+            text.mark_set("insert", f"{rng.randint(1, self.lines)}.0 lineend")
+            started = time.perf_counter()
+            editor.bracket_at_cursor()
+            self.add("bracket_match", time.perf_counter() - started)
+
+    def bench_complete(self, editor):
+        # Ortak kelime dizininde önek sorgusu (bütün sekmeler sayıldıktan sonra)
+        self.pump(lambda: all(e._words_job is None for e in self.app.iter_editors()))
+        rng = random.Random(SEED + 3)
+        for _ in range(SCROLL_STEPS * self.repeat):
+            word = rng.choice(_WORDS)
+            prefix = word[:rng.randint(1, len(word))]
+            started = time.perf_counter()
+            self.app.word_index.complete(prefix, self.main.COMPLETION_LIMIT)
+            self.add("complete", time.perf_counter() - started)
+
+    def bench_diff(self):
+        # Karşılaştırma hesabı (Tk bağımsız): dosyanın düzenlenmiş kopyasıyla ve en kötü
+        # durum olarak tek geçişli çapası olmayan, birkaç satırın döngüsünden oluşan metinle
+        import diff
+        rng = random.Random(SEED + 4)
+        with open(self.path, encoding="utf-8") as f:
+            lines = f.read().split("\n")
+        cycle = ["    if value:", "        total += 1", "    else:", "        total -= 1", ""]
+        repetitive = [cycle[i % len(cycle)] for i in range(self.lines)]
+        for name, a in (("diff", lines), ("diff_repetitive", repetitive)):
+            for _ in range(self.repeat):
+                b = list(a)
+                for _ in range(DIFF_EDITS):
+                    b[rng.randrange(len(b))] = synthetic_line(rng, rng.randrange(self.lines))
+                started = time.perf_counter()
+                diff.diff_lines(a, b)
+                self.add(name, time.perf_counter() - started)
+
+    def bench_find(self, editor):
+        dialog = self.main.FindReplaceDialog(self.root, editor, mode="find")
+        dialog.find_entry.insert(0, SEARCH_PATTERN)
+        for _ in range(self.repeat):
+            started = time.perf_counter()
+            dialog.find()
+            self.pump(lambda: not dialog.engine.scanning)
+            self.add("find", time.perf_counter() - started)
+        dialog.destroy()
+
+    def bench_replace_all(self, editor):
+        # Her tekrar bir öncekini geri çevirir; eşleşme sayısı sabit kalır
+        dialog = self.main.FindReplaceDialog(self.root, editor, mode="replace")
+        pairs = [(SEARCH_PATTERN, REPLACE_PATTERN), (REPLACE_PATTERN, SEARCH_PATTERN)]
+        for i in range(self.repeat):
+            pattern, replacement = pairs[i % 2]
+            dialog.find_entry.delete(0, "end")
+            dialog.find_entry.insert(0, pattern)
+            dialog.replace_entry.delete(0, "end")
+            dialog.replace_entry.insert(0, replacement)
+            started = time.perf_counter()
+            dialog.replace_all()
+            self.root.update_idletasks()
+            self.add("replace_all", time.perf_counter() - started)
+            self.settle(editor)
+        dialog.destroy()
+
+    def bench_save(self, editor):
+        # save_ui: arayüzde geçen süre (anlık görüntü); save: dosya diske yazılana kadar
+        for _ in range(self.repeat):
+            editor.text.insert("1.0", "#")
+            started = time.perf_counter()
+            self.app.save_file()
+            self.add("save_ui", time.perf_counter() - started)
+            self.app.saver.flush()
+            self.add("save", time.perf_counter() - started)
+            self.root.update()
+
+
+def run_worker(lines, repeat):
+    workdir = tempfile.mkdtemp(prefix="notep-bench-")
+    try:
+        metrics = Bench(lines, repeat, workdir).run()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    print(json.dumps(metrics))
+
+
+def run_size(lines, repeat):
+    command = [sys.executable, os.path.abspath(__file__), "--worker", str(lines), "--repeat", str(repeat)]
+    proc = subprocess.run(command, capture_output=True, text=True, timeout=WORKER_TIMEOUT_S,
+                          cwd=os.path.dirname(os.path.abspath(__file__)))
+    if proc.returncode != 0:
+        raise RuntimeError(f"{lines} satırlık ölçüm başarısız oldu:\n{proc.stderr.strip()}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def compare(results, baseline, threshold):
+    # (metrik, temel, şimdiki) gerilemeleri; yalnızca iki tarafta da bulunan ölçümler karşılaştırılır
+    regressions = []
+    for size, metrics in results["sizes"].items():
+        base_metrics = baseline.get("sizes", {}).get(size, {})
+        for name, current in metrics.items():
+            base = base_metrics.get(name)
+            if base is None:
+                continue
+            if name == "peak_rss_mb":
+                pairs, minimum = [("", base, current)], MIN_REGRESSION_MB
+            else:
+                pairs = [(f"/p{p}", base.get(f"p{p}"), current.get(f"p{p}")) for p in PERCENTILES]
+                minimum = MIN_REGRESSION_MS
+            for suffix, old, new in pairs:
+                if old is None or new is None:
+                    continue
+                if new > old * (1 + threshold) and new - old >= minimum:
+                    regressions.append((f"{size}/{name}{suffix}", old, new))
+    return regressions
+
+
+def print_table(results):
+    for size, metrics in results["sizes"].items():
+        print(f"\n{size} satır  (en yüksek RSS {metrics['peak_rss_mb']} MB)")
+        for name, stats in metrics.items():
+            if name != "peak_rss_mb":
+                print(f"  {name:<20} p50 {stats['p50']:>10.2f}  p95 {stats['p95']:>10.2f}  "
+                      f"p99 {stats['p99']:>10.2f} ms  (n={stats['n']})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PyNotepad++ performans ölçümleri")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Virgülle ayrılmış satır sayıları")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--baseline", help="Karşılaştırılacak temel sonuç dosyası")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Gerileme sayılacak oransal yavaşlama (0.25 = %%25)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Sonuçları --baseline dosyasına temel olarak yaz")
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        run_worker(args.worker, args.repeat)
+        return 0
+
+    import tkinter
+    results = {
+        "version": BENCH_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "tk": tkinter.TkVersion,
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "sizes": {},
+    }
+    for lines in (int(size) for size in args.sizes.split(",") if size.strip()):
+        print(f"{lines} satır ölçülüyor...", file=sys.stderr)
+        results["sizes"][str(lines)] = run_size(lines, args.repeat)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print_table(results)
+
+    if args.baseline and args.save_baseline:
+        shutil.copyfile(args.output, args.baseline)
+        print(f"\nTemel sonuçlar {args.baseline} dosyasına yazıldı")
+        return 0
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("version") != BENCH_VERSION:
+            print(f"\n{args.baseline} farklı bir ölçüm sürümünden; karşılaştırılmadı")
+            return 0
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\nGerileme (eşik %{args.threshold * 100:.0f}):")
+            for name, old, new in regressions:
+                print(f"  {name}: {old} → {new} (+%{(new / old - 1) * 100 if old else 0:.0f})")
+            return 1
+        print("\nTemele göre gerileme yok")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
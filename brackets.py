@@ -0,0 +1,350 @@
+# Ayraç (parantez) ve girinti dizini (Tk bağımsız)
+# Her satır için yalnızca bir özet tutulur: dize ve yorum dışındaki ayraçların satırdaki
+# net derinlik değişimi, satır içindeki en düşük derinlikler ve girinti genişliği. Ayraçların
+# kendisi saklanmaz; eşleşmenin bulunduğu satır için çağıran tarafından yeniden çıkarılır.
+# Satırlar BLOCK_LINES büyüklüğünde bloklarda durur. Blok özetleri üzerindeki en küçük
+# değer ağaçları (segment tree) eşleşen ayracın bulunduğu bloğu O(log n) adımda verir;
+# blok içinde en fazla BLOCK_LINES satır taranır.
+import bisect
+import re
+
+BLOCK_LINES = 256
+TAB_WIDTH = 8      # Tk Text'in varsayılan sekme durakları (ortalama karakter genişliğinin 8 katı)
+OPENERS = {"(": ")", "[": "]", "{": "}"}
+BRACKET_RE = re.compile(r"[()\[\]{}]")
+SKIP_TOKENS = ("string", "comment", "key")  # Bu belirteçlerin içindeki ayraçlar sayılmaz
+INF = float("inf")
+CACHE_LIMIT = 100000  # Özet önbelleği bu kadar girdiyi aşınca boşaltılır (ör. küçültülmüş tek satırlık dosyalar)
+
+# Satırın ayraç dizisi (ör. "[{}]") ve girintisi → özet; aynı özetler tek nesne olarak
+# paylaşılır, böylece çoğu satır yalnızca bir sözlük araması tutar
+_infos = {}
+
+
+def indent_width(text):
+    # Satır başındaki boşlukların sütun genişliği; boş (ya da yalnızca boşluk) satırda None
+    stripped = text.lstrip(" \t")
+    if not stripped:
+        return None
+    prefix = text[:len(text) - len(stripped)]
+    return len(prefix.expandtabs(TAB_WIDTH)) if "\t" in prefix else len(prefix)
+
+
+def line_brackets(text, skips=None):
+    # Satırdaki (sütun, ayraç) çiftleri; skips: sayılmayacak (başlangıç, bitiş) sütun aralıkları
+    return [(match.start(), match.group()) for match in BRACKET_RE.finditer(text)
+            if not skips or not any(start <= match.start() < end for start, end in skips)]
+
+
+def _summary(sequence, indent):
+    # (net derinlik, ayraçlardan sonraki en düşük derinlik, ayraçlardan önceki en düşük
+    # derinlik, girinti); derinlikler satır başına göre, ayraç yoksa en düşükler INF
+    depth = 0
+    min_after = min_before = INF
+    for char in sequence:
+        if depth < min_before:
+            min_before = depth
+        depth += 1 if char in OPENERS else -1
+        if depth < min_after:
+            min_after = depth
+    return depth, min_after, min_before, indent
+
+
+def line_info(text, skips=None):
+    if skips:
+        parts = []
+        previous = 0
+        for start, end in skips:
+            parts.append(text[previous:start])
+            previous = end
+        parts.append(text[previous:])
+        code = "".join(parts)
+    else:
+        code = text
+    key = ("".join(BRACKET_RE.findall(code)), indent_width(text))
+    info = _infos.get(key)
+    if info is None:
+        if len(_infos) >= CACHE_LIMIT:
+            _infos.clear()
+        info = _infos[key] = _summary(*key)
+    return info
+
+
+def line_infos(text, runs, first_line=1):
+    # Çözümleyicinin bu metin için ürettiği belirteçlerle (lexer.Grammar.tokenize) satır özetleri
+    skips = {}
+    for line, start, end, token_type in runs:
+        if token_type in SKIP_TOKENS:
+            skips.setdefault(line, []).append((start, end))
+    return [line_info(line_text, skips.get(first_line + i)) for i, line_text in enumerate(text.split("\n"))]
+
+
+def _summarize(lines):
+    # Bloğun özeti: (net derinlik, en düşük derinlik (sonra), en düşük derinlik (önce), bilinmeyen satır)
+    depth = 0
+    min_after = min_before = INF
+    pending = 0
+    for info in lines:
+        if info is None:
+            pending += 1
+            continue
+        net, after, before, _ = info
+        if depth + after < min_after:
+            min_after = depth + after
+        if depth + before < min_before:
+            min_before = depth + before
+        depth += net
+    return depth, min_after, min_before, pending
+
+
+def _build_tree(values):
+    size = 1
+    while size < len(values):
+        size *= 2
+    tree = [INF] * (2 * size)
+    tree[size:size + len(values)] = values
+    for i in range(size - 1, 0, -1):
+        tree[i] = min(tree[2 * i], tree[2 * i + 1])
+    return tree, size
+
+
+def _first_at_most(tree, size, start, limit):
+    # start ve sonrasındaki, değeri limit'i aşmayan ilk yaprak
+    i = start + size
+    if start >= size:
+        return None
+    if tree[i] <= limit:
+        return start
+    while i > 1:
+        if not i & 1 and tree[i + 1] <= limit:
+            i += 1
+            break
+        i >>= 1
+    else:
+        return None
+    while i < size:
+        i = 2 * i if tree[2 * i] <= limit else 2 * i + 1
+    return i - size
+
+
+def _last_at_most(tree, size, start, limit):
+    # start ve öncesindeki, değeri limit'i aşmayan son yaprak
+    if start < 0:
+        return None
+    i = start + size
+    if tree[i] <= limit:
+        return start
+    while i > 1:
+        if i & 1 and tree[i - 1] <= limit:
+            i -= 1
+            break
+        i >>= 1
+    else:
+        return None
+    while i < size:
+        i = 2 * i + 1 if tree[2 * i + 1] <= limit else 2 * i
+    return i - size
+
+
+class BracketIndex:
+    # Satırlar 1 tabanlıdır ve editörün satır durumu tablosuyla aynı düzenlemeleri alır:
+    # değişen satırlar bilinmeyen (None) olur, renklendirici onları işledikçe update ile dolar
+    def __init__(self, line_count=1):
+        self.reset(line_count)
+
+    def reset(self, line_count):
+        self._set_lines([None] * line_count)
+
+    def _set_lines(self, lines):
+        self.blocks = [lines[i:i + BLOCK_LINES] for i in range(0, len(lines), BLOCK_LINES)] or [[None]]
+        self.summaries = [_summarize(block) for block in self.blocks]
+        self._index_cache = None
+
+    def _index(self):
+        # Blokların ilk satırları, bloktan önceki derinlikler ve en küçük değer ağaçları
+        if self._index_cache is None:
+            starts, pre = [], []
+            line, depth, pending = 1, 0, 0
+            after, before = [], []
+            for block, (net, min_after, min_before, unknown) in zip(self.blocks, self.summaries):
+                starts.append(line)
+                pre.append(depth)
+                after.append(depth + min_after)
+                before.append(depth + min_before)
+                line += len(block)
+                depth += net
+                pending += unknown
+            self._index_cache = (starts, pre, _build_tree(after), _build_tree(before), line - 1, pending)
+        return self._index_cache
+
+    @property
+    def line_count(self):
+        return self._index()[4]
+
+    @property
+    def ready(self):
+        # Bütün satırların özeti biliniyor mu (ör. açılıştaki arka plan renklendirmesi bitti mi)
+        return self._index()[5] == 0
+
+    def _locate(self, line):
+        # 1 tabanlı satır → (blok, blok içi konum)
+        starts = self._index()[0]
+        block = max(0, bisect.bisect_right(starts, line) - 1)
+        return block, line - starts[block]
+
+    def replace(self, first, last, count):
+        # Düzenleme öncesi first..last satırlarının yerine count bilinmeyen satır
+        last = min(last, self.line_count)
+        b0, o0 = self._locate(first)
+        b1, o1 = self._locate(last)
+        if b1 < b0:
+            b1, o1 = b0, len(self.blocks[b0]) - 1
+        lines = [info for block in self.blocks[b0:b1 + 1] for info in block]
+        offset = sum(len(block) for block in self.blocks[b0:b1]) + o1
+        lines[o0:offset + 1] = [None] * count
+        # Küçülen bloklar komşusuyla birleştirilir; bölünenler eşit parçalara ayrılır
+        if len(lines) < BLOCK_LINES // 2 and b1 + 1 < len(self.blocks):
+            b1 += 1
+            lines.extend(self.blocks[b1])
+        pieces = max(1, -(-len(lines) // BLOCK_LINES))
+        size = -(-len(lines) // pieces)
+        blocks = [lines[i:i + size] for i in range(0, len(lines), size)] or [[None]]
+        self.blocks[b0:b1 + 1] = blocks
+        self.summaries[b0:b1 + 1] = [_summarize(block) for block in blocks]
+        self._index_cache = None
+
+    def replace_many(self, edits):
+        # edits: düzenleme öncesi koordinatlarda artan, çakışmayan (first, last, delta) üçlüleri;
+        # tablo tek geçişte yeniden kurulur
+        lines = [info for block in self.blocks for info in block]
+        pieces = []
+        pos = 0
+        for first, last, delta in edits:
+            pieces.append(lines[pos:first - 1])
+            pieces.append([None] * (last + delta - first + 1))
+            pos = last
+        pieces.append(lines[pos:])
+        self._set_lines([info for piece in pieces for info in piece])
+
+    def update(self, first, infos):
+        # first satırından başlayarak satır özetlerini yaz (satır sayısı değişmez)
+        block, offset = self._locate(first)
+        i = 0
+        while i < len(infos) and block < len(self.blocks):
+            lines = self.blocks[block]
+            n = min(len(lines) - offset, len(infos) - i)
+            lines[offset:offset + n] = infos[i:i + n]
+            self.summaries[block] = _summarize(lines)
+            i += n
+            block += 1
+            offset = 0
+        self._index_cache = None
+
+    def indent(self, line):
+        # Satırın girintisi; boş satırda None
+        block, offset = self._locate(line)
+        info = self.blocks[block][offset]
+        return info[3] if info is not None else None
+
+    def _depth_before(self, line):
+        block, offset = self._locate(line)
+        depth = self._index()[1][block]
+        for info in self.blocks[block][:offset]:
+            if info is not None:
+                depth += info[0]
+        return depth
+
+    def _scan_block(self, block, limit, start, stop, column):
+        # Bloğun start..stop-1 satırları arasında, satır başı derinliği + satır içi en düşük
+        # derinliği limit'i aşmayan ilk (ya da stop < start ise son) satır
+        lines = self.blocks[block]
+        depth = self._index()[1][block]
+        depths = []
+        for info in lines:
+            depths.append(depth)
+            if info is not None:
+                depth += info[0]
+        order = range(start, stop) if start <= stop else range(start, stop, -1)
+        for i in order:
+            info = lines[i]
+            if info is not None and depths[i] + info[column] <= limit:
+                return self._index()[0][block] + i
+        return None
+
+    def _find_forward(self, line, limit):
+        # line ve sonrasında, bir ayraçtan sonraki derinliği limit'i aşmayan ilk satır
+        if line > self.line_count:
+            return None
+        block, offset = self._locate(line)
+        found = self._scan_block(block, limit, offset, len(self.blocks[block]), 1)
+        if found is not None:
+            return found
+        (tree, size) = self._index()[2]
+        block = _first_at_most(tree, size, block + 1, limit)
+        if block is None:
+            return None
+        return self._scan_block(block, limit, 0, len(self.blocks[block]), 1)
+
+    def _find_backward(self, line, limit):
+        # line ve öncesinde, bir ayraçtan önceki derinliği limit'i aşmayan son satır
+        if line < 1:
+            return None
+        block, offset = self._locate(line)
+        found = self._scan_block(block, limit, offset, -1, 2)
+        if found is not None:
+            return found
+        (tree, size) = self._index()[3]
+        block = _last_at_most(tree, size, block - 1, limit)
+        if block is None:
+            return None
+        return self._scan_block(block, limit, len(self.blocks[block]) - 1, -1, 2)
+
+    def match(self, line, column, get_brackets):
+        # (line, column) konumundaki ayracın eşi: (satır, sütun, türler uyuşuyor mu) ya da None.
+        # get_brackets(satır) → o satırın [(sütun, ayraç)] listesi (dize/yorum dışı)
+        brackets = get_brackets(line)
+        depths = []
+        depth = 0
+        position = None
+        for k, (col, char) in enumerate(brackets):
+            depths.append(depth)
+            if col == column:
+                position = k
+            depth += 1 if char in OPENERS else -1
+        if position is None:
+            return None
+        char = brackets[position][1]
+        base = depths[position]
+        if char in OPENERS:
+            # Eş: ayraçtan sonraki derinliği, açılıştan önceki derinliğe inen ilk ayraç
+            depth = base + 1
+            for col, other in brackets[position + 1:]:
+                depth += 1 if other in OPENERS else -1
+                if depth <= base:
+                    return line, col, OPENERS[char] == other
+            limit = self._depth_before(line) + base
+            found = self._find_forward(line + 1, limit)
+            if found is None:
+                return None
+            depth = self._depth_before(found)
+            for col, other in get_brackets(found):
+                depth += 1 if other in OPENERS else -1
+                if depth <= limit:
+                    return found, col, OPENERS[char] == other
+            return None
+        # Kapanışın eşi: önceki derinliği, kapanıştan önceki derinliğin altına inen son ayraç
+        for k in range(position - 1, -1, -1):
+            if depths[k] <= base - 1:
+                return line, brackets[k][0], OPENERS.get(brackets[k][1]) == char
+        limit = self._depth_before(line) + base - 1
+        found = self._find_backward(line - 1, limit)
+        if found is None:
+            return None
+        found_brackets = get_brackets(found)
+        depth = self._depth_before(found)
+        candidate = None
+        for col, other in found_brackets:
+            if depth <= limit:
+                candidate = (found, col, OPENERS.get(other) == char)
+            depth += 1 if other in OPENERS else -1
+        return candidate
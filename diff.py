@@ -0,0 +1,399 @@
+# Satır tabanlı fark (diff) hesabı ve iki tarafı hizalayan satır eşlemesi (Tk bağımsız)
+# Satırlar önce tamsayılara çevrilir (aynı metin → aynı sayı), böylece karşılaştırmalar
+# metin değil sayı karşılaştırmasıdır. Ortak baş ve son her bölgede hemen atılır. İki
+# tarafta da bir kez geçen satırlar tek geçişte çapa olur; aralarda git'in "histogram"
+# yöntemi kullanılır: en az tekrarlanan ortak satırlardan en uzun eşleşmeyi veren çapa
+# seçilir, bölge ikiye ayrılır. Çapa bulunamayan (yalnızca çok tekrarlanan satırların
+# ortak olduğu) bölgelerde doğrusal bellekli Myers kullanılır.
+# Sonuç "hunk" listesidir: (a0, a1, b0, b1) yarı açık, 0 tabanlı satır aralıkları.
+import bisect
+
+MAX_CHAIN = 64            # Bundan çok tekrarlanan satırlar çapa olamaz
+MYERS_MAX_COST = 1024     # Myers bu kadar düzenlemeyi aşarsa bölge toptan değişmiş sayılır
+WORK_PASSES = 16          # Toplam iş ~bu kadar tam taramayla sınırlı (ör. karışık satırlar); sonrası toptan değişiklik
+ANCHORLESS_PASSES = 4     # Tek geçişli çapa hiç yoksa (yalnızca tekrarlanan satırlar) sınır daha dar
+MIN_WORK = 1 << 20        # Küçük dosyalarda sınır bundan aşağı inmez
+
+
+def intern_lines(a_lines, b_lines):
+    ids = {}
+    a = [ids.setdefault(line, len(ids)) for line in a_lines]
+    b = [ids.setdefault(line, len(ids)) for line in b_lines]
+    return a, b
+
+
+def _strip(a, alo, ahi, b, blo, bhi, matches):
+    # Ortak baş ve sonu eşleşme olarak yazar, kalan aralığı döndürür
+    start = alo
+    while alo < ahi and blo < bhi and a[alo] == b[blo]:
+        alo += 1
+        blo += 1
+    if alo > start:
+        matches.append((start, blo - (alo - start), alo - start))
+    end = ahi
+    while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+        ahi -= 1
+        bhi -= 1
+    if ahi < end:
+        matches.append((ahi, bhi, end - ahi))
+    return alo, ahi, blo, bhi
+
+
+def _anchor(a, alo, ahi, b, blo, bhi):
+    # Histogram çapası (git): her ortak blok, içindeki satırların a bölgesindeki en düşük
+    # tekrar sayısıyla puanlanır; en düşük sayılı, eşitlikte en uzun blok seçilir. b'deki
+    # her konum denenir (bulunan bloğun içi atlanmaz); aynı köşegende zaten uzatılmış bir
+    # bloğun içine düşen aday aynı bloğu verir ve yeniden uzatılmaz. Bütün ortak satırlar
+    # MAX_CHAIN'den çok tekrarlanıyorsa None döner ve bölge Myers'a kalır.
+    occurrences = {}
+    for i in range(alo, ahi):
+        positions = occurrences.get(a[i])
+        if positions is None:
+            occurrences[a[i]] = [i]
+        elif len(positions) <= MAX_CHAIN:
+            positions.append(i)
+    best = None
+    best_count = MAX_CHAIN
+    best_length = 0
+    covered = {}  # köşegen (i - j) → o köşegende son uzatılan bloğun b'deki sonu
+    for j in range(blo, bhi):
+        positions = occurrences.get(b[j])
+        if positions is None or len(positions) > best_count:
+            continue
+        for i in positions:
+            if covered.get(i - j, blo) > j:
+                continue
+            count = len(positions)
+            si, sj = i, j
+            while si > alo and sj > blo and a[si - 1] == b[sj - 1]:
+                si -= 1
+                sj -= 1
+                count = min(count, len(occurrences[a[si]]))
+            ei, ej = i + 1, j + 1
+            while ei < ahi and ej < bhi and a[ei] == b[ej]:
+                count = min(count, len(occurrences[a[ei]]))
+                ei += 1
+                ej += 1
+            covered[i - j] = ej
+            if count < best_count or (count == best_count and ei - si > best_length):
+                best, best_count, best_length = (si, sj, ei - si), count, ei - si
+    return best
+
+
+def _unique_anchors(a, alo, ahi, b, blo, bhi):
+    # İki tarafta da tam bir kez geçen satırlar; sıraları tutarlı olan en uzun alt dizisi
+    # (LIS) tek geçişte çok sayıda çapa verir, histogram yalnızca aralarda çalışır
+    a_index = {}
+    for i in range(alo, ahi):
+        a_index[a[i]] = -1 if a[i] in a_index else i
+    b_index = {}
+    for j in range(blo, bhi):
+        b_index[b[j]] = -1 if b[j] in b_index else j
+    pairs = []
+    for line, j in b_index.items():
+        i = a_index.get(line, -1)
+        if j < 0 or i < 0:
+            continue
+        # Komşusu da eşleşmeyen tek satır çoğu zaman rastlantıdır (ör. taşınmış bir satır);
+        # çapa yapılırsa çevresindeki uzun ortak bloğu bölebilir, bu yüzden histograma bırakılır
+        if (i > alo and j > blo and a[i - 1] == b[j - 1]) or (i + 1 < ahi and j + 1 < bhi and a[i + 1] == b[j + 1]):
+            pairs.append((j, i))
+    pairs.sort()
+    tails, tail_pos, previous = [], [], []
+    for p, (_, i) in enumerate(pairs):
+        k = bisect.bisect_left(tails, i)
+        previous.append(tail_pos[k - 1] if k else -1)
+        if k == len(tails):
+            tails.append(i)
+            tail_pos.append(p)
+        else:
+            tails[k] = i
+            tail_pos[k] = p
+    anchors = []
+    p = tail_pos[-1] if tail_pos else -1
+    while p >= 0:
+        j, i = pairs[p]
+        anchors.append((i, j))
+        p = previous[p]
+    anchors.reverse()
+    return anchors
+
+
+def _middle_snake(a, alo, ahi, b, blo, bhi, max_cost, max_work):
+    # Myers'ın ortadaki yılanı: ((x0, y0, x1, y1) bölge göreli, yapılan iş). max_cost adımda
+    # bulunamazsa ya da köşegen uzatmaları max_work karşılaştırmayı aşarsa yılan None.
+    # Tekrarlı satırlarda (ör. aynı birkaç satırın döngüsü) her köşegen uzun uzar; iş d²
+    # değil d × bölge boyu olabilir, bu yüzden adım sayısı değil karşılaştırma sayılır.
+    n, m = ahi - alo, bhi - blo
+    delta = n - m
+    odd = delta & 1
+    limit = min((n + m + 1) // 2, max_cost)
+    offset = limit + 1
+    forward = [0] * (2 * offset + 1)
+    backward = [0] * (2 * offset + 1)
+    work = 0
+    for d in range(limit + 1):
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and forward[offset + k - 1] < forward[offset + k + 1]):
+                x = forward[offset + k + 1]
+            else:
+                x = forward[offset + k - 1] + 1
+            y = x - k
+            x0, y0 = x, y
+            while x < n and y < m and a[alo + x] == b[blo + y]:
+                x += 1
+                y += 1
+            work += x - x0 + 1
+            forward[offset + k] = x
+            if odd and -(d - 1) <= delta - k <= d - 1 and x + backward[offset + delta - k] >= n:
+                return (x0, y0, x, y), work
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and backward[offset + k - 1] < backward[offset + k + 1]):
+                x = backward[offset + k + 1]
+            else:
+                x = backward[offset + k - 1] + 1
+            y = x - k
+            x0, y0 = x, y
+            while x < n and y < m and a[ahi - 1 - x] == b[bhi - 1 - y]:
+                x += 1
+                y += 1
+            work += x - x0 + 1
+            backward[offset + k] = x
+            if not odd and -d <= delta - k <= d and x + forward[offset + delta - k] >= n:
+                return (n - x, m - y, n - x0, m - y0), work
+        if work > max_work:
+            break
+    return None, work
+
+
+def matching_blocks(a, b):
+    # (a_i, b_i, uzunluk) eşleşmeleri, sıralı
+    matches = []
+    alo, ahi, blo, bhi = _strip(a, 0, len(a), b, 0, len(b), matches)
+    regions = []
+    anchors = _unique_anchors(a, alo, ahi, b, blo, bhi)
+    for i, j in anchors:
+        matches.append((i, j, 1))
+        regions.append((alo, i, blo, j, True))
+        alo, blo = i + 1, j + 1
+    regions.append((alo, ahi, blo, bhi, True))
+    # İş, Myers'ın köşegen uzatmaları dahil karşılaştırma sayısıyla ölçülür
+    passes = WORK_PASSES if anchors else ANCHORLESS_PASSES
+    budget = max(passes * (len(a) + len(b)), MIN_WORK)
+    while regions:
+        alo, ahi, blo, bhi, histogram = regions.pop()
+        alo, ahi, blo, bhi = _strip(a, alo, ahi, b, blo, bhi, matches)
+        if alo == ahi or blo == bhi:
+            continue
+        if budget < 0:
+            continue  # İş sınırı aşıldı: kalan bölgeler toptan değişmiş sayılır
+        if histogram:
+            budget -= (ahi - alo) + (bhi - blo)
+            found = _anchor(a, alo, ahi, b, blo, bhi)
+            if found is not None:
+                i, j, length = found
+                matches.append(found)
+                regions.append((alo, i, blo, j, True))
+                regions.append((i + length, ahi, j + length, bhi, True))
+                continue
+        snake, work = _middle_snake(a, alo, ahi, b, blo, bhi, MYERS_MAX_COST, budget)
+        budget -= work + (ahi - alo) + (bhi - blo)
+        if snake is None:
+            continue  # Çok farklı: bölgenin tamamı değişmiş
+        x0, y0, x1, y1 = snake
+        if x1 > x0:
+            matches.append((alo + x0, blo + y0, x1 - x0))
+        regions.append((alo, alo + x0, blo, blo + y0, False))
+        regions.append((alo + x1, ahi, blo + y1, bhi, False))
+    matches.sort()
+    return matches
+
+
+def diff_lines(a_lines, b_lines):
+    a, b = intern_lines(a_lines, b_lines)
+    hunks = []
+    i = j = 0
+    for mi, mj, length in matching_blocks(a, b) + [(len(a), len(b), 0)]:
+        if mi > i or mj > j:
+            hunks.append((i, mi, j, mj))
+        i, j = mi + length, mj + length
+    return hunks
+
+
+def diff_texts(a_text, b_text):
+    # Tk'nın satır modeliyle aynı bölme: son satır sonundan sonra boş bir satır vardır
+    return diff_lines(a_text.split("\n"), b_text.split("\n"))
+
+
+def _lines(value):
+    return value.split("\n") if isinstance(value, str) else value
+
+
+def diff_regions(pairs):
+    # İşçi süreç giriş noktası: [(a, b), ...] → her çift için hunk listesi; a ve b bütün
+    # bir metin ya da satır listesi (boş bölge için boş liste) olabilir
+    return [diff_lines(_lines(a), _lines(b)) for a, b in pairs]
+
+
+class DiffWorker:
+    # Fark hesabını ayrı bir süreçte çalıştırır (GIL arayüzü bekletmesin diye). Süreç
+    # başlatılamazsa ya da çökerse hesap bir iş parçacığında sürdürülür.
+    def __init__(self):
+        self._executor = None
+        self.threaded = False
+
+    def submit(self, pairs):
+        if self._executor is None:
+            self._executor = self._create()
+        try:
+            return self._executor.submit(diff_regions, pairs)
+        except (RuntimeError, OSError):  # BrokenProcessPool da bir RuntimeError'dır
+            self.fall_back()
+            return self._executor.submit(diff_regions, pairs)
+
+    def _create(self):
+        # Süreç havuzu modülleri yalnızca karşılaştırma ilk kez kullanılınca yüklenir
+        import concurrent.futures
+        import multiprocessing
+        if not self.threaded:
+            try:
+                # "spawn": Tk'lı bir süreci çatallamak (fork) güvenli değil
+                return concurrent.futures.ProcessPoolExecutor(1, multiprocessing.get_context("spawn"))
+            except (OSError, NotImplementedError, ValueError):
+                self.threaded = True
+        return concurrent.futures.ThreadPoolExecutor(1)
+
+    def fall_back(self):
+        # Süreç havuzu kullanılamıyor: iş parçacığına geç
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self.threaded = True
+        self._executor = self._create()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+class DiffMap:
+    # Hunk listesi üzerinden iki tarafı hizalayan satır ("row") düzeni: eşit bölgelerde her
+    # satır iki taraftan birer satır gösterir, bir hunk iki tarafın uzun olanı kadar satır
+    # kaplar ve kısa taraf boşlukla doldurulur. Düzenlemeler apply_edit ile anında işlenir;
+    # etkilenen bölge "kirli" bir hunk olur ve yalnızca o bölge yeniden karşılaştırılır.
+    def __init__(self, a_count, b_count, hunks=()):
+        self.counts = [a_count, b_count]
+        self.hunks = [[a0, a1, b0, b1, False] for a0, a1, b0, b1 in hunks]  # son alan: kirli mi
+        self._rows = None
+
+    def _index(self):
+        # Her hunk'ın başladığı satır ve ondan önceki toplam dolgu
+        if self._rows is None:
+            starts, extras = [], []
+            extra = 0
+            for a0, a1, b0, b1, _ in self.hunks:
+                starts.append(a0 + extra)
+                extras.append(extra)
+                extra += max(a1 - a0, b1 - b0) - (a1 - a0)
+            self._rows = (starts, extras, extra)
+        return self._rows
+
+    @property
+    def row_count(self):
+        return self.counts[0] + self._index()[2]
+
+    def hunk_row(self, i):
+        return self._index()[0][i]
+
+    def hunk_at_row(self, row):
+        # Satırdaki ya da satırdan önceki son hunk'ın indeksi (yoksa -1)
+        return bisect.bisect_right(self._index()[0], row) - 1
+
+    def rows(self, first, count):
+        # [(a satırı, b satırı, hunk indeksi)]; satırlar 0 tabanlı, dolgu için None,
+        # eşit satırlarda hunk indeksi None
+        starts, extras, _ = self._index()
+        result = []
+        row = max(0, first)
+        end = min(first + count, self.row_count)
+        i = bisect.bisect_right(starts, row) - 1
+        while row < end:
+            if i >= 0:
+                a0, a1, b0, b1, _ = self.hunks[i]
+                height = max(a1 - a0, b1 - b0)
+                offset = row - starts[i]
+                if offset < height:
+                    result.append((a0 + offset if offset < a1 - a0 else None,
+                                   b0 + offset if offset < b1 - b0 else None, i))
+                    row += 1
+                    continue
+                a = row - extras[i] - (height - (a1 - a0))
+                shift = b1 - a1
+            else:
+                a = row
+                shift = 0
+            stop = min(end, starts[i + 1] if i + 1 < len(starts) else end)
+            result.extend((a + r, a + r + shift, None) for r in range(stop - row))
+            row = stop
+            i += 1
+        return result
+
+    def line_row(self, side, line):
+        # Bir taraftaki 0 tabanlı satırın gösterildiği satır
+        starts, extras, _ = self._index()
+        lo, hi = 2 * side, 2 * side + 1
+        i = bisect.bisect_right([h[lo] for h in self.hunks], line) - 1
+        if i < 0:
+            return line
+        hunk = self.hunks[i]
+        if line < hunk[hi]:
+            return starts[i] + line - hunk[lo]
+        height = max(hunk[1] - hunk[0], hunk[3] - hunk[2])
+        return starts[i] + height + line - hunk[hi]
+
+    def apply_edit(self, side, first, last, delta):
+        # Editör dinleyicisinden gelen düzenleme (1 tabanlı, düzenleme öncesi first..last
+        # satırları, delta satır farkı). Etkilenen satırlar ve dokunduğu hunk'lar tek bir
+        # kirli hunk'ta birleşir; sonraki hunk'lar kaydırılır.
+        lo, hi = 2 * side, 2 * side + 1
+        other_lo, other_hi = 2 * (1 - side), 2 * (1 - side) + 1
+        e0, e1 = first - 1, last
+        hunks = self.hunks
+        i = 0
+        while i < len(hunks) and hunks[i][hi] < e0:
+            i += 1
+        j = i
+        while j < len(hunks) and hunks[j][lo] <= e1:
+            j += 1
+        before = hunks[i - 1] if i else None
+        shift_before = before[other_hi] - before[hi] if before else 0
+        if i < j:
+            start, other_start = min(e0, hunks[i][lo]), hunks[i][other_lo]
+            if e0 < hunks[i][lo]:
+                other_start -= hunks[i][lo] - e0
+            last_hunk = hunks[j - 1]
+            end, other_end = max(e1, last_hunk[hi]), last_hunk[other_hi]
+            if e1 > last_hunk[hi]:
+                other_end += e1 - last_hunk[hi]
+        else:
+            start, other_start = e0, e0 + shift_before
+            end, other_end = e1, e1 + shift_before
+        merged = [0] * 4 + [True]
+        merged[lo], merged[hi] = start, end + delta
+        merged[other_lo], merged[other_hi] = other_start, other_end
+        for hunk in hunks[j:]:
+            hunk[lo] += delta
+            hunk[hi] += delta
+        hunks[i:j] = [merged]
+        self.counts[side] += delta
+        self._rows = None
+
+    def dirty(self):
+        return [i for i, hunk in enumerate(self.hunks) if hunk[4]]
+
+    def resolve(self, i, sub_hunks):
+        # Kirli hunk i'nin yerine, bölge göreli yeniden karşılaştırma sonucunu koyar;
+        # büyükten küçüğe indekslerle çağrılmalı
+        a0, _, b0, _, _ = self.hunks[i]
+        self.hunks[i:i + 1] = [[a0 + s0, a0 + s1, b0 + t0, b0 + t1, False] for s0, s1, t0, t1 in sub_hunks]
+        self._rows = None
@@ -0,0 +1,242 @@
+# Belge modeli: Text widget içeriğinin Tk bağımsız parça tablosu (piece table) kopyası
+# Özgün metin tek bir arabellekte kalır; düzenlemeler küçük ek arabelleklere yazılır ve
+# belge, bu arabelleklerin dilimlerini gösteren parçaların sırasıdır. Her parça kendi
+# satır sonu sayısını bilir; arabelleklerin satır sonu konumları ilk ihtiyaçta çıkarılır.
+# Böylece ofset ve satıra göre okuma, belgenin tamamı kopyalanmadan yapılır.
+import bisect
+import itertools
+import re
+from array import array
+
+ADD_BUFFER_LIMIT = 4096   # Art arda yazımın tek ek arabellekte biriktirildiği en fazla uzunluk
+COMPACT_PIECES = 4096     # Parça sayısı bunu aşınca küçük komşu parçalar birleştirilir
+CHUNK_CHARS = 1024 * 1024  # iter_chunks ile verilen en büyük parça
+
+_NEWLINE = re.compile("\n")
+
+
+class _Buffer:
+    __slots__ = ("text", "appendable", "_newlines")
+
+    def __init__(self, text, appendable=False):
+        self.text = text
+        self.appendable = appendable  # Sonuna eklenerek yeni bir arabellek türetilebilir mi
+        self._newlines = None
+
+    @property
+    def newlines(self):
+        if self._newlines is None:
+            self._newlines = array("q", (m.start() for m in _NEWLINE.finditer(self.text)))
+        return self._newlines
+
+    def count_newlines(self, start, end):
+        if self._newlines is None:
+            return self.text.count("\n", start, end)
+        return bisect.bisect_left(self._newlines, end) - bisect.bisect_left(self._newlines, start)
+
+
+class Document:
+    def __init__(self, text=""):
+        self.reset(text)
+
+    def reset(self, text):
+        # Parçalar: (arabellek, başlangıç, bitiş, satır sonu sayısı)
+        self._pieces = [(_Buffer(text), 0, len(text), text.count("\n"))] if text else []
+        self._starts = None
+        self._compact_at = COMPACT_PIECES
+
+    def _index(self):
+        # Parça başlangıç ofsetleri ve öncesindeki satır sonu sayıları; düzenlemeden sonra
+        # ilk okumada yeniden hesaplanır
+        if self._starts is None:
+            pieces = self._pieces
+            self._starts = list(itertools.accumulate((p[2] - p[1] for p in pieces), initial=0))
+            self._newlines = list(itertools.accumulate((p[3] for p in pieces), initial=0))
+        return self._starts, self._newlines
+
+    def __len__(self):
+        return self._index()[0][-1]
+
+    @property
+    def line_count(self):
+        return self._index()[1][-1] + 1
+
+    def _split(self, offset):
+        # offset'te bir parça sınırı oluşturur; offset'te başlayan parçanın sırasını döner
+        starts, _ = self._index()
+        i = bisect.bisect_right(starts, offset) - 1
+        if i >= len(self._pieces):
+            return len(self._pieces)
+        inner = offset - starts[i]
+        if inner == 0:
+            return i
+        buf, start, end, newlines = self._pieces[i]
+        cut = start + inner
+        left = buf.count_newlines(start, cut)
+        self._pieces[i:i + 1] = [(buf, start, cut, left), (buf, cut, end, newlines - left)]
+        self._starts = None
+        return i + 1
+
+    def insert(self, offset, text):
+        if not text:
+            return
+        starts, _ = self._index()
+        offset = max(0, min(offset, starts[-1]))
+        newlines = text.count("\n")
+        i = bisect.bisect_right(starts, offset) - 1
+        if i > 0 and starts[i] == offset:
+            # Önceki parçanın hemen sonuna yazım: ek arabellek büyütülür, parça sayısı artmaz
+            buf, start, end, count = self._pieces[i - 1]
+            if buf.appendable and end == len(buf.text) and end + len(text) <= ADD_BUFFER_LIMIT:
+                self._pieces[i - 1] = (_Buffer(buf.text + text, True), start, end + len(text), count + newlines)
+                self._starts = None
+                return
+        k = self._split(offset)
+        self._pieces.insert(k, (_Buffer(text, len(text) < ADD_BUFFER_LIMIT), 0, len(text), newlines))
+        self._starts = None
+        if len(self._pieces) > self._compact_at:
+            self._compact()
+
+    def delete(self, start, end):
+        length = len(self)
+        start, end = max(0, start), min(end, length)
+        if start >= end:
+            return
+        a = self._split(start)
+        b = self._split(end)
+        del self._pieces[a:b]
+        self._starts = None
+
+    def replace(self, start, end, text):
+        self.delete(start, end)
+        self.insert(start, text)
+
+    def _compact(self):
+        # Küçük komşu parçaları tek arabellekte birleştir
+        pieces = []
+        run = []
+
+        def flush():
+            if len(run) > 1:
+                text = "".join(buf.text[start:end] for buf, start, end, _ in run)
+                pieces.append((_Buffer(text), 0, len(text), sum(p[3] for p in run)))
+            else:
+                pieces.extend(run)
+            run.clear()
+        for piece in self._pieces:
+            if piece[2] - piece[1] < ADD_BUFFER_LIMIT:
+                run.append(piece)
+            else:
+                flush()
+                pieces.append(piece)
+        flush()
+        self._pieces = pieces
+        self._starts = None
+        # Büyük parçalar arasına dağılmış düzenlemeler birleştirilemez; eşik büyütülür ki
+        # her eklemede yeniden denenmesin
+        self._compact_at = max(COMPACT_PIECES, 2 * len(pieces))
+
+    def get(self, start=0, end=None):
+        starts, _ = self._index()
+        end = starts[-1] if end is None else min(end, starts[-1])
+        start = max(0, start)
+        if start >= end:
+            return ""
+        i = bisect.bisect_right(starts, start) - 1
+        parts = []
+        while i < len(self._pieces) and starts[i] < end:
+            buf, piece_start, piece_end, _ = self._pieces[i]
+            lo = piece_start + max(0, start - starts[i])
+            hi = piece_start + min(piece_end - piece_start, end - starts[i])
+            if lo == 0 and hi == len(buf.text) and len(parts) == 0 and starts[i + 1] >= end:
+                return buf.text  # Tek bir arabelleğin tamamı: kopya yok
+            parts.append(buf.text[lo:hi])
+            i += 1
+        return "".join(parts)
+
+    def text(self):
+        return self.get()
+
+    def iter_chunks(self, start=0, end=None):
+        # Belgeyi en fazla CHUNK_CHARS uzunluğunda dilimler halinde verir
+        starts, _ = self._index()
+        end = starts[-1] if end is None else min(end, starts[-1])
+        pos = max(0, start)
+        while pos < end:
+            chunk_end = min(pos + CHUNK_CHARS, end)
+            yield self.get(pos, chunk_end)
+            pos = chunk_end
+
+    def line_start(self, line):
+        # 1 tabanlı satırın başladığı ofset (belge sonundan sonrası belge sonuna sabitlenir)
+        k = line - 1
+        if k <= 0:
+            return 0
+        starts, newlines = self._index()
+        if k > newlines[-1]:
+            return starts[-1]
+        p = bisect.bisect_left(newlines, k) - 1
+        buf, start, _, _ = self._pieces[p]
+        positions = buf.newlines
+        pos = positions[bisect.bisect_left(positions, start) + k - newlines[p] - 1]
+        return starts[p] + pos - start + 1
+
+    def line_end(self, line):
+        # Satırın sonu (satır sonu karakteri hariç)
+        if line >= self.line_count:
+            return len(self)
+        return self.line_start(line + 1) - 1
+
+    def offset(self, line, col):
+        # (satır, sütun) → ofset; sütun satır sonunu aşamaz
+        if line > self.line_count:
+            return len(self)
+        return min(self.line_start(line) + col, self.line_end(line))
+
+    def line_col(self, offset):
+        starts, newlines = self._index()
+        offset = max(0, min(offset, starts[-1]))
+        i = min(bisect.bisect_right(starts, offset) - 1, len(self._pieces) - 1)
+        if i < 0:
+            return 1, 0
+        buf, start, _, _ = self._pieces[i]
+        line = newlines[i] + buf.count_newlines(start, start + offset - starts[i]) + 1
+        return line, offset - self.line_start(line)
+
+    def get_lines(self, first, last):
+        # first..last satırlarının metni (son satır sonu hariç)
+        return self.get(self.line_start(first), self.line_end(last))
+
+    def stats(self):
+        # Karakter, kelime ve satır sayıları; belge parça parça taranır
+        words = 0
+        previous_word = False
+        for chunk in self.iter_chunks():
+            words += len(chunk.split())
+            if previous_word and not chunk[0].isspace():
+                words -= 1  # Parça sınırında bölünen kelime
+            previous_word = not chunk[-1].isspace()
+        return {"chars": len(self), "words": words, "lines": self.line_count}
+
+
+def _parse_index(index):
+    line, col = index.split(".")
+    return int(line), int(col)
+
+
+def apply_text_edit(document, command, index1, index2, chars):
+    # Tk Text'in insert/delete/replace komutunu belgeye uygular. İndeksler komut
+    # uygulanmadan önce çözülmüş "satır.sütun" değerleridir; Tk'nın kuralları izlenir:
+    # son satır sonu silinmez, "end"e kadar satır başından yapılan silme bir önceki
+    # satır sonunu da siler ve "end"e yapılan ekleme son satır sonundan önceye yapılır.
+    line1, col1 = _parse_index(index1)
+    start = document.offset(line1, col1)
+    if command in ("delete", "replace"):
+        line2, col2 = _parse_index(index2)
+        if (line1, col1) < (line2, col2):
+            end = document.offset(line2, col2)
+            if line2 > document.line_count and col1 == 0 and line1 > 1:
+                start -= 1
+            document.delete(start, end)
+    if command in ("insert", "replace"):
+        document.insert(start, chars)
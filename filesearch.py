@@ -0,0 +1,78 @@
+# Dosyalarda Bul işçi süreçlerinin çalıştırdığı tarama (Tk bağımsız)
+# İşçiler "spawn" ile başlar ve yalnızca bu modülü içe aktarır; bu yüzden burada
+# standart kitaplık dışında hiçbir şeye bağımlılık olmamalı.
+import mmap
+import os
+import re
+
+MAX_HITS_PER_FILE = 1000   # Bir dosyadan döndürülecek en fazla eşleşme
+MAX_LINE_CHARS = 300       # Sonuç panelinde gösterilecek satır uzunluğu
+BINARY_SNIFF_BYTES = 8192  # İkili dosya tespiti için okunan baş kısım
+
+_compiled = {}
+
+
+def search_files(paths, source, flags):
+    # İşçi süreçte çalışır: [(yol, [(satır, sütun, satır metni), ...]), ...]
+    # source bayt ise dosya mmap üzerinde çözülmeden, str ise çözülerek aranır
+    regex = _compiled.get((source, flags))
+    if regex is None:
+        regex = _compiled[(source, flags)] = re.compile(source, flags)
+    results = []
+    for path in paths:
+        try:
+            hits = search_file(path, regex)
+        except (OSError, ValueError):
+            continue
+        if hits:
+            results.append((path, hits))
+    return results
+
+
+def search_file(path, regex):
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if b"\0" in mm[:BINARY_SNIFF_BYTES]:
+                return []
+            if isinstance(regex.pattern, str):
+                return search_text(mm[:].decode("utf-8", errors="replace"), regex)
+            hits = []
+            line = 1
+            last = 0
+            for match in regex.finditer(mm):
+                start = match.start()
+                line += mm[last:start].count(b"\n")
+                last = start
+                line_start = mm.rfind(b"\n", 0, start) + 1
+                line_end = mm.find(b"\n", start)
+                if line_end < 0:
+                    line_end = size
+                col = len(mm[line_start:start].decode("utf-8", errors="replace"))
+                text = mm[line_start:min(line_end, line_start + MAX_LINE_CHARS * 4)]
+                hits.append((line, col, text.decode("utf-8", errors="replace")[:MAX_LINE_CHARS].rstrip("\r")))
+                if len(hits) >= MAX_HITS_PER_FILE:
+                    break
+            return hits
+
+
+def search_text(text, regex):
+    # Metin deseni (ASCII dışı harfler, regex sınıfları): dosya çözülüp editördeki gibi aranır
+    hits = []
+    line = 1
+    last = 0
+    for match in regex.finditer(text):
+        start = match.start()
+        line += text.count("\n", last, start)
+        last = start
+        line_start = text.rfind("\n", 0, start) + 1
+        line_end = text.find("\n", start)
+        if line_end < 0:
+            line_end = len(text)
+        text_line = text[line_start:min(line_end, line_start + MAX_LINE_CHARS)]
+        hits.append((line, start - line_start, text_line.rstrip("\r")))
+        if len(hits) >= MAX_HITS_PER_FILE:
+            break
+    return hits
@@ -0,0 +1,227 @@
+# Dosyalarda Bul: bir klasör ağacını süreç havuzunda tarayan arama (Tk bağımsız)
+# Dosyalar ana iş parçacığı dışında gezilir, gruplar halinde işçi süreçlere dağıtılır
+# ve sonuçlar bir kuyruğa akar; arayüz bu kuyruğu after() ile boşaltır. İşçilerin
+# çalıştırdığı tarama hafif filesearch modülündedir.
+import concurrent.futures
+import fnmatch
+import multiprocessing
+import os
+import queue
+import re
+import threading
+from concurrent.futures.process import BrokenProcessPool
+
+from filesearch import search_files
+
+FILES_PER_TASK = 64        # Bir işçi görevinde taranan dosya sayısı
+SKIP_DIRS = {".git", ".hg", ".svn", "__pycache__"}
+# Büyük/küçük harf duyarsız aramada ASCII dışı eşleri olan ASCII harfler (ı, İ, K işareti, ſ)
+_UNICODE_FOLDS = set("iksIKS")
+
+
+def worker_pattern(query):
+    # search.SearchQuery seçeneklerinden işçilere gönderilecek desen. Bayt deseni dosya
+    # çözülmeden mmap üzerinde çalışır, ama bayt düzeyinde IGNORECASE, \w, \b ve karakter
+    # sınıfları yalnızca ASCII'yi tanır. Bu yüzden yalnızca editördeki aramayla aynı sonucu
+    # veren düz ASCII metin bayt olarak gönderilir; diğer her şey çözülmüş metinde aranır.
+    flags = re.MULTILINE if query.case_sensitive else re.MULTILINE | re.IGNORECASE
+    literal = not query.is_regex and not query.whole_word and query.pattern.isascii()
+    if literal and (query.case_sensitive or not _UNICODE_FOLDS.intersection(query.pattern)):
+        return re.escape(query.pattern.encode("ascii")), flags
+    return query.regex.pattern, query.regex.flags
+
+
+def split_globs(text):
+    # "*.py; *.txt" → ["*.py", "*.txt"]
+    return [part.strip() for part in re.split(r"[;,]", text or "") if part.strip()]
+
+
+class IgnoreRules:
+    # .gitignore kurallarının sade bir uygulaması: son eşleşen kural kazanır, "!" kuralı geri alır
+    def __init__(self, rules=()):
+        self.rules = list(rules)
+
+    def child(self, directory):
+        path = os.path.join(directory, ".gitignore")
+        if not os.path.isfile(path):
+            return self
+        rules = list(self.rules)
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    line = line.rstrip("\n").rstrip()
+                    if not line or line.startswith("#"):
+                        continue
+                    negate = line.startswith("!")
+                    if negate:
+                        line = line[1:]
+                    dir_only = line.endswith("/")
+                    line = line.strip("/") if dir_only else line
+                    anchored = "/" in line
+                    rules.append((directory, line.lstrip("/"), negate, dir_only, anchored))
+        except OSError:
+            return self
+        return IgnoreRules(rules)
+
+    def ignored(self, path, is_dir):
+        result = False
+        name = os.path.basename(path)
+        for base, pattern, negate, dir_only, anchored in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if anchored:
+                rel = os.path.relpath(path, base).replace(os.sep, "/")
+                if rel.startswith("..") or not fnmatch.fnmatch(rel, pattern):
+                    continue
+            elif not fnmatch.fnmatch(name, pattern):
+                continue
+            result = not negate
+        return result
+
+
+def iter_files(root, include=(), exclude=(), use_gitignore=True, cancelled=lambda: False):
+    # root altındaki aranacak dosyalar; hariç tutulan ve yok sayılan klasörler hiç gezilmez
+    rules_by_dir = {}
+    for directory, dirnames, filenames in os.walk(root):
+        if cancelled():
+            return
+        parent_rules = rules_by_dir.pop(directory, IgnoreRules())
+        rules = parent_rules.child(directory) if use_gitignore else parent_rules
+        kept = []
+        for name in dirnames:
+            path = os.path.join(directory, name)
+            if name in SKIP_DIRS or any(fnmatch.fnmatch(name, pattern) for pattern in exclude):
+                continue
+            if rules.ignored(path, True):
+                continue
+            kept.append(name)
+            rules_by_dir[path] = rules
+        dirnames[:] = kept
+        for name in filenames:
+            if include and not any(fnmatch.fnmatch(name, pattern) for pattern in include):
+                continue
+            if any(fnmatch.fnmatch(name, pattern) for pattern in exclude):
+                continue
+            path = os.path.join(directory, name)
+            if rules.ignored(path, False):
+                continue
+            yield path
+
+
+class SearchPool:
+    # Aramalar arasında paylaşılan işçi süreçleri: ilk aramada başlatılır, çıkışta kapatılır.
+    # Havuz çökmüşse (ör. bir işçi öldürüldü) bir sonraki gönderimde yeniden kurulur.
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args):
+        with self._lock:
+            for attempt in range(2):
+                if self._executor is None:
+                    # Tk içeren ana süreci çatallamamak için işçiler "spawn" ile başlatılır
+                    context = multiprocessing.get_context("spawn")
+                    self._executor = concurrent.futures.ProcessPoolExecutor(self.workers, mp_context=context)
+                try:
+                    return self._executor.submit(fn, *args)
+                except BrokenProcessPool:
+                    self._executor.shutdown(wait=False)
+                    self._executor = None
+                    if attempt:
+                        raise
+
+    def close(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+class FindInFilesJob:
+    # Arka plan araması; sonuçlar results kuyruğuna (yol, eşleşmeler) olarak düşer
+    def __init__(self, root, query, pool, include=(), exclude=(), use_gitignore=True):
+        self.root = root
+        self.source, self.flags = worker_pattern(query)
+        self.pool = pool
+        self.include = list(include)
+        self.exclude = list(exclude)
+        self.use_gitignore = use_gitignore
+        self.results = queue.Queue()
+        self.files_scanned = 0
+        self.files_found = 0
+        self.done = False
+        self._cancelled = False
+        self._pending = 0
+        self._walk_done = False
+        self._lock = threading.Lock()
+        self._futures = set()  # Bu aramanın bitmemiş görevleri (iptal için)
+
+    def start(self):
+        threading.Thread(target=self._feed, daemon=True).start()
+
+    def _feed(self):
+        batch = []
+        try:
+            for path in iter_files(self.root, self.include, self.exclude, self.use_gitignore,
+                                   lambda: self._cancelled):
+                self.files_found += 1
+                batch.append(path)
+                if len(batch) >= FILES_PER_TASK:
+                    self._submit(batch)
+                    batch = []
+            if batch and not self._cancelled:
+                self._submit(batch)
+        except RuntimeError:
+            pass  # Havuz kapanmış (çıkış) ya da yeniden kurulamamış olabilir
+        with self._lock:
+            self._walk_done = True
+            self._check_done()
+
+    def _submit(self, batch):
+        with self._lock:
+            if self._cancelled:
+                return
+            self._pending += 1
+        try:
+            future = self.pool.submit(search_files, batch, self.source, self.flags)
+        except RuntimeError:
+            with self._lock:
+                self._pending -= 1
+            raise
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(lambda f, count=len(batch): self._collect(f, count))
+
+    def _collect(self, future, count):
+        # İptalden sonra biten görevlerin sonuçları kuyruğa konmaz
+        if not self._cancelled and not future.cancelled() and future.exception() is None:
+            for item in future.result():
+                self.results.put(item)
+        with self._lock:
+            self._futures.discard(future)
+            self._pending -= 1
+            self.files_scanned += count
+            self._check_done()
+
+    def _check_done(self):
+        if self._walk_done and self._pending == 0 and not self.done:
+            self.done = True
+
+    def cancel(self):
+        # Havuz paylaşıldığı için kapatılmaz; yalnızca bu aramanın bekleyen görevleri iptal edilir
+        with self._lock:
+            self._cancelled = True
+            futures = list(self._futures)
+        for future in futures:
+            future.cancel()
+
+    def drain(self, limit=500):
+        # Kuyruktaki en fazla limit sonucu döndürür (arayüz iş parçacığından çağrılır)
+        items = []
+        try:
+            while len(items) < limit:
+                items.append(self.results.get_nowait())
+        except queue.Empty:
+            pass
+        return items
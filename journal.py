@@ -0,0 +1,133 @@
+# Çökme kurtarma günlüğü (Tk bağımsız)
+# Her sekme, son kayıttan bu yana yaptığı satır düzeyindeki değişiklikleri kendi
+# günlük dosyasına ekler. Uygulama beklenmedik şekilde kapanırsa bir sonraki
+# açılışta günlükler temel metnin üzerine uygulanarak tamponlar geri kurulur.
+import itertools
+import json
+import os
+
+from saver import content_hash
+from textfile import TextFormat, read_text
+
+JOURNAL_DIR = os.path.join(os.path.expanduser("~"), ".notep", "recovery")
+JOURNAL_SUFFIX = ".journal"
+
+_counter = itertools.count(1)
+
+
+class JournalError(Exception):
+    pass
+
+
+class RecoveryJournal:
+    def __init__(self, directory=JOURNAL_DIR):
+        self.directory = directory
+        self.path = os.path.join(directory, f"{os.getpid()}-{next(_counter)}{JOURNAL_SUFFIX}")
+        self._header = None
+        self._pending = []
+        self._written = False  # Başlık dosyaya yazıldı mı
+
+    def reset(self, file_path, base_hash, base_text=None, encoding="utf-8"):
+        # Yeni bir temel: file_path'teki metin (özeti base_hash) ya da kaydedilmemiş
+        # sekmeler için doğrudan base_text
+        self.discard()
+        self._header = {"path": file_path, "encoding": encoding, "base_hash": base_hash, "base": base_text}
+
+    def record(self, first, last, text):
+        # first..last satırları (değişiklik öncesi) artık text içeriğindeki satırlardır
+        if self._header is None:
+            return
+        pending = self._pending
+        span = last - first
+        if (pending and pending[-1][0] == first and pending[-1][1] == last
+                and text.count("\n") == span and pending[-1][2].count("\n") == span):
+            # Aynı satırlarda satır sayısını değiştirmeyen art arda yazım: yalnızca son hali saklanır
+            pending[-1][2] = text
+        else:
+            pending.append([first, last, text])
+
+    def flush(self):
+        # Biriken değişiklikleri dosyaya ekler; süreç çökse bile işletim sistemi tamponunda kalır
+        if not self._pending or self._header is None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            if not self._written:
+                f.write(json.dumps(self._header) + "\n")
+                self._written = True
+            for record in self._pending:
+                f.write(json.dumps(record) + "\n")
+        self._pending = []
+
+    def discard(self):
+        self._pending = []
+        if self._written:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+            self._written = False
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+def find_journals(directory=JOURNAL_DIR):
+    # Artık çalışmayan süreçlerden kalmış günlükler
+    if not os.path.isdir(directory):
+        return []
+    found = []
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(JOURNAL_SUFFIX):
+            continue
+        try:
+            pid = int(name.split("-", 1)[0])
+        except ValueError:
+            continue
+        if pid == os.getpid() or _pid_alive(pid):
+            continue
+        found.append(os.path.join(directory, name))
+    return found
+
+
+def replay_journal(journal_path):
+    # (dosya yolu, temel metin, kurtarılan metin, dosya biçimi) döner; temel dosya değişmişse JournalError
+    with open(journal_path, "r", encoding="utf-8") as f:
+        lines = f.read().split("\n")
+    try:
+        header = json.loads(lines[0])
+    except ValueError:
+        raise JournalError("Günlük başlığı okunamadı")
+    base = header.get("base")
+    fmt = TextFormat()
+    if base is None:
+        file_path = header.get("path")
+        try:
+            # Temel metin, dosya açılırken editöre yüklenen metinle aynı kurallarla okunur
+            base, fmt = read_text(file_path)
+        except (OSError, TypeError, UnicodeDecodeError) as e:
+            raise JournalError(f"Temel dosya okunamadı: {e}")
+        if content_hash(base) != header.get("base_hash"):
+            raise JournalError(f"{file_path} günlük yazıldıktan sonra değişmiş")
+    buffer = base.split("\n")
+    for line in lines[1:]:
+        try:
+            first, last, text = json.loads(line)
+        except ValueError:
+            break  # Yarım kalmış son kayıt
+        buffer[first - 1:last] = text.split("\n")
+    return header.get("path"), base, "\n".join(buffer), fmt
+
+
+def discard_journal(journal_path):
+    try:
+        os.remove(journal_path)
+    except OSError:
+        pass
@@ -0,0 +1,131 @@
+# Büyük dosya modu için Tk bağımsız, mmap tabanlı satır erişimi
+# Dosya belleğe okunmaz; arka planda seyrek bir satır indeksi oluşturulur ve
+# istenen satır aralıkları doğrudan mmap üzerinden çözülür.
+import bisect
+import mmap
+import os
+import tempfile
+import threading
+
+LARGE_FILE_THRESHOLD = 64 * 1024 * 1024  # Bu boyutun üzerindeki dosyalar büyük dosya modunda açılır
+INDEX_BLOCK_SIZE = 256 * 1024             # İndeks noktaları arasındaki yaklaşık bayt sayısı
+COPY_BLOCK_SIZE = 4 * 1024 * 1024
+
+
+class LargeFile:
+    def __init__(self, path, encoding="utf-8", seed=None):
+        # seed: dosyanın değişmeyen baş kısmı için önceden bilinen (satırlar, ofsetler) indeks noktaları
+        self.path = path
+        self.encoding = encoding
+        self._file = open(path, "rb")
+        self.size = os.fstat(self._file.fileno()).st_size
+        self.mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+        # Seyrek indeks: checkpoint_lines[i]. satır (0 tabanlı) checkpoint_offsets[i] ofsetinde başlar
+        self.checkpoint_lines = list(seed[0]) if seed else [0]
+        self.checkpoint_offsets = list(seed[1]) if seed else [0]
+        self.indexed_bytes = 0
+        self.line_count = None  # İndeksleme bitince kesinleşir
+        self._cancel = False
+        self._thread = None
+        self.closed = False
+
+    def start_indexing(self):
+        self._thread = threading.Thread(target=self._build_index, daemon=True)
+        self._thread.start()
+
+    def _build_index(self):
+        mm = self.mm
+        line = self.checkpoint_lines[-1]
+        offset = self.checkpoint_offsets[-1]
+        while offset < self.size and not self._cancel:
+            end = min(offset + INDEX_BLOCK_SIZE, self.size)
+            if end < self.size:
+                # Blok sınırını bir sonraki satır başına hizala
+                newline = mm.find(b"\n", end)
+                end = self.size if newline < 0 else newline + 1
+            line += mm[offset:end].count(b"\n")
+            offset = end
+            if offset < self.size:
+                # Önce ofset, sonra satır eklenir; okuyan taraf kısa listeye göre davranır
+                self.checkpoint_offsets.append(offset)
+                self.checkpoint_lines.append(line)
+            self.indexed_bytes = offset
+        if not self._cancel:
+            ends_with_newline = self.size and mm[self.size - 1:self.size] == b"\n"
+            self.line_count = line if ends_with_newline else line + 1
+
+    @property
+    def indexing_done(self):
+        return self.line_count is not None
+
+    def known_lines(self):
+        # İndeksleme sürerken bilinen (veya tahmin edilen) toplam satır sayısı
+        if self.line_count is not None:
+            return self.line_count
+        indexed_lines = self.checkpoint_lines[len(self.checkpoint_lines) - 1]
+        if not self.indexed_bytes:
+            return max(indexed_lines, 1)
+        return max(int(indexed_lines * self.size / self.indexed_bytes), indexed_lines, 1)
+
+    def line_offset(self, line):
+        # 0 tabanlı satırın başladığı bayt ofseti; en yakın indeks noktasından ileri taranır
+        count = min(len(self.checkpoint_lines), len(self.checkpoint_offsets))
+        i = bisect.bisect_right(self.checkpoint_lines, line, 0, count) - 1
+        current, offset = self.checkpoint_lines[i], self.checkpoint_offsets[i]
+        find = self.mm.find
+        while current < line:
+            newline = find(b"\n", offset)
+            if newline < 0:
+                return self.size
+            offset = newline + 1
+            current += 1
+        return offset
+
+    def read_lines(self, first, count):
+        # first satırından başlayan en fazla count satırı döner.
+        # (metin, başlangıç ofseti, bitiş ofseti); bitiş son satırın "\n" karakterini içermez.
+        # Çözülemeyen baytlar surrogateescape ile korunur, kayıtta aynı baytlar geri yazılır.
+        start = self.line_offset(first)
+        end = start
+        find = self.mm.find
+        for _ in range(count):
+            newline = find(b"\n", end)
+            if newline < 0:
+                end = self.size
+                break
+            end = newline + 1
+        if end > start and self.mm[end - 1:end] == b"\n":
+            end -= 1
+        return self.mm[start:end].decode(self.encoding, errors="surrogateescape"), start, end
+
+    def write_spliced(self, start, end, data):
+        # [start, end) aralığı data ile değiştirilmiş dosyayı geçici dosya üzerinden yazar
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".notep-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                for block_start in range(0, start, COPY_BLOCK_SIZE):
+                    out.write(self.mm[block_start:min(block_start + COPY_BLOCK_SIZE, start)])
+                out.write(data)
+                for block_start in range(end, self.size, COPY_BLOCK_SIZE):
+                    out.write(self.mm[block_start:min(block_start + COPY_BLOCK_SIZE, self.size)])
+                out.flush()
+                os.fsync(out.fileno())
+            os.chmod(tmp_path, os.stat(self.path).st_mode & 0o7777)
+            self.close()
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self._cancel = True
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        if isinstance(self.mm, mmap.mmap):
+            self.mm.close()
+        self._file.close()
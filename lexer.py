@@ -0,0 +1,187 @@
+# Notep sözdizimi çözümleyicisi (lexer)
+# Tk'ya bağımlı değildir; tek başına test edilip ölçülebilir:
+#   python lexer.py dosya.py
+import bisect
+import os
+import re
+import sys
+import time
+
+# Çözümleyicinin üretebileceği belirteç türleri (her biri editörde bir Text etiketidir)
+TOKEN_TYPES = ("keyword", "string", "comment", "number", "class", "function",
+               "key", "constant", "section", "date", "error", "warning", "info")
+
+
+def line_starts(text):
+    # Her satırın metin içindeki başlangıç ofseti
+    starts = [0]
+    find = text.find
+    i = find("\n")
+    while i >= 0:
+        starts.append(i + 1)
+        i = find("\n", i + 1)
+    return starts
+
+
+class Grammar:
+    def __init__(self, name, rules, blocks=(), start_chars=None, flags=0):
+        # rules: (belirteç türü, regex) listesi; önce yazılan kural önceliklidir.
+        # blocks: birden fazla satıra yayılabilen (belirteç türü, açılış, kapanış) yapıları.
+        # start_chars: verilirse, bir belirtecin başlayabileceği karakter sınıfı.
+        # Satır sonu durumu, açık kalan bloğun açılış dizgisidir ("" ise yok).
+        self.name = name
+        self.blocks = {}
+        self._groups = []
+        parts = []
+        for token_type, opener, closer in blocks:
+            self.blocks[opener] = (token_type, closer)
+            parts.append(re.escape(opener) + r"[\s\S]*?(?:" + re.escape(closer) + r"|\Z)")
+            self._groups.append((token_type, opener))
+        for token_type, pattern in rules:
+            parts.append(pattern)
+            self._groups.append((token_type, None))
+        # Eşleşmeyen kelimeleri tek adımda atlamak, regex'in her karakterde
+        # bütün kuralları denemesini önler
+        parts.append(r"[^\W\d]\w*")
+        self._groups.append((None, None))
+        # Bütün kurallar tek seferde derlenen tek bir alternatif regex'e dönüşür
+        self.regex = None
+        if rules or blocks:
+            pattern = "|".join(f"({part})" for part in parts)
+            if start_chars:
+                # Belirteç başlatamayacak karakterlerde alternatiflerin hiçbiri denenmez
+                pattern = f"(?=[{start_chars}])(?:{pattern})"
+            self.regex = re.compile(pattern, flags | re.MULTILINE)
+
+    def tokenize(self, text, state="", first_line=1):
+        # text satır başından başlamalıdır; state önceki satırın sonundaki durumdur.
+        # (satır, başlangıç sütunu, bitiş sütunu, belirteç türü) listesi ve
+        # her satırın sonundaki durum listesi döner.
+        starts = line_starts(text)
+        end_states = [""] * len(starts)
+        runs = []
+        pos = 0
+        if state in self.blocks:
+            token_type, closer = self.blocks[state]
+            end = text.find(closer)
+            stop = len(text) if end < 0 else end + len(closer)
+            self._emit(runs, starts, len(text), 0, stop, token_type, first_line)
+            self._mark_block(end_states, starts, 0, stop, state, end < 0)
+            pos = stop
+        if self.regex is None:
+            return runs, end_states
+        groups = self._groups
+        for match in self.regex.finditer(text, pos):
+            token_type, opener = groups[match.lastindex - 1]
+            if token_type is None:
+                continue
+            start, end = match.span()
+            self._emit(runs, starts, len(text), start, end, token_type, first_line)
+            if opener is not None:
+                closer = self.blocks[opener][1]
+                value = match.group()
+                unterminated = len(value) < len(opener) + len(closer) or not value.endswith(closer)
+                self._mark_block(end_states, starts, start, end, opener, unterminated)
+        return runs, end_states
+
+    @staticmethod
+    def _emit(runs, starts, length, start, end, token_type, first_line):
+        # Ofset aralığını satır başına bir parça olacak şekilde böler
+        line = bisect.bisect_right(starts, start) - 1
+        while True:
+            line_start = starts[line]
+            line_end = starts[line + 1] - 1 if line + 1 < len(starts) else length
+            if end <= line_end:
+                if end > start:
+                    runs.append((first_line + line, start - line_start, end - line_start, token_type))
+                return
+            if line_end > start:
+                runs.append((first_line + line, start - line_start, line_end - line_start, token_type))
+            line += 1
+            start = starts[line]
+
+    @staticmethod
+    def _mark_block(end_states, starts, start, end, opener, unterminated):
+        first = bisect.bisect_right(starts, start) - 1
+        last = bisect.bisect_right(starts, end) - 1
+        if unterminated:
+            last += 1
+        for line in range(first, min(last, len(end_states))):
+            end_states[line] = opener
+
+
+# Dosya uzantısına göre dilbilgisi kaydı
+_grammars = {}
+_extensions = {}
+
+
+def register_grammar(grammar, extensions=()):
+    _grammars[grammar.name] = grammar
+    for ext in extensions:
+        _extensions[ext.lower()] = grammar
+
+
+def get_grammar(name):
+    return _grammars[name]
+
+
+def grammar_for_path(path):
+    # Kaydedilmemiş yeni dosyalar Python kurallarıyla, bilinmeyen uzantılar düz metin olarak açılır
+    if not path:
+        return _grammars["python"]
+    ext = os.path.splitext(path)[1].lower()
+    return _extensions.get(ext, _grammars["text"])
+
+
+DQ_STRING = r'"(?:\\.|[^"\\\n])*"'
+SQ_STRING = r"'(?:\\.|[^'\\\n])*'"
+NUMBER = r"\b\d+(?:\.\d+)?\b"
+
+register_grammar(Grammar("text", []), (".txt",))
+
+register_grammar(Grammar("python", [
+    ("comment", r"#.*"),
+    ("string", DQ_STRING + "|" + SQ_STRING),
+    ("class", r"\bclass\b"),
+    ("function", r"\bdef\b"),
+    ("keyword", r"\b(?:if|else|elif|while|for|in|import|from|as|return|try|except|finally|with|pass|break|continue|lambda|global|nonlocal|assert|yield)\b"),
+    ("number", NUMBER),
+], blocks=[("string", '"""', '"""'), ("string", "'''", "'''")], start_chars=r"#\"'\w"),
+    (".py", ".pyw", ".pyi"))
+
+register_grammar(Grammar("json", [
+    ("key", DQ_STRING + r"(?=\s*:)"),
+    ("string", DQ_STRING),
+    ("constant", r"\b(?:true|false|null)\b"),
+    ("number", r"-?\b\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\b"),
+], start_chars=r"\"\w-"), (".json", ".geojson"))
+
+register_grammar(Grammar("log", [
+    ("date", r"\b\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?"),
+    ("error", r"\b(?:ERROR|FATAL|CRITICAL|SEVERE|Traceback)\b"),
+    ("warning", r"\bWARN(?:ING)?\b"),
+    ("info", r"\b(?:INFO|DEBUG|TRACE|NOTICE)\b"),
+    ("string", DQ_STRING),
+    ("number", NUMBER),
+], start_chars=r"\"\w"), (".log", ".out"))
+
+register_grammar(Grammar("ini", [
+    ("comment", r"^[ \t]*[#;].*"),
+    ("section", r"^[ \t]*\[[^\]\n]*\]"),
+    ("key", r"^[ \t]*[\w.\-]+(?=[ \t]*[=:])"),
+    ("string", DQ_STRING + "|" + SQ_STRING),
+    ("constant", r"\b(?:true|false|yes|no|on|off)\b"),
+    ("number", NUMBER),
+]), (".ini", ".cfg", ".conf", ".toml", ".properties"))
+
+
+if __name__ == "__main__":
+    # Basit ölçüm: verilen dosyayı tek geçişte çözümler
+    for file_path in sys.argv[1:]:
+        with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+            content = f.read()
+        grammar = grammar_for_path(file_path)
+        started = time.perf_counter()
+        runs, states = grammar.tokenize(content)
+        elapsed = time.perf_counter() - started
+        print(f"{file_path}: {grammar.name}, {len(states)} satır, {len(runs)} belirteç, {elapsed * 1000:.1f} ms")
@@ -0,0 +1,269 @@
+# Makro motoru
+# Kayıt, tuş vuruşları yerine anlamsal işlemleri tutar: imlece göre konumlu ekleme/silme,
+# imleç hareketleri, bul/değiştir ve satır işlemleri. Oynatma sırasında işlemler bir kez
+# derlenir ve bütün tekrarlar tek bir toplu düzenleme (tek geri alma adımı) olarak çalışır.
+import contextlib
+import json
+import re
+
+from search import SearchEngine, SearchQuery
+
+MACRO_VERSION = 1
+FIND_CHUNK_CHARS = 64 * 1024  # Makrodaki bul işlemleri belgeyi bu boyutta parçalarla okur
+
+# Kaydedilen imleç hareketleri: tuş adı → Tk indeks ifadesi
+MOTIONS = {
+    "Left": "insert-1c",
+    "Right": "insert+1c",
+    "Up": "insert-1l",
+    "Down": "insert+1l",
+    "Home": "insert linestart",
+    "End": "insert lineend",
+    "Control-Left": "insert-1c wordstart",
+    "Control-Right": "insert wordend",
+    "Control-Home": "1.0",
+    "Control-End": "end-1c",
+}
+
+
+class MacroError(Exception):
+    pass
+
+
+class Macro:
+    def __init__(self, ops=None):
+        # ops: JSON'a yazılabilen listeler, ör. ["insert", 0, "abc"], ["move", "Down"]
+        self.ops = list(ops or [])
+
+    def __len__(self):
+        return len(self.ops)
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"version": MACRO_VERSION, "ops": self.ops}, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            try:
+                data = json.load(f)
+            except ValueError as e:
+                raise MacroError(f"Makro dosyası okunamadı: {e}")
+        if not isinstance(data, dict) or data.get("version") != MACRO_VERSION:
+            raise MacroError("Desteklenmeyen makro dosyası")
+        return cls(data.get("ops", []))
+
+
+def _offset(text, index):
+    # index'in imlece göre karakter uzaklığı (öncesindeyse negatif)
+    result = text.count("insert", index, "chars")
+    if isinstance(result, tuple):
+        result = result[0]
+    return result or 0
+
+
+class MacroRecorder:
+    def __init__(self):
+        self.macro = Macro()
+        self._paused = 0
+
+    def record(self, *op):
+        if not self._paused:
+            self.macro.ops.append(list(op))
+
+    @contextlib.contextmanager
+    def operation(self, *op):
+        # Tek bir işlem olarak kaydedilir; içinde yapılan ham düzenlemeler ayrıca kaydedilmez
+        self.record(*op)
+        self._paused += 1
+        try:
+            yield
+        finally:
+            self._paused -= 1
+
+    def capture(self, text, args):
+        # Düzenleme proxy'sinden, komut uygulanmadan önce gelen ham insert/delete/replace
+        if self._paused or not args:
+            return
+        command = args[0]
+        if command == "insert" and len(args) >= 3:
+            self.record("insert", _offset(text, text.index(args[1])), "".join(args[2::2]))
+            return
+        if command not in ("delete", "replace") or len(args) < 2:
+            return
+        start = text.index(args[1])
+        end = text.index(args[2]) if len(args) > 2 else text.index(f"{start}+1c")
+        if text.compare(end, ">", "end-1c"):
+            end = text.index("end-1c")
+        if text.compare(start, "<", end):
+            self.record("delete", _offset(text, start), _offset(text, end))
+        if command == "replace" and len(args) > 3:
+            self.record("insert", _offset(text, start), "".join(args[3::2]))
+
+
+def _query(op):
+    pattern, regex, case_sensitive, whole_word = op[1:5]
+    try:
+        return SearchQuery(pattern, regex, case_sensitive, whole_word)
+    except re.error as e:
+        raise MacroError(f"Geçersiz regex: {e}")
+
+
+def _matches(regex, chunk, pos=0):
+    for match in regex.finditer(chunk, pos):
+        if match.start() != match.end():
+            yield match
+
+
+def _index(document, offset):
+    return "{}.{}".format(*document.line_col(offset))
+
+
+def find_forward(document, query, index):
+    # index'ten ("satır.sütun") sonraki ilk eşleşme (başlangıç, bitiş) ya da None;
+    # belge modeli parça parça okunur
+    line, col = map(int, index.split("."))
+    base = document.line_start(line)
+    size = FIND_CHUNK_CHARS
+    while True:
+        chunk = document.get(base, base + size)
+        at_end = base + size >= len(document)
+        match = next(_matches(query.regex, chunk, col), None)
+        if match is None and at_end:
+            return None
+        if match is not None and (at_end or match.end() < len(chunk)):
+            return _index(document, base + match.start()), _index(document, base + match.end())
+        size *= 2
+
+
+def find_backward(document, query, index):
+    # index'ten önce biten son eşleşme
+    line, col = map(int, index.split("."))
+    end = document.offset(line, col)
+    size = FIND_CHUNK_CHARS
+    while True:
+        base = document.line_start(document.line_col(max(0, end - size))[0])
+        chunk = document.get(base, end)
+        last = None
+        for last in _matches(query.regex, chunk):
+            pass
+        if last is None and base == 0:
+            return None
+        if last is not None and (base == 0 or last.start() > 0):
+            return _index(document, base + last.start()), _index(document, base + last.end())
+        size *= 2
+
+
+def select_match(text, span, forward=True):
+    start, end = span
+    text.tag_remove("sel", "1.0", "end")
+    text.tag_add("sel", start, end)
+    text.mark_set("insert", end if forward else start)
+
+
+def replace_selection(text, document, query, replacement):
+    # Seçim tam olarak bir eşleşmeyse değiştirir (Değiştir düğmesinin davranışı)
+    if not text.tag_ranges("sel"):
+        return False
+    start, end = (tuple(map(int, text.index(index).split("."))) for index in ("sel.first", "sel.last"))
+    match = query.match_span(document, start, end)
+    if match is None:
+        return False
+    new_text = query.expand(match, replacement)
+    text.replace("sel.first", "sel.last", new_text)
+    text.mark_set("insert", f"{start[0]}.{start[1]}+{len(new_text)}c")
+    return True
+
+
+def replace_all(text, document, query, replacement):
+    # Sondan başa yerinde değiştirir; değiştirilen eşleşme sayısı
+    spans = SearchEngine(query).replacements(document.text(), replacement)
+    for (start_line, start_col), (end_line, end_col), new_text in reversed(spans):
+        text.replace(f"{start_line}.{start_col}", f"{end_line}.{end_col}", new_text)
+    return len(spans)
+
+
+def compile_ops(editor, ops):
+    # Her işlem, indeks ifadeleri ve desenleri önceden hazırlanmış bir fonksiyona çevrilir;
+    # fonksiyon başarısız olursa (ör. eşleşme bulunamadı) False döner
+    text = editor.text
+    document = editor.document
+    steps = []
+    for op in ops:
+        kind = op[0]
+        if kind == "insert":
+            index = f"insert{op[1]:+d}c" if op[1] else "insert"
+            steps.append(lambda index=index, chars=op[2]: text.insert(index, chars) or True)
+        elif kind == "delete":
+            start, end = f"insert{op[1]:+d}c", f"insert{op[2]:+d}c"
+            steps.append(lambda start=start, end=end: text.delete(start, end) or True)
+        elif kind == "move":
+            if op[1] not in MOTIONS:
+                raise MacroError(f"Bilinmeyen imleç hareketi: {op[1]}")
+
+            def move(index=MOTIONS[op[1]]):
+                text.tag_remove("sel", "1.0", "end")
+                text.mark_set("insert", index)
+                return True
+            steps.append(move)
+        elif kind == "find":
+            query, backwards = _query(op), op[5]
+
+            def find(query=query, backwards=backwards):
+                anchor = text.index("sel.first" if backwards and text.tag_ranges("sel") else "insert")
+                if backwards:
+                    span = find_backward(document, query, anchor)
+                else:
+                    span = find_forward(document, query, anchor)
+                if span is None:
+                    return False
+                select_match(text, span, not backwards)
+                return True
+            steps.append(find)
+        elif kind == "replace":
+            query, replacement = _query(op), op[5]
+
+            def replace(query=query, replacement=replacement):
+                replace_selection(text, document, query, replacement)
+                span = find_forward(document, query, text.index("insert"))
+                if span is None:
+                    return False
+                select_match(text, span)
+                return True
+            steps.append(replace)
+        elif kind == "replace_all":
+            steps.append(lambda query=_query(op), replacement=op[5]: replace_all(text, document, query, replacement) > 0)
+        elif kind == "line":
+            steps.append(lambda name=op[1]: editor.line_operation(name) or True)
+        else:
+            raise MacroError(f"Bilinmeyen makro işlemi: {kind}")
+    return steps
+
+
+def play_macro(editor, macro, times=1, until_eof=False):
+    # Makroyu times kez (until_eof ise imleç ilerlemeyi bırakana ya da dosya sonuna
+    # gelene kadar) çalıştırır. Renklendirme ve satır numaraları sonda bir kez güncellenir.
+    # Tamamlanan çalıştırma sayısını döner.
+    steps = compile_ops(editor, macro.ops)
+    if not steps:
+        return 0
+    text = editor.text
+    runs = 0
+    editor.begin_bulk_edit()
+    text.config(autoseparators=False)
+    text.edit_separator()
+    try:
+        while until_eof or runs < times:
+            before = text.index("insert")
+            if not all(step() for step in steps):
+                break
+            runs += 1
+            if until_eof:
+                after = text.index("insert")
+                if after == before or text.compare(after, ">=", "end-1c"):
+                    break
+    finally:
+        text.edit_separator()
+        text.config(autoseparators=True)
+        editor.end_bulk_edit()
+    return runs
@@ -1,39 +1,188 @@
+import time
+_STARTED = time.perf_counter()  # --profile-startup evreleri bu ana göre ölçülür
+
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
 import re
 import os
-import sv_ttk  # Sun Valley temasını uygulamak için
-import datetime
-import threading
-import time
+import sys
+import bisect
+import contextlib
+import tkinter.font as tkfont
+import heapq
+import queue
+
+from lexer import TOKEN_TYPES, grammar_for_path
+from largefile import LARGE_FILE_THRESHOLD, LargeFile
+from search import SearchEngine, SearchQuery
+from saver import BackgroundSaver, SaveRequest, content_hash
+from journal import JournalError, RecoveryJournal, discard_journal, find_journals, replay_journal
+from session import SessionTab, load_session, save_session
+from startup import StartupProfile, profile_target
+from macro import MOTIONS, Macro, MacroError, MacroRecorder, play_macro
+from document import Document, apply_text_edit
+from watcher import FileWatcher, TailReader, file_signature
+from textfile import SAMPLE_BYTES, FileLoader, TextFormat, detect_format, read_text
+from perfmon import KEYSTROKE, MONITOR, install as install_perfmon
+from diff import DiffMap, DiffWorker, diff_regions
+from brackets import SKIP_TOKENS, TAB_WIDTH, BracketIndex, line_brackets, line_infos
+from words import DocumentWords, WordIndex
+
+# Olay gecikmesi ölçümü için Tk geri çağrıları ölçülebilir sarmalayıcıyla kaydedilir;
+# ölçüm kapalıyken (varsayılan) etkisi bir bayrak kontrolüdür
+install_perfmon()
+
+# sv_ttk (tema), findinfiles, süreç havuzu modülleri (concurrent.futures, multiprocessing)
+# ve datetime ilk kullanımda içe aktarılır
+STARTUP = StartupProfile(_STARTED)
+STARTUP.record("imports", _STARTED)
+
+# Sözdizimi renklendirme ayarları
+HIGHLIGHT_DEBOUNCE_MS = 40   # Hızlı yazımda son tuştan sonra beklenecek süre
+HIGHLIGHT_CHUNK_LINES = 400  # Arka planda tek seferde renklendirilecek satır sayısı
+HIGHLIGHT_BUDGET_MS = 12     # Tek bir arka plan diliminin süre sınırı
+
+# Büyük dosya modu: Text içinde tutulan satır penceresi
+WINDOW_LINES = 3000   # Pencerede tutulan satır sayısı
+WINDOW_MARGIN = 1000  # Görünen alan pencere kenarına bu kadar yaklaşınca pencere kaydırılır
+
+# Girinti kılavuzlarının aralığı (sütun)
+INDENT_GUIDE_WIDTH = 4
+
+# Satır numarası alanı
+GUTTER_FONT = ("Consolas", 10)
+GUTTER_PADDING = 8  # Numaraların sağında/solunda bırakılan toplam boşluk (piksel)
+
+# Arama: tarama dilimi süresi ve görünen alanın çevresinde işaretlenecek eşleşmeler
+SEARCH_SLICE_MS = 15
+MATCH_TAG_MARGIN = 200   # Görünen alanın üstünde/altında işaretlenen satır sayısı
+MATCH_TAG_LIMIT = 5000   # Aynı anda işaretlenebilecek en fazla eşleşme
+
+# Arka planda açma: çözülen metin Text'e zaman dilimleriyle ve parça parça eklenir
+LOAD_SLICE_MS = 12         # Tek bir ekleme diliminin süre sınırı
+LOAD_INSERT_CHARS = 128 * 1024
+LOAD_POLL_MS = 5           # Kuyruk boşken yeniden bakma aralığı
+
+SAVE_POLL_MS = 100       # Kayıt sonuçlarının kontrol aralığı
+JOURNAL_FLUSH_MS = 2000  # Kurtarma günlüğünün diske yazılma aralığı
+
+# Diskteki değişiklikler: izleyiciden toplu alma aralığı ve takip modunda tek seferde okunan en fazla bayt
+WATCH_POLL_MS = 250
+FOLLOW_READ_BYTES = 2 * 1024 * 1024
+
+# Oturum: uzun süre kullanılmayan sekmeler isteğe bağlı olarak yer tutucuya döndürülür
+HIBERNATE_AFTER_S = 30 * 60
+HIBERNATE_CHECK_MS = 60 * 1000
+
+# Performans ölçümü: --perf ile açık başlar; durum çubuğu ve panel bu aralıkla yenilenir
+PERF_FLAG = "--perf"
+PERF_REFRESH_MS = 1000
+
+# Karşılaştırma: düzenlemeden sonra yeniden karşılaştırma gecikmesi; bundan küçük bölgeler
+# işçi sürece gönderilmeden hemen hesaplanır
+COMPARE_REDIFF_MS = 300
+COMPARE_POLL_MS = 30
+COMPARE_INLINE_LINES = 2000
+COMPARE_CONTEXT_ROWS = 3  # Farka gidilince üstünde bırakılan satır
+
+# Kelime tamamlama
+WORD_INDEX_DELAY_MS = 300  # Düzenlemeden sonra kelime dizini güncellenmeden önce beklenen süre
+COMPLETION_LIMIT = 10      # Listede gösterilen en fazla öneri
+COMPLETION_PREFIX_RE = re.compile(r"[^\W\d]\w*$")
+
+
+# Text widget komutunu saran Tcl proc'u: düzenlemeden önceki ilk/son satırı, satır
+# sayısındaki değişimi ve komutun çözülmüş indeksleriyle eklenen metni Python tarafına
+# bildirir. Hatalar Tcl içinde kalır. Makro kaydı sırasında ham komut, uygulanmadan
+# önce kaydediciye de iletilir. Devre dışı widget'a yapılan düzenlemeler yok sayılır.
+EDIT_PROXY_TCL = """
+rename {widget} {orig}
+proc {widget} {{args}} {{
+    set command [lindex $args 0]
+    switch -- $command {{
+        insert - delete - replace {{
+            if {{[{orig} cget -state] eq "disabled"}} {{
+                return [uplevel 1 [list {orig} {{*}}$args]]
+            }}
+            if {{[info exists ::notep_macro({widget})]}} {{
+                {recorder} {{*}}$args
+            }}
+            set lines_before [lindex [split [{orig} index end-1c] .] 0]
+            set index1 [{orig} index [lindex $args 1]]
+            set index2 $index1
+            set chars ""
+            if {{$command eq "insert"}} {{
+                foreach {{piece tags}} [lrange $args 2 end] {{ append chars $piece }}
+            }} else {{
+                if {{[llength $args] > 2}} {{
+                    set index2 [{orig} index [lindex $args 2]]
+                }} else {{
+                    set index2 [{orig} index "$index1 +1c"]
+                }}
+                if {{$command eq "replace"}} {{
+                    foreach {{piece tags}} [lrange $args 3 end] {{ append chars $piece }}
+                }} elseif {{[llength $args] > 3}} {{
+                    set command resync
+                }}
+            }}
+            set first [lindex [split $index1 .] 0]
+            set last [lindex [split $index2 .] 0]
+            set result [uplevel 1 [list {orig} {{*}}$args]]
+            set lines_after [lindex [split [{orig} index end-1c] .] 0]
+            {callback} $first $last [expr {{$lines_after - $lines_before}}] $command $index1 $index2 $chars
+            return $result
+        }}
+    }}
+    return [uplevel 1 [list {orig} {{*}}$args]]
+}}
+"""
 
-# Makro kaydı için global liste
-macro_recording = False
-macro_actions = []
 
 class EditorTab:
-    def __init__(self, master, notebook, file_path=None):
+    def __init__(self, master, notebook, file_path=None, word_index=None):
         self.master = master
         self.file_path = file_path
+        self.grammar = grammar_for_path(file_path)
+        # Dosyanın algılanan kodlaması, BOM'u ve satır sonu biçimi; kayıtta aynen geri yazılır
+        self.text_format = TextFormat()
+        # Arka planda açılırken dosyayı okuyan FileLoader ve açılış bitince çalışacaklar
+        self.loader = None
+        self._load_job = None
+        self._load_callbacks = None
+        self._on_loaded = []
         self.frame = ttk.Frame(notebook)
+        self.frame.editor = self  # get_current_editor sekme çerçevesinden editöre ulaşır
         self.text = tk.Text(self.frame, wrap="none", undo=True)
         self.text.pack(side="right", fill="both", expand=True)
-        self.text.bind("<<Modified>>", self.on_modified)
-        self.text.bind("<Key>", self.record_macro)
+        self.text.bind("<Key>", self.on_key)
+        # Satır işlemleri (Text sınıfının Ctrl+D gibi bağlarının önüne geçmek için widget üzerinde)
+        self.macro_recorder = None
+        for sequence, name in (("<Control-d>", "duplicate"), ("<Control-l>", "delete"),
+                               ("<Control-Shift-Up>", "up"), ("<Control-Shift-Down>", "down")):
+            self.text.bind(sequence, lambda e, name=name: self.line_operation(name) or "break")
+        self.text.bind("<Control-b>", self.on_jump_key)
         self.text.bind("<Button-1>", self.hide_context_menu)
+        self.text.bind("<ButtonRelease-1>", self.schedule_bracket_update)
         # Scrollbarlar
         self.v_scroll = ttk.Scrollbar(self.frame, orient="vertical", command=self.text.yview)
         self.v_scroll.pack(side="right", fill="y")
         self.h_scroll = ttk.Scrollbar(self.frame, orient="horizontal", command=self.text.xview)
         self.h_scroll.pack(side="bottom", fill="x")
-        self.text.config(yscrollcommand=self.v_scroll.set, xscrollcommand=self.h_scroll.set)
+        self.text.config(yscrollcommand=self._on_yscroll, xscrollcommand=self.h_scroll.set)
+        # Dikey kaydırmayı izleyen dinleyiciler: listener()
+        self.scroll_listeners = []
 
-        # Satır numarası alanı
-        self.linenumbers = tk.Canvas(self.frame, width=40, background="#2b2b2b")
+        # Satır numarası alanı: yeniden kullanılan canvas öğeleri; yalnızca görünen
+        # ilk satır, satır sayısı veya yükseklik değişince güncellenir
+        self.linenumbers = tk.Canvas(self.frame, width=40, background="#2b2b2b", highlightthickness=0)
         self.linenumbers.pack(side="left", fill="y")
-        self.text.bind("<KeyRelease>", self.update_linenumbers)
-        self.text.bind("<MouseWheel>", self.update_linenumbers)
-        self.text.bind("<ButtonRelease-1>", self.update_linenumbers)
+        self._gutter_items = []
+        self._gutter_key = None
+        self._gutter_job = None
+        self._gutter_digits = 0
+        self._gutter_digit_width = tkfont.Font(font=GUTTER_FONT).measure("0")
+        self.line_offset = 0  # Büyük dosya modunda pencerenin ilk satırının mantıksal satır numarası - 1
+        self.large_view = None
         self.text.bind("<Configure>", self.update_linenumbers)
 
         # İlk satır numarası güncellemesi
@@ -43,96 +192,986 @@ class EditorTab:
         self.text.bind("<KeyRelease>", self.on_key_release)
         self.setup_tags()
 
-        # Değişiklik kontrolü
+        # Artımlı renklendirme durumu: her satırın sonundaki durum (None = henüz işlenmedi)
+        # ve yeniden renklendirilmesi gereken satır aralıkları
+        self._line_states = [None]
+        self._dirty_ranges = []
+        self._highlight_job = None
+        self._bulk_edits = None
+        # Ayraç ve girinti dizini: satır tablosuyla aynı düzenlemeleri alır, renklendirici
+        # satırları işledikçe (açılışta arka planda) dolar
+        self.brackets = BracketIndex()
+        self._bracket_job = None
+        self.indent_guides = False
+        # Sekmenin ortak kelime dizinine katkısı; düzenlenen bloklar boşta yeniden sayılır
+        self.words = DocumentWords(word_index if word_index is not None else WordIndex())
+        self._words_job = None
+        self.completion = None  # Bu editörde açık tamamlama listesi
+        # Düzenleme bildirimlerini alan dinleyiciler: listener(first, last, delta)
+        self.edit_listeners = []
+        # Metnin Tk dışındaki kopyası; arama, kayıt, istatistik ve renklendirme buradan okur
+        self.document = Document()
+        self._install_edit_proxy()
+        self.scroll_listeners.append(self.update_linenumbers)
+        self.scroll_listeners.append(lambda: self.indent_guides and self.schedule_bracket_update())
+        self.edit_listeners.append(self._on_lines_changed)
+
+        # Değişiklik takibi: son açılış/kayıttan beri düzenlendi mi, düzenleme sayacı ve
+        # kaydedilen içeriğin özeti. Düzenlemeler ayrıca kurtarma günlüğüne yazılır.
         self._modified = False
+        self._loading = False
+        self.edit_generation = 0
+        self.saved_hash = None
+        self.journal = RecoveryJournal()
+        self.edit_listeners.append(self._on_content_changed)
+        self.mark_clean("")
+        self.last_active = time.monotonic()  # Uyutma kararı için son seçilme zamanı
+        # Dosyanın son okunduğu/yazıldığı andaki imzası; farklıysa dosya dışarıda değişmiştir
+        self.disk_signature = None
+        self.follow = None  # Takip modunda dosyanın yeni eklenen baytlarını okuyan TailReader
+
+    def _on_yscroll(self, first, last):
+        # Fare, klavye ve kaydırma çubuğu dahil her dikey kaydırma buradan geçer
+        if self.large_view:
+            self.large_view.on_text_scroll(first, last)
+        else:
+            self.v_scroll.set(first, last)
+        for listener in self.scroll_listeners:
+            listener()
+
+    def _install_edit_proxy(self):
+        # Text widget komutunu bir Tcl proc ile sarmalayıp insert/delete/replace
+        # çağrılarında hangi satırların değiştiğini bildiriyoruz (geri al/yinele dahil).
+        widget = self.text._w
+        callback = self.text.register(self._on_text_edit)
+        recorder = self.text.register(self._on_text_command)
+        self.text.tk.eval(EDIT_PROXY_TCL.format(widget=widget, orig=widget + "_orig", callback=callback,
+                                                recorder=recorder))
 
     def setup_tags(self):
-        # Basit Python sözdizimi renklendirme için etiketler
+        # Çözümleyicinin ürettiği her belirteç türü için bir etiket
         self.text.tag_configure("keyword", foreground="#cc7832")
         self.text.tag_configure("string", foreground="#6a8759")
         self.text.tag_configure("comment", foreground="#808080")
         self.text.tag_configure("number", foreground="#6897bb")
         self.text.tag_configure("class", foreground="#66d9ef")
         self.text.tag_configure("function", foreground="#a6e22e")
+        self.text.tag_configure("key", foreground="#9876aa")
+        self.text.tag_configure("constant", foreground="#cc7832")
+        self.text.tag_configure("section", foreground="#ffc66d")
+        self.text.tag_configure("date", foreground="#6897bb")
+        self.text.tag_configure("error", foreground="#ff6b68")
+        self.text.tag_configure("warning", foreground="#e5c07b")
+        self.text.tag_configure("info", foreground="#56b6c2")
+        # Eşleşen ayraçlar ve girinti kılavuzları seçimin altında kalır
+        self.text.tag_configure("bracket_match", background="#3b514d")
+        self.text.tag_configure("bracket_error", background="#8b3a3a")
+        self.text.tag_configure("indent_guide", background="#3c3f41")
+        for tag in ("bracket_match", "bracket_error", "indent_guide"):
+            self.text.tag_lower(tag, "sel")
+
+    def set_file_path(self, file_path):
+        # Dosya adı (ve uzantısı) değişince uygun dilbilgisiyle yeniden renklendir
+        self.file_path = file_path
+        grammar = grammar_for_path(file_path)
+        if grammar is not self.grammar:
+            self.grammar = grammar
+            self.highlight_syntax()
 
     def on_key_release(self, event=None):
-        self.highlight_syntax()
+        # Değişiklikler zaten düzenleme proxy'si üzerinden işaretleniyor
+        if self._dirty_ranges and self._highlight_job is None:
+            self.schedule_highlight()
+        self.schedule_bracket_update()
+        if self.completion is not None:
+            self.completion.schedule_refresh()
+
+    def on_key(self, event):
+        # Tamamlama listesi açıkken gezinme ve seçme tuşları listeye gider; yazmaya devam edilir
+        if self.completion is not None and self.completion.handle_key(event.keysym):
+            return "break"
+        self.record_macro(event)
+
+    def schedule_word_index(self):
+        # Hızlı yazımda her tuşta değil, kısa bir süre sonra tek seferde sayılır
+        if self._words_job is None:
+            self._words_job = self.text.after(WORD_INDEX_DELAY_MS, self._index_words)
+
+    def _index_words(self):
+        # Kirli kelime bloklarını renklendirmeyle aynı süre sınırındaki dilimlerle say
+        self._words_job = None
+        if self.words.refresh(self.document.get_lines, time.perf_counter() + HIGHLIGHT_BUDGET_MS / 1000):
+            self._words_job = self.text.after_idle(self._index_words)
 
     def highlight_syntax(self):
-        # Örnek Python sözdizimi renklendirmesi (tam kapsamlı değildir)
-        content = self.text.get("1.0", tk.END)
-        self.text.tag_remove("keyword", "1.0", tk.END)
-        self.text.tag_remove("string", "1.0", tk.END)
-        self.text.tag_remove("comment", "1.0", tk.END)
-        self.text.tag_remove("number", "1.0", tk.END)
-        self.text.tag_remove("class", "1.0", tk.END)
-        self.text.tag_remove("function", "1.0", tk.END)
-        # Anahtar kelimeler
-        keywords = r"\b(?:def|class|if|else|elif|while|for|in|import|from|as|return|try|except|finally|with|pass|break|continue|lambda|global|nonlocal|assert|yield)\b"
-        for match in re.finditer(keywords, content):
-            start = "1.0+{}c".format(match.start())
-            end = "1.0+{}c".format(match.end())
-            if match.group() == "class":
-                self.text.tag_add("class", start, end)
-            elif match.group() == "def":
-                self.text.tag_add("function", start, end)
+        # Tüm belgeyi yeniden renklendirmek üzere işaretle; önce görünen alan boyanır
+        self._mark_dirty(1, len(self._line_states))
+        self.schedule_highlight(0)
+
+    def schedule_highlight(self, delay=HIGHLIGHT_DEBOUNCE_MS):
+        # Art arda gelen tuşları tek bir renklendirme işine indirger
+        if self._highlight_job is not None:
+            self.text.after_cancel(self._highlight_job)
+        self._highlight_job = self.text.after(delay, self._highlight_viewport)
+
+    def _on_text_edit(self, first, last, delta, command, index1, index2, chars):
+        # first..last: değişiklikten önce etkilenen satırlar, delta: satır sayısındaki değişim
+        first, last, delta = int(first), int(last), int(delta)
+        if command == "resync":
+            # Birden çok aralıklı delete: belge Tk'dan yeniden alınır
+            self.document.reset(self.text.get("1.0", "end-1c"))
+        else:
+            apply_text_edit(self.document, command, index1, index2, chars)
+        if last + delta < first:
+            # "end"e kadar silmede Tk bir önceki satır sonunu da siler
+            first = max(1, last + delta)
+        if self._bulk_edits is not None:
+            last = min(last, self._bulk_line_count)
+            self._bulk_edits.append((min(first, last), last, delta))
+            self._bulk_line_count += delta
+            return
+        last = min(last, len(self._line_states))
+        first = min(first, last)
+        self._shift_line_states(first, last, delta)
+        self.schedule_highlight()
+        for listener in self.edit_listeners:
+            listener(first, last, delta)
+
+    def begin_bulk_edit(self):
+        # Toplu düzenleme (ör. Tümünü Değiştir): bildirimler biriktirilir ve
+        # end_bulk_edit çağrılınca tek seferde işlenir
+        self._bulk_edits = []
+        self._bulk_line_count = len(self._line_states)
+
+    def end_bulk_edit(self):
+        edits, self._bulk_edits = self._bulk_edits, None
+        if not edits:
+            return
+        # Dinleyiciler için bütün düzenlemeleri kapsayan tek aralık (düzenleme öncesi koordinatlarda)
+        lo = hi = None
+        total = 0
+        for first, last, delta in edits:
+            new_last = last + delta
+            if lo is None:
+                lo, hi = first, new_last
             else:
-                self.text.tag_add("keyword", start, end)
-        # Stringler (tek veya çift tırnak)
-        for match in re.finditer(r"(['\"])(?:(?=(\\?))\2.)*?\1", content):
-            start = "1.0+{}c".format(match.start())
-            end = "1.0+{}c".format(match.end())
-            self.text.tag_add("string", start, end)
-        # Yorumlar (# ile başlayanlar)
-        for match in re.finditer(r"#.*", content):
-            start = "1.0+{}c".format(match.start())
-            end = "1.0+{}c".format(match.end())
-            self.text.tag_add("comment", start, end)
-        # Numaralar
-        for match in re.finditer(r"\b\d+(\.\d+)?\b", content):
-            start = "1.0+{}c".format(match.start())
-            end = "1.0+{}c".format(match.end())
-            self.text.tag_add("number", start, end)
+                lo = min(lo, first)
+                hi = max(hi + delta if hi > last else hi, new_last)
+            total += delta
+        # Alttan üste doğru yapılan düzenlemeler (Tümünü Değiştir) yalnızca değişen satırları işaretler
+        merged = []
+        for first, last, delta in edits:
+            if merged and last > merged[-1][0]:
+                merged = None
+                break
+            if merged and last == merged[-1][0]:
+                previous = merged.pop()
+                first, last, delta = first, previous[1], delta + previous[2]
+            merged.append((first, last, delta))
+        if merged is not None:
+            self._shift_line_states_many(merged[::-1])
+        else:
+            self._shift_line_states(lo, hi - total, total)
+        self.schedule_highlight()
+        for listener in self.edit_listeners:
+            listener(lo, hi - total, total)
+
+    def _shift_line_states(self, first, last, delta):
+        # Yeni aralık hiçbir zaman ters olmamalı: ters bir kirli aralık _clear_dirty ile
+        # silinemez ve görünen alanı renklendiren döngü bitmez
+        new_last = max(last + delta, first)
+        self._line_states[first - 1:last] = [None] * (new_last - first + 1)
+        self.brackets.replace(first, last, new_last - first + 1)
+        self.words.replace(first, last, new_last - first + 1)
+        self.schedule_word_index()
+        ranges = []
+        for lo, hi in self._dirty_ranges:
+            if hi < first:
+                ranges.append((lo, hi))
+            elif lo > last:
+                ranges.append((lo + delta, hi + delta))
+            else:
+                if lo < first:
+                    ranges.append((lo, first - 1))
+                if hi > last:
+                    ranges.append((last + 1 + delta, hi + delta))
+        self._dirty_ranges = ranges
+        self._mark_dirty(first, new_last)
+
+    def _shift_line_states_many(self, edits):
+        # edits: düzenleme öncesi koordinatlarda artan sırada, çakışmayan (first, last, delta) üçlüleri.
+        # Satır tablosu tek geçişte yeniden kurulur.
+        states = self._line_states
+        pieces = []
+        new_ranges = []
+        firsts, new_firsts, new_lasts, shifts = [], [], [], [0]
+        pos = 0
+        for first, last, delta in edits:
+            new_first = first + shifts[-1]
+            new_last = last + delta + shifts[-1]
+            pieces.append(states[pos:first - 1])
+            pieces.append([None] * (new_last - new_first + 1))
+            new_ranges.append((new_first, new_last))
+            firsts.append(first)
+            new_firsts.append(new_first)
+            new_lasts.append(new_last)
+            shifts.append(shifts[-1] + delta)
+            pos = last
+        pieces.append(states[pos:])
+        self._line_states = [state for piece in pieces for state in piece]
+        self.brackets.replace_many(edits)
+        self.words.replace_many(edits)
+        self.schedule_word_index()
+
+        def move(line, edge):
+            k = bisect.bisect_right(firsts, line) - 1
+            if k >= 0 and line <= edits[k][1]:
+                return edge[k]
+            return line + shifts[k + 1]
+
+        old_ranges = [(move(lo, new_firsts), move(hi, new_lasts)) for lo, hi in self._dirty_ranges]
+        ranges = []
+        for lo, hi in heapq.merge(old_ranges, new_ranges):
+            if ranges and lo <= ranges[-1][1] + 1:
+                ranges[-1] = (ranges[-1][0], max(hi, ranges[-1][1]))
+            else:
+                ranges.append((lo, hi))
+        self._dirty_ranges = ranges
+
+    def _mark_dirty(self, first, last):
+        # Kirli aralıklar sıralı ve ayrık tutulur; birleştirme ikili aramayla yapılır
+        ranges = self._dirty_ranges
+        i = bisect.bisect_left(ranges, first - 1, key=lambda r: r[1])
+        j = bisect.bisect_right(ranges, last + 1, key=lambda r: r[0])
+        if i < j:
+            first, last = min(first, ranges[i][0]), max(last, ranges[j - 1][1])
+        ranges[i:j] = [(first, last)]
+
+    def _clear_dirty(self, first, last):
+        ranges = self._dirty_ranges
+        i = bisect.bisect_left(ranges, first, key=lambda r: r[1])
+        j = bisect.bisect_right(ranges, last, key=lambda r: r[0])
+        if i >= j:
+            return
+        rest = []
+        if ranges[i][0] < first:
+            rest.append((ranges[i][0], first - 1))
+        if ranges[j - 1][1] > last:
+            rest.append((last + 1, ranges[j - 1][1]))
+        ranges[i:j] = rest
+
+    def _first_dirty_in(self, first, last):
+        # first..last içindeki ilk kirli aralık (kırpılmış) ya da None
+        ranges = self._dirty_ranges
+        i = bisect.bisect_left(ranges, first, key=lambda r: r[1])
+        if i < len(ranges) and ranges[i][0] <= last:
+            return max(ranges[i][0], first), min(ranges[i][1], last)
+        return None
 
-    def update_linenumbers(self, event=None):
-        self.linenumbers.delete("all")
-        i = self.text.index("@0,0")
+    def _visible_lines(self):
+        first = int(self.text.index("@0,0").split(".")[0])
+        last = int(self.text.index(f"@0,{self.text.winfo_height()}").split(".")[0])
+        return first, last
+
+    def _highlight_viewport(self):
+        self._highlight_job = None
+        line_count = int(self.text.index("end-1c").split(".")[0])
+        if line_count != len(self._line_states):
+            # Emniyet: satır tablosu widget ile uyuşmuyorsa baştan başla
+            self._line_states = [None] * line_count
+            self._dirty_ranges = [(1, line_count)]
+            self.brackets.reset(line_count)
+            self.words.reset(line_count)
+            self.schedule_word_index()
+        first, last = self._visible_lines()
         while True:
-            dline = self.text.dlineinfo(i)
-            if dline is None:
+            visible = self._first_dirty_in(first, last)
+            if visible is None:
                 break
-            y = dline[1]
-            linenum = str(i).split(".")[0]
-            self.linenumbers.create_text(2, y, anchor="nw", text=linenum, fill="white", font=("Consolas", 10))
-            i = self.text.index(f"{i}+1line")
-
-    def on_modified(self, event=None):
-        # Dosyada değişiklik olduğunda notebook sekme başlığını güncellemek için kullanılabilir.
-        self._modified = self.text.edit_modified()
-        self.text.edit_modified(False)
-        self.update_linenumbers()
+            self._highlight_lines(*visible)
+        if self._dirty_ranges:
+            self._highlight_job = self.text.after_idle(self._highlight_background)
+        self.schedule_bracket_update()
+
+    def _highlight_background(self):
+        # Görünmeyen satırları küçük zaman dilimleriyle renklendir
+        self._highlight_job = None
+        deadline = time.perf_counter() + HIGHLIGHT_BUDGET_MS / 1000
+        first, last = self._visible_lines()
+        while self._dirty_ranges and time.perf_counter() < deadline:
+            lo, hi = self._first_dirty_in(first, last) or self._dirty_ranges[0]
+            self._highlight_lines(lo, min(hi, lo + HIGHLIGHT_CHUNK_LINES - 1))
+        if self._dirty_ranges:
+            self._highlight_job = self.text.after_idle(self._highlight_background)
+        else:
+            self.schedule_bracket_update()  # Ayraç dizini artık tam
+
+    def _highlight_lines(self, first, last):
+        content = self.document.get_lines(first, last)
+        state = (self._line_states[first - 2] if first > 1 else "") or ""
+        previous_end_state = self._line_states[last - 1]
+        runs, end_states = self.grammar.tokenize(content, state, first)
+        self.brackets.update(first, line_infos(content, runs, first))
+        ranges = {tag: [] for tag in TOKEN_TYPES}
+        for lineno, start, end, token_type in runs:
+            ranges[token_type].append(f"{lineno}.{start}")
+            ranges[token_type].append(f"{lineno}.{end}")
+        self._line_states[first - 1:last] = end_states
+        # Her etiket için tek bir tag_add çağrısı
+        for tag in TOKEN_TYPES:
+            self.text.tag_remove(tag, f"{first}.0", f"{last}.end")
+            if ranges[tag]:
+                self.text.tag_add(tag, *ranges[tag])
+        self._clear_dirty(first, last)
+        # Satır sonu durumu değiştiyse (ör. açık kalan üçlü tırnak) sonraki satır da etkilenir
+        if end_states[-1] != previous_end_state and last < len(self._line_states):
+            self._mark_dirty(last + 1, last + 1)
+
+    def _line_brackets(self, line):
+        # Satırdaki dize ve yorum dışı ayraçlar; satır renklendiricinin durumuyla yeniden çözümlenir
+        content = self.document.get_lines(line, line)
+        state = (self._line_states[line - 2] if line > 1 else "") or ""
+        runs, _ = self.grammar.tokenize(content, state, line)
+        return line_brackets(content, [(start, end) for _, start, end, token_type in runs
+                                       if token_type in SKIP_TOKENS])
+
+    def bracket_at_cursor(self):
+        # İmlecin solundaki (yoksa sağındaki) ayraç: (sütun, imlecin solunda mı, eşi ya da None);
+        # imleçte ayraç yoksa ya da dizin henüz hazır değilse None
+        if not self.brackets.ready:
+            return None
+        line, col = map(int, self.text.index("insert").split("."))
+        columns = {column for column, _ in self._line_brackets(line)}
+        for column in (col - 1, col):
+            if column in columns:
+                return column, column < col, self.brackets.match(line, column, self._line_brackets)
+        return None
+
+    def schedule_bracket_update(self, event=None):
+        # İmleç, düzenleme ve kaydırma sonrası tek bir güncellemeye indirgenir
+        if self._bracket_job is None:
+            self._bracket_job = self.text.after_idle(self._update_brackets)
+
+    def _update_brackets(self):
+        self._bracket_job = None
+        self.text.tag_remove("bracket_match", "1.0", tk.END)
+        self.text.tag_remove("bracket_error", "1.0", tk.END)
+        found = self.bracket_at_cursor()
+        if found is not None:
+            column, _, match = found
+            line = self.text.index("insert").split(".")[0]
+            if match is None:
+                self.text.tag_add("bracket_error", f"{line}.{column}")
+            else:
+                match_line, match_column, paired = match
+                self.text.tag_add("bracket_match" if paired else "bracket_error",
+                                  f"{line}.{column}", f"{match_line}.{match_column}")
+        if self.indent_guides:
+            self._draw_indent_guides()
+
+    def jump_to_bracket(self):
+        # İmleci eşleşen ayraca taşır; imleç ayracın hangi yanındaysa eşinin de o yanına gelir
+        found = self.bracket_at_cursor()
+        if found is None or found[2] is None:
+            return False
+        _, left, (line, column, _) = found
+        self.text.mark_set("insert", f"{line}.{column + 1 if left else column}")
+        self.text.see("insert")
+        self.schedule_bracket_update()
+        return True
+
+    def on_jump_key(self, event=None):
+        # Ctrl+B: eş yoksa da Text'in varsayılan bağı (imleci geri alma) çalışmasın
+        self.jump_to_bracket()
+        return "break"
+
+    def set_indent_guides(self, enabled):
+        if enabled == self.indent_guides:
+            return
+        self.indent_guides = enabled
+        if enabled:
+            self.schedule_bracket_update()
+        else:
+            self.text.tag_remove("indent_guide", "1.0", tk.END)
+
+    def _draw_indent_guides(self):
+        # Yalnızca görünen satırlar: her girinti düzeyinin ilk sütunundaki boşluk işaretlenir.
+        # Girinti dizinden gelir; yalnızca boşluktan oluşan satırlar kendi boşluklarıyla çizilir.
+        self.text.tag_remove("indent_guide", "1.0", tk.END)
+        first, last = self._visible_lines()
+        last = min(last, self.brackets.line_count)
+        ranges = []
+        for line, content in enumerate(self.document.get_lines(first, last).split("\n"), first):
+            indent = self.brackets.indent(line)
+            if indent is None:
+                indent = len(content.expandtabs(TAB_WIDTH))
+            column = 0
+            for i, char in enumerate(content):
+                if column >= indent or char not in " \t":
+                    break
+                if column % INDENT_GUIDE_WIDTH == 0:
+                    ranges.append(f"{line}.{i}")
+                    ranges.append(f"{line}.{i + 1}")
+                column = (column // TAB_WIDTH + 1) * TAB_WIDTH if char == "\t" else column + 1
+        if ranges:
+            self.text.tag_add("indent_guide", *ranges)
+
+    def update_linenumbers(self, event=None):
+        # Kaydırma, düzenleme ve yeniden boyutlandırma çağrıları kare başına tek çizime indirgenir
+        if self._gutter_job is None:
+            self._gutter_job = self.text.after_idle(self._redraw_linenumbers)
+
+    def _on_lines_changed(self, first, last, delta):
+        if delta:
+            self.update_linenumbers()
+
+    def _redraw_linenumbers(self):
+        self._gutter_job = None
+        text = self.text
+        top = text.index("@0,0")
+        first_info = text.dlineinfo(top)
+        line_count = int(text.index("end-1c").split(".")[0]) + self.line_offset
+        if self.large_view:
+            line_count = max(line_count, self.large_view.file.known_lines())
+        height = text.winfo_height()
+        key = (top, first_info and first_info[1], line_count, height, self.line_offset)
+        if key == self._gutter_key and text.cget("wrap") == "none":
+            return
+        self._gutter_key = key
+
+        # Basamak sayısı değişince (ör. 999 → 1000 satır) genişliği ayarla
+        digits = len(str(line_count))
+        if digits != self._gutter_digits:
+            self._gutter_digits = digits
+            self.linenumbers.config(width=digits * self._gutter_digit_width + GUTTER_PADDING)
+        x = digits * self._gutter_digit_width + GUTTER_PADDING // 2
+
+        canvas = self.linenumbers
+        items = self._gutter_items
+        used = 0
+        index = top
+        info = first_info
+        while info is not None:
+            linenum = str(int(index.split(".")[0]) + self.line_offset)
+            if used < len(items):
+                item = items[used]
+                canvas.coords(item, x, info[1])
+                canvas.itemconfigure(item, text=linenum, state="normal")
+            else:
+                items.append(canvas.create_text(x, info[1], anchor="ne", text=linenum, fill="white", font=GUTTER_FONT))
+            used += 1
+            next_index = text.index(f"{index}+1line")
+            if next_index == index or info[1] + info[3] >= height:
+                break
+            index = next_index
+            info = text.dlineinfo(index)
+        for item in items[used:]:
+            canvas.itemconfigure(item, state="hidden")
+
+    def close(self):
+        # Bekleyen işleri iptal edip widget'ları yok et
+        self.cancel_load()
+        if self.completion is not None:
+            self.completion.close()
+        for job in (self._highlight_job, self._gutter_job, self._bracket_job, self._words_job):
+            if job is not None:
+                self.text.after_cancel(job)
+        self._highlight_job = self._gutter_job = self._bracket_job = self._words_job = None
+        # Kapatılan ya da uyutulan sekmenin kelimeleri öneri olarak çıkmasın
+        self.words.discard()
+        if self.large_view:
+            self.large_view.close()
+        if self.journal is not None:
+            self.journal.discard()
+            self.journal = None
+        self.frame.destroy()
+
+    def session_entry(self):
+        # Oturum dosyası için imleç ve görünen ilk satır (dosyanın tamamına göre)
+        line, col = map(int, self.text.index("insert").split("."))
+        top = int(self.text.index("@0,0").split(".")[0])
+        return SessionTab(self.file_path, line + self.line_offset, col, top + self.line_offset)
+
+    def load_text(self, content):
+        # Dosya içeriğini değişiklik sayılmadan yükle
+        self._loading = True
+        self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", content)
+        self.text.edit_reset()
+        self._loading = False
+        self.mark_clean(content)
+        self.highlight_syntax()
+
+    def start_loading(self, loader, on_progress, on_done):
+        # Dosya arka planda çözülür, metin kuyruktan zaman dilimleriyle eklenir; açılış
+        # sürerken sekme salt okunurdur ve düzenleme/geri alma geçmişi tutulmaz.
+        # on_progress(oran), on_done(hata ya da None)
+        self.loader = loader
+        self._load_callbacks = (on_progress, on_done)
+        self._load_chunk = ""
+        self._load_pos = 0
+        self._load_bytes = 0
+        self._loading = True
+        self.text.config(state="disabled", undo=False)
+        self._load_job = self.text.after(0, self._poll_load)
+
+    def _poll_load(self):
+        self._load_job = None
+        loader = self.loader
+        on_progress, on_done = self._load_callbacks
+        deadline = time.perf_counter() + LOAD_SLICE_MS / 1000
+        waiting = False
+        while time.perf_counter() < deadline:
+            if self._load_pos < len(self._load_chunk):
+                end = self._load_pos + LOAD_INSERT_CHARS
+                self._insert_loaded(self._load_chunk[self._load_pos:end])
+                self._load_pos = end
+                continue
+            try:
+                message = loader.messages.get_nowait()
+            except queue.Empty:
+                waiting = True
+                break
+            kind = message[0]
+            if kind == "chunk":
+                self._load_chunk, self._load_pos, self._load_bytes = message[1], 0, message[2]
+            elif kind in ("format", "reset"):
+                if kind == "reset":
+                    # Tahmin edilen kodlama/satır sonu tutmadı: dosya baştan yeniden geliyor
+                    self.text.config(state="normal")
+                    self.text.delete("1.0", tk.END)
+                    self.text.config(state="disabled")
+                    self._load_bytes = 0
+                self.text_format = message[1]
+            else:
+                self._finish_load(message[1] if kind == "error" else None)
+                return
+        on_progress(self._load_bytes / max(loader.size, 1))
+        self._load_job = self.text.after(LOAD_POLL_MS if waiting else 1, self._poll_load)
+
+    def _insert_loaded(self, chunk):
+        self.text.config(state="normal")
+        self.text.insert("end-1c", chunk)
+        self.text.config(state="disabled")
+
+    def _finish_load(self, error):
+        on_done = self._load_callbacks[1]
+        self.loader = None
+        self._load_callbacks = None
+        self._load_chunk = ""
+        self._loading = False
+        self.text.config(state="normal", undo=True)
+        self.text.edit_reset()
+        callbacks, self._on_loaded = self._on_loaded, []
+        if error is None:
+            self.mark_clean(self.document.text())
+            self.highlight_syntax()
+        on_done(error)
+        if error is None:
+            for callback in callbacks:
+                callback()
+
+    def cancel_load(self):
+        if self.loader is None:
+            return
+        self.loader.cancel()
+        self.loader = None
+        self._load_callbacks = None
+        self._on_loaded = []
+        if self._load_job is not None:
+            self.text.after_cancel(self._load_job)
+            self._load_job = None
+
+    def when_loaded(self, callback):
+        # Açılış sürüyorsa callback açılış bitince, değilse hemen çalışır
+        if self.loader is None:
+            callback()
+        else:
+            self._on_loaded.append(callback)
+
+    def append_text(self, chunk):
+        # Takip modunda dosyaya eklenen metin sona yazılır; değişiklik ve geri alma adımı sayılmaz.
+        # Görünüm zaten sondaysa sonla birlikte kayar.
+        at_end = self.text.yview()[1] >= 1.0
+        self._loading = True
+        self.text.config(state="normal", undo=False)
+        self.text.insert("end-1c", chunk)
+        self.text.config(state="disabled", undo=True)
+        self._loading = False
+        if at_end:
+            self.text.see("end")
+
+    def mark_clean(self, content):
+        # content diskteki (yeni sekmede boş) içerik; günlüğün temeli olur
+        self.saved_hash = content_hash(content)
+        self._modified = False
+        if self.journal is not None:
+            self.journal.reset(self.file_path, self.saved_hash, None if self.file_path else content,
+                               self.text_format.encoding)
+
+    def mark_saved(self, file_path, digest, lines, generation):
+        # Arka plan kaydı bitti; anlık görüntüden sonra düzenleme yapılmadıysa sekme temizdir
+        self.saved_hash = digest
+        if generation == self.edit_generation:
+            self._modified = False
+        if self.journal is None:
+            return
+        self.journal.reset(file_path, digest, None, self.text_format.encoding)
+        if self._modified:
+            # Kayıt sürerken yapılan düzenlemeler yeni temelin üzerine tek kayıt olarak yazılır
+            self.journal.record(1, lines, self.document.text())
+
+    def _on_content_changed(self, first, last, delta):
+        if self._loading or self.large_view:
+            return
+        self._modified = True
+        self.edit_generation += 1
+        if self.journal is not None:
+            self.journal.record(first, last, self.document.get_lines(first, last + delta))
+
+    def set_macro_recorder(self, recorder):
+        # Kayıt açıkken düzenleme proxy'si ham komutları _on_text_command'a iletir
+        self.macro_recorder = recorder
+        name = f"::notep_macro({self.text._w})"
+        if recorder is not None:
+            self.text.tk.call("set", name, 1)
+        else:
+            self.text.tk.call("unset", "-nocomplain", name)
+
+    def macro_operation(self, *op):
+        # Bul/değiştir ve satır işlemleri makroya tek işlem olarak yazılır
+        if self.macro_recorder is None:
+            return contextlib.nullcontext()
+        return self.macro_recorder.operation(*op)
+
+    def _on_text_command(self, *args):
+        if self.macro_recorder is not None:
+            self.macro_recorder.capture(self.text, args)
 
     def record_macro(self, event=None):
-        global macro_recording, macro_actions
-        if macro_recording:
-            # Burada, örnek olarak basitçe event.char ve event.keysym kaydediliyor.
-            macro_actions.append((event.type, event.keysym, event.char))
+        # Ekleme/silme proxy üzerinden kaydedilir; burada yalnızca imleç hareketleri
+        if self.macro_recorder is None:
+            return
+        name = f"Control-{event.keysym}" if event.state & 0x4 else event.keysym
+        if name in MOTIONS:
+            self.macro_recorder.record("move", name)
+
+    def line_operation(self, name):
+        # Satırı çoğalt / sil / yukarı / aşağı taşı
+        text = self.text
+        line, col = map(int, text.index("insert").split("."))
+        last = int(text.index("end-1c").split(".")[0])
+        with self.macro_operation("line", name):
+            if name == "duplicate":
+                text.insert(f"{line}.end", "\n" + self.document.get_lines(line, line))
+                text.mark_set("insert", f"{line + 1}.{col}")
+            elif name == "delete":
+                if line < last:
+                    text.delete(f"{line}.0", f"{line + 1}.0")
+                elif line > 1:
+                    text.delete(f"{line - 1}.end", f"{line}.end")
+                else:
+                    text.delete("1.0", "1.end")
+                text.mark_set("insert", "insert linestart")
+            elif name in ("up", "down"):
+                target = line - 1 if name == "up" else line + 1
+                if 1 <= target <= last:
+                    a, b = min(line, target), max(line, target)
+                    lines = self.document.get_lines(a, b).split("\n")
+                    text.replace(f"{a}.0", f"{b}.end", lines[1] + "\n" + lines[0])
+                    text.mark_set("insert", f"{target}.{col}")
+            text.see("insert")
 
     def hide_context_menu(self, event=None):
         # (İsteğe bağlı) sağ tık menüsü gizlenebilir.
-        pass
+        if self.completion is not None:
+            self.completion.close()
+
+
+class CompletionPopup:
+    # İmlecin altında açılan kelime tamamlama listesi. Odak editörde kalır: yazmaya devam
+    # edildikçe liste boşta yeniden sorgulanır; Yukarı/Aşağı seçer, Enter/Tab ekler, Esc kapatır.
+    def __init__(self, root, index):
+        self.index = index
+        self.editor = None
+        self.prefix = None  # Listenin sorgulandığı önek
+        self._job = None
+        self.window = tk.Toplevel(root)
+        self.window.withdraw()
+        self.window.overrideredirect(True)
+        self.listbox = tk.Listbox(self.window, height=COMPLETION_LIMIT, activestyle="none",
+                                  exportselection=False, takefocus=0)
+        self.listbox.pack(fill="both", expand=True)
+        self.listbox.bind("<ButtonRelease-1>", lambda e: self.accept())
+
+    def open(self, editor):
+        # Öneri bulunursa True
+        if self.editor is not editor:
+            self.close()
+            self.editor = editor
+            editor.completion = self
+        self.prefix = None
+        return self.refresh()
+
+    def close(self):
+        if self._job is not None:
+            self.window.after_cancel(self._job)
+            self._job = None
+        if self.editor is not None:
+            self.editor.completion = None
+            self.editor = None
+        self.window.withdraw()
+
+    def schedule_refresh(self):
+        if self._job is None:
+            self._job = self.window.after_idle(self.refresh)
+
+    def _current_prefix(self):
+        match = COMPLETION_PREFIX_RE.search(self.editor.text.get("insert linestart", "insert"))
+        return match.group() if match else ""
+
+    def refresh(self):
+        # Önek değişmediyse liste (ve seçim) korunur, yalnızca konum güncellenir
+        self._job = None
+        if self.editor is None:
+            return False
+        text = self.editor.text
+        prefix = self._current_prefix()
+        bbox = text.bbox("insert")
+        if not prefix or bbox is None:
+            self.close()
+            return False
+        if prefix != self.prefix:
+            words = self.index.complete(prefix, COMPLETION_LIMIT)
+            if not words:
+                self.close()
+                return False
+            self.prefix = prefix
+            self.listbox.delete(0, tk.END)
+            self.listbox.insert(tk.END, *words)
+            self.listbox.config(height=len(words))
+            self.listbox.selection_set(0)
+        x, y, _, height = bbox
+        self.window.geometry(f"+{text.winfo_rootx() + x}+{text.winfo_rooty() + y + height}")
+        self.window.deiconify()
+        self.window.lift()
+        return True
+
+    def handle_key(self, keysym):
+        # Liste tuşu işlediyse True (tuş editöre gitmez)
+        if keysym in ("Up", "Down"):
+            selection = self.listbox.curselection()
+            index = (selection[0] if selection else 0) + (1 if keysym == "Down" else -1)
+            index %= self.listbox.size()
+            self.listbox.selection_clear(0, tk.END)
+            self.listbox.selection_set(index)
+            self.listbox.see(index)
+            return True
+        if keysym in ("Return", "KP_Enter", "Tab"):
+            self.accept()
+            return True
+        if keysym == "Escape":
+            self.close()
+            return True
+        return False
+
+    def accept(self):
+        # Seçilen kelimenin imleçteki önekten sonra gelen kısmı eklenir
+        editor = self.editor
+        selection = self.listbox.curselection()
+        if editor is not None and selection:
+            word = self.listbox.get(selection[0])
+            prefix = self._current_prefix()
+            if word.startswith(prefix):
+                editor.text.insert("insert", word[len(prefix):])
+                editor.text.see("insert")
+            editor.text.focus_set()
+        self.close()
+
+
+class LargeFileView:
+    # Büyük bir dosyanın yalnızca görünen alan çevresindeki satırlarını Text içinde tutar.
+    # Kaydırma çubuğu, satır numaraları ve satıra gitme dosyanın tamamına göre çalışır.
+    def __init__(self, editor, large_file, status_callback):
+        self.editor = editor
+        self.file = large_file
+        self.status = status_callback
+        self.window_first = 0   # Penceredeki ilk satırın 0 tabanlı mantıksal numarası
+        self.window_lines = 0
+        self.window_start = 0   # Pencerenin dosyadaki bayt aralığı
+        self.window_end = 0
+        self.editable = False
+        self.window_dirty = False
+        self._loading = False
+        self._recenter_job = None
+        editor.v_scroll.config(command=self.on_scrollbar)
+        editor.edit_listeners.append(self.on_edit)
+        self.load_window(0)
+        large_file.start_indexing()
+        self.poll_indexing()
+
+    def load_window(self, top):
+        # top satırı görünen alanın en üstünde olacak şekilde pencereyi yeniden doldur
+        if self.window_dirty:
+            self.status("Kaydedilmemiş değişiklikler var; pencereyi kaydırmadan önce kaydedin")
+            return False
+        text = self.editor.text
+        first = max(0, top - WINDOW_MARGIN)
+        content, self.window_start, self.window_end = self.file.read_lines(first, WINDOW_LINES)
+        insert_line, insert_col = self.logical_insert()
+        self._loading = True
+        text.config(state="normal")
+        text.delete("1.0", tk.END)
+        text.insert("1.0", content)
+        text.edit_reset()
+        if not self.editable:
+            text.config(state="disabled")
+        self._loading = False
+        self.window_first = first
+        self.window_lines = content.count("\n") + 1
+        self.editor.line_offset = first
+        if 0 <= insert_line - first < self.window_lines:
+            text.mark_set("insert", f"{insert_line - first + 1}.{insert_col}")
+        text.yview(f"{top - first + 1}.0")
+        self.editor.update_linenumbers()
+        if self.editable and not self.window_round_trips():
+            self.editable = False
+            text.config(state="disabled")
+            self.status("Bu bölüm diske aynen geri yazılamıyor; düzenleme kapatıldı")
+        return True
+
+    def window_round_trips(self):
+        # Penceredeki metin diske bayt bayt aynı geri yazılabiliyor mu (çözülemeyen baytlar dahil)
+        try:
+            data = self.editor.document.text().encode(self.file.encoding, "surrogateescape")
+        except UnicodeError:
+            return False
+        return data == self.file.mm[self.window_start:self.window_end]
+
+    def logical_insert(self):
+        line, col = self.editor.text.index("insert").split(".")
+        return self.window_first + int(line) - 1, int(col)
+
+    def show_line(self, line, place_cursor=False):
+        # 0 tabanlı mantıksal satırı göster; gerekirse pencereyi o satıra taşı
+        limit = self.file.known_lines() if self.file.indexing_done else self.file.checkpoint_lines[-1] + 1
+        line = max(0, min(line, limit - 1))
+        local = line - self.window_first
+        at_start = self.window_first == 0
+        at_end = self.window_end >= self.file.size
+        inside = (at_start or local >= WINDOW_MARGIN // 2) and \
+                 (at_end or local < self.window_lines - WINDOW_MARGIN // 2)
+        if not (0 <= local < self.window_lines and inside):
+            if not self.load_window(line):
+                return
+            local = line - self.window_first
+        text = self.editor.text
+        if place_cursor:
+            text.mark_set("insert", f"{local + 1}.0")
+            text.see(f"{local + 1}.0")
+        else:
+            text.yview(f"{local + 1}.0")
+
+    def on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            self.show_line(int(float(args[1]) * self.file.known_lines()))
+        else:
+            self.editor.text.yview(*args)
+
+    def on_text_scroll(self, first, last):
+        # Text yalnızca pencere içindeki oranı bildirir; kaydırma çubuğunu dosyanın tamamına göre ayarla
+        text = self.editor.text
+        top = int(text.index("@0,0").split(".")[0]) - 1
+        bottom = int(text.index(f"@0,{text.winfo_height()}").split(".")[0]) - 1
+        total = max(self.file.known_lines(), self.window_first + self.window_lines)
+        self.editor.v_scroll.set((self.window_first + top) / total, (self.window_first + bottom + 1) / total)
+        near_top = self.window_first > 0 and top < WINDOW_MARGIN // 2
+        near_bottom = self.window_end < self.file.size and bottom > self.window_lines - WINDOW_MARGIN // 2
+        if (near_top or near_bottom) and not self.window_dirty and self._recenter_job is None:
+            self._recenter_job = text.after_idle(self._recenter)
+
+    def _recenter(self):
+        self._recenter_job = None
+        top = int(self.editor.text.index("@0,0").split(".")[0]) - 1
+        self.load_window(self.window_first + top)
+
+    def on_edit(self, first, last, delta):
+        if not self._loading:
+            self.window_dirty = True
+
+    def poll_indexing(self):
+        if not self.editor.text.winfo_exists():
+            return
+        name = os.path.basename(self.file.path)
+        if self.file.indexing_done:
+            self.status(f"{name}: {self.file.line_count} satır (büyük dosya modu, salt okunur)"
+                        if not self.editable else f"{name}: {self.file.line_count} satır (büyük dosya modu)")
+        else:
+            percent = 100 * self.file.indexed_bytes // max(self.file.size, 1)
+            self.status(f"{name} indeksleniyor... %{percent}")
+            self.editor.text.after(250, self.poll_indexing)
+        self.on_text_scroll(None, None)
+
+    def enable_editing(self):
+        # Pencere aynen geri yazılamıyorsa düzenleme açılmaz; kayıt dosyayı bozardı
+        if not self.window_round_trips():
+            return False
+        self.editable = True
+        self.editor.text.config(state="normal")
+        return True
+
+    def save(self):
+        # Yalnızca pencere değişir; dosyanın geri kalanı mmap üzerinden aynen kopyalanır
+        text = self.editor.text
+        data = self.editor.document.text().encode(self.file.encoding, "surrogateescape")
+        top = self.window_first + int(text.index("@0,0").split(".")[0]) - 1
+        old = self.file
+        try:
+            old.write_spliced(self.window_start, self.window_end, data)
+            self.window_dirty = False
+        finally:
+            if old.closed:
+                # Pencereden önceki indeks noktaları yeni dosyada da geçerlidir
+                count = bisect.bisect_right(old.checkpoint_offsets, self.window_start)
+                self.file = LargeFile(old.path, old.encoding,
+                                      seed=(old.checkpoint_lines[:count], old.checkpoint_offsets[:count]))
+                if not self.window_dirty:
+                    self.load_window(top)
+                self.file.start_indexing()
+                self.poll_indexing()
+
+    def reload(self):
+        # Dosya dışarıda değişti: indeks baştan kurulur, aynı satır yeniden gösterilir
+        top = self.window_first + int(self.editor.text.index("@0,0").split(".")[0]) - 1
+        old = self.file
+        self.file = LargeFile(old.path, old.encoding)
+        old.close()
+        self.load_window(top)
+        self.file.start_indexing()
+        self.poll_indexing()
+
+    def close(self):
+        self.file.close()
 
 
 class FindReplaceDialog(tk.Toplevel):
-    def __init__(self, master, editor, mode="find"):
+    def __init__(self, master, editor, mode="find", status=None):
         super().__init__(master)
         self.editor = editor
         self.mode = mode
+        self.status = status
         self.title("Bul" if mode == "find" else "Değiştir")
-        self.geometry("450x150")
+        self.geometry("520x190")
         self.transient(master)
         self.resizable(False, False)
-        self.grab_set()
+
+        # Arama durumu: derlenmiş sorgu, eşleşme dizisi ve zamanlanmış işler
+        self.engine = None
+        self._scan_job = None
+        self._tag_job = None
+        editor.edit_listeners.append(self.on_edit)
+        editor.scroll_listeners.append(self.schedule_tag_refresh)
+        self.bind("<Destroy>", self.on_destroy)
 
         self.create_widgets()
 
@@ -141,6 +1180,7 @@ class FindReplaceDialog(tk.Toplevel):
         self.find_entry = ttk.Entry(self, width=30)
         self.find_entry.grid(row=0, column=1, padx=5, pady=5, sticky="w")
         self.find_entry.focus_set()
+        self.find_entry.bind("<Return>", lambda e: self.find_next())
 
         if self.mode == "replace":
             ttk.Label(self, text="Değiştir:").grid(row=1, column=0, padx=5, pady=5, sticky="e")
@@ -148,69 +1188,814 @@ class FindReplaceDialog(tk.Toplevel):
             self.replace_entry.grid(row=1, column=1, padx=5, pady=5, sticky="w")
 
         self.regex_var = tk.BooleanVar()
-        ttk.Checkbutton(self, text="Regex", variable=self.regex_var).grid(row=2, column=1, sticky="w", padx=5)
+        self.case_var = tk.BooleanVar(value=True)
+        self.word_var = tk.BooleanVar()
+        options = ttk.Frame(self)
+        options.grid(row=2, column=1, sticky="w", padx=5)
+        ttk.Checkbutton(options, text="Regex", variable=self.regex_var).pack(side="left")
+        ttk.Checkbutton(options, text="Büyük/küçük harf duyarlı", variable=self.case_var).pack(side="left", padx=5)
+        ttk.Checkbutton(options, text="Tam kelime", variable=self.word_var).pack(side="left")
+
+        self.count_var = tk.StringVar()
+        ttk.Label(self, textvariable=self.count_var).grid(row=3, column=1, sticky="w", padx=5)
 
         btn_frame = ttk.Frame(self)
-        btn_frame.grid(row=3, column=0, columnspan=2, pady=10)
+        btn_frame.grid(row=4, column=0, columnspan=2, pady=10)
         ttk.Button(btn_frame, text="Bul", command=self.find).pack(side="left", padx=5)
+        ttk.Button(btn_frame, text="Önceki", command=self.find_previous).pack(side="left", padx=5)
+        ttk.Button(btn_frame, text="Sonraki", command=self.find_next).pack(side="left", padx=5)
         if self.mode == "replace":
             ttk.Button(btn_frame, text="Değiştir", command=self.replace).pack(side="left", padx=5)
             ttk.Button(btn_frame, text="Tümünü Değiştir", command=self.replace_all).pack(side="left", padx=5)
         ttk.Button(btn_frame, text="Kapat", command=self.destroy).pack(side="left", padx=5)
 
-    def find(self):
-        self.editor.text.tag_remove("match", "1.0", tk.END)
+    def build_query(self):
         pattern = self.find_entry.get()
         if not pattern:
+            return None
+        try:
+            return SearchQuery(pattern, regex=self.regex_var.get(), case_sensitive=self.case_var.get(),
+                               whole_word=self.word_var.get())
+        except re.error as e:
+            self.count_var.set(f"Geçersiz regex: {e}")
+            return None
+
+    def query_changed(self):
+        query = self.engine.query if self.engine else None
+        return query is None or (query.pattern, query.is_regex, query.case_sensitive, query.whole_word) != \
+            (self.find_entry.get(), self.regex_var.get(), self.case_var.get(), self.word_var.get())
+
+    def find(self):
+        # Aramayı baştan başlat; tarama after() ile dilimlenerek ilerler
+        self.cancel_scan()
+        self.editor.text.tag_remove("match", "1.0", tk.END)
+        query = self.build_query()
+        if query is None:
+            self.engine = None
             return
-        flags = 0
-        if not self.regex_var.get():
-            pattern = re.escape(pattern)
-        content = self.editor.text.get("1.0", tk.END)
-        for match in re.finditer(pattern, content, flags):
-            start = "1.0+{}c".format(match.start())
-            end = "1.0+{}c".format(match.end())
-            self.editor.text.tag_add("match", start, end)
+        self.engine = SearchEngine(query)
+        self.engine.begin(self.editor.document.text())
         self.editor.text.tag_config("match", foreground="white", background="blue")
+        self._scan_step()
 
-    def replace(self):
-        pattern = self.find_entry.get()
-        replace_with = self.replace_entry.get()
-        if not pattern:
+    def _scan_step(self):
+        self._scan_job = None
+        done = self.engine.step(SEARCH_SLICE_MS / 1000)
+        if done:
+            self.count_var.set(f"{len(self.engine)} eşleşme")
+        else:
+            self.count_var.set(f"{len(self.engine)} eşleşme bulundu...")
+            self._scan_job = self.after(1, self._scan_step)
+        self.refresh_tags()
+
+    def cancel_scan(self):
+        if self._scan_job is not None:
+            self.after_cancel(self._scan_job)
+            self._scan_job = None
+        if self.engine:
+            self.engine.cancel()
+
+    def schedule_tag_refresh(self):
+        if self.engine and self._tag_job is None:
+            self._tag_job = self.after_idle(self.refresh_tags)
+
+    def refresh_tags(self):
+        # Yalnızca görünen alanın çevresindeki eşleşmeler işaretlenir
+        self._tag_job = None
+        text = self.editor.text
+        text.tag_remove("match", "1.0", tk.END)
+        if not self.engine:
+            return
+        first, last = self.editor._visible_lines()
+        lo, hi = self.engine.in_lines(first - MATCH_TAG_MARGIN, last + MATCH_TAG_MARGIN)
+        hi = min(hi, lo + MATCH_TAG_LIMIT)
+        ranges = []
+        for (start_line, start_col), (end_line, end_col) in zip(self.engine.starts[lo:hi], self.engine.ends[lo:hi]):
+            ranges.append(f"{start_line}.{start_col}")
+            ranges.append(f"{end_line}.{end_col}")
+        if ranges:
+            text.tag_add("match", *ranges)
+
+    def on_edit(self, first, last, delta):
+        if not self.engine:
+            return
+        if self.engine.scanning:
+            # Tarama eski metin üzerinde sürüyor; baştan başlamak en güvenlisi
+            self.find()
+            return
+        self.engine.apply_edit(first, last, delta, self.editor.document)
+        self.count_var.set(f"{len(self.engine)} eşleşme")
+        self.schedule_tag_refresh()
+
+    def query_options(self):
+        return self.find_entry.get(), self.regex_var.get(), self.case_var.get(), self.word_var.get()
+
+    def find_next(self):
+        with self.editor.macro_operation("find", *self.query_options(), False):
+            self._jump(forward=True)
+
+    def find_previous(self):
+        with self.editor.macro_operation("find", *self.query_options(), True):
+            self._jump(forward=False)
+
+    def _jump(self, forward):
+        if self.query_changed():
+            self.find()
+        if not self.engine:
             return
-        content = self.editor.text.get("1.0", tk.END)
-        if self.regex_var.get():
-            new_content, count = re.subn(pattern, replace_with, content)
+        text = self.editor.text
+        if forward:
+            line, col = text.index("insert").split(".")
+            i = self.engine.next_after((int(line), int(col)))
         else:
-            new_content = content.replace(pattern, replace_with, 1)
-        self.editor.text.delete("1.0", tk.END)
-        self.editor.text.insert("1.0", new_content)
-        self.find()
+            anchor = text.index("sel.first") if text.tag_ranges("sel") else text.index("insert")
+            line, col = anchor.split(".")
+            i = self.engine.previous_before((int(line), int(col)))
+        if i is None:
+            self.count_var.set("Eşleşme yok" if not self.engine.scanning else self.count_var.get())
+            return
+        start = "{}.{}".format(*self.engine.starts[i])
+        end = "{}.{}".format(*self.engine.ends[i])
+        text.tag_remove("sel", "1.0", tk.END)
+        text.tag_add("sel", start, end)
+        text.mark_set("insert", end if forward else start)
+        text.see(start)
+        self.count_var.set(f"{i + 1}/{len(self.engine)} eşleşme")
+
+    def on_destroy(self, event):
+        if event.widget is not self:
+            return
+        self.cancel_scan()
+        if self.on_edit in self.editor.edit_listeners:
+            self.editor.edit_listeners.remove(self.on_edit)
+        if self.schedule_tag_refresh in self.editor.scroll_listeners:
+            self.editor.scroll_listeners.remove(self.schedule_tag_refresh)
+
+    def replace(self):
+        # Seçili eşleşmeyi değiştirir ve bir sonrakine geçer
+        with self.editor.macro_operation("replace", *self.query_options(), self.replace_entry.get()):
+            self._replace()
+
+    def _replace(self):
+        if self.query_changed():
+            self.find()
+        if not self.engine:
+            return
+        text = self.editor.text
+        if text.tag_ranges("sel"):
+            # Makro kaydı oynatırken de aynı kontrol yapılır (macro.replace_selection)
+            start, end = (tuple(map(int, text.index(index).split("."))) for index in ("sel.first", "sel.last"))
+            match = self.engine.query.match_span(self.editor.document, start, end)
+            if match is not None:
+                new_text = self.engine.query.expand(match, self.replace_entry.get())
+                text.edit_separator()
+                text.replace(f"{start[0]}.{start[1]}", f"{end[0]}.{end[1]}", new_text)
+                text.edit_separator()
+                text.mark_set("insert", f"{start[0]}.{start[1]}+{len(new_text)}c")
+        self.find_next()
 
     def replace_all(self):
-        pattern = self.find_entry.get()
         replace_with = self.replace_entry.get() if self.mode == "replace" else ""
-        if not pattern:
+        with self.editor.macro_operation("replace_all", *self.query_options(), replace_with):
+            self._replace_all()
+
+    def _replace_all(self):
+        # Eşleşmeler sondan başa doğru yerinde değiştirilir; tek bir geri alma adımıdır
+        query = self.build_query()
+        if query is None:
             return
-        content = self.editor.text.get("1.0", tk.END)
-        if self.regex_var.get():
-            new_content, count = re.subn(pattern, replace_with, content)
+        self.cancel_scan()
+        self.engine = None
+        text = self.editor.text
+        started = time.perf_counter()
+        replace_with = self.replace_entry.get() if self.mode == "replace" else ""
+        spans = SearchEngine(query).replacements(self.editor.document.text(), replace_with)
+        self.editor.begin_bulk_edit()
+        text.config(autoseparators=False)
+        text.edit_separator()
+        try:
+            for (start_line, start_col), (end_line, end_col), new_text in reversed(spans):
+                text.replace(f"{start_line}.{start_col}", f"{end_line}.{end_col}", new_text)
+        finally:
+            text.edit_separator()
+            text.config(autoseparators=True)
+            self.editor.end_bulk_edit()
+        elapsed = time.perf_counter() - started
+        text.tag_remove("match", "1.0", tk.END)
+        self.count_var.set(f"{len(spans)} değişiklik")
+        if self.status:
+            self.status(f"{len(spans)} eşleşme değiştirildi ({elapsed * 1000:.0f} ms)")
+
+
+class MacroRunDialog(tk.Toplevel):
+    def __init__(self, master, app):
+        super().__init__(master)
+        self.app = app
+        self.title("Makroyu Çalıştır")
+        self.transient(master)
+        self.resizable(False, False)
+
+        self.mode_var = tk.StringVar(value="times")
+        ttk.Radiobutton(self, text="Çalıştırma sayısı:", variable=self.mode_var, value="times").grid(
+            row=0, column=0, padx=5, pady=5, sticky="w")
+        self.times_spin = ttk.Spinbox(self, from_=1, to=10 ** 9, width=10)
+        self.times_spin.set(1)
+        self.times_spin.grid(row=0, column=1, padx=5, pady=5, sticky="w")
+        ttk.Radiobutton(self, text="Dosya sonuna kadar", variable=self.mode_var, value="eof").grid(
+            row=1, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+
+        btn_frame = ttk.Frame(self)
+        btn_frame.grid(row=2, column=0, columnspan=2, pady=10)
+        ttk.Button(btn_frame, text="Çalıştır", command=self.run).pack(side="left", padx=5)
+        ttk.Button(btn_frame, text="Kapat", command=self.destroy).pack(side="left", padx=5)
+
+    def run(self):
+        if self.mode_var.get() == "eof":
+            self.app.run_macro(until_eof=True)
         else:
-            new_content = content.replace(pattern, replace_with)
-        self.editor.text.delete("1.0", tk.END)
-        self.editor.text.insert("1.0", new_content)
-        self.editor.text.tag_remove("match", "1.0", tk.END)
+            try:
+                times = int(self.times_spin.get())
+            except ValueError:
+                return
+            self.app.run_macro(times=max(times, 1))
+
+
+class PerformancePanel(tk.Toplevel):
+    # İşleyici başına süre histogramlarının özeti ve bütçeyi aşan işlemler
+    def __init__(self, master, app):
+        super().__init__(master)
+        self.app = app
+        self.title("Performans")
+        self.geometry("780x520")
+        self._refresh_job = None
+        self.bind("<Destroy>", self.on_destroy)
+        self.create_widgets()
+        self.refresh()
+
+    def create_widgets(self):
+        top = ttk.Frame(self)
+        top.pack(fill="x", padx=5, pady=5)
+        ttk.Checkbutton(top, text="Ölçüm açık", variable=self.app.perf_enabled,
+                        command=self.app.toggle_performance).pack(side="left")
+        ttk.Label(top, text="Bütçe (ms):").pack(side="left", padx=(15, 2))
+        self.budget_spin = ttk.Spinbox(top, from_=1, to=1000, width=6, command=self.set_budget)
+        self.budget_spin.set(f"{MONITOR.budget_ms:g}")
+        self.budget_spin.bind("<Return>", self.set_budget)
+        self.budget_spin.bind("<FocusOut>", self.set_budget)
+        self.budget_spin.pack(side="left")
+        ttk.Button(top, text="Sıfırla", command=self.reset).pack(side="right")
+        ttk.Button(top, text="Chrome Trace...", command=self.export_trace).pack(side="right", padx=5)
+        ttk.Button(top, text="JSON...", command=self.export_json).pack(side="right")
+
+        self.keystroke_var = tk.StringVar()
+        ttk.Label(self, textvariable=self.keystroke_var).pack(anchor="w", padx=5)
+        columns = {"count": "Sayı", "total": "Toplam ms", "p50": "p50", "p95": "p95", "p99": "p99", "max": "En uzun"}
+        self.tree = ttk.Treeview(self, columns=tuple(columns), height=12)
+        self.tree.heading("#0", text="İşleyici")
+        self.tree.column("#0", width=300)
+        for column, title in columns.items():
+            self.tree.heading(column, text=title)
+            self.tree.column(column, width=70, anchor="e")
+        self.tree.pack(fill="both", expand=True, padx=5)
+        ttk.Label(self, text="Bütçeyi aşan işlemler:").pack(anchor="w", padx=5, pady=(5, 0))
+        self.slow_list = tk.Listbox(self, height=8)
+        self.slow_list.pack(fill="x", padx=5, pady=5)
+
+    def set_budget(self, event=None):
+        try:
+            MONITOR.budget_ms = max(0.1, float(self.budget_spin.get()))
+        except ValueError:
+            self.budget_spin.set(f"{MONITOR.budget_ms:g}")
+
+    def refresh(self):
+        self._refresh_job = None
+        keystroke = MONITOR.histograms.get(KEYSTROKE)
+        if keystroke:
+            self.keystroke_var.set(f"Tuş vuruşundan boşta kalmaya: p50 {keystroke.percentile(50):.1f} ms, "
+                                   f"p95 {keystroke.percentile(95):.1f} ms, p99 {keystroke.percentile(99):.1f} ms "
+                                   f"({keystroke.count} tuş)")
+        else:
+            self.keystroke_var.set("Tuş vuruşu ölçümü yok" if self.app.perf_enabled.get() else "Ölçüm kapalı")
+        self.tree.delete(*self.tree.get_children())
+        for name, hist in MONITOR.summary():
+            self.tree.insert("", "end", text=name, values=(
+                hist.count, f"{hist.total:.1f}", f"{hist.percentile(50):.2f}", f"{hist.percentile(95):.2f}",
+                f"{hist.percentile(99):.2f}", f"{hist.max:.2f}"))
+        self.slow_list.delete(0, tk.END)
+        for at, name, ms, size in reversed(MONITOR.slow_log):
+            clock = time.strftime("%H:%M:%S", time.localtime(at))
+            buffer = f"  ({size[0]} karakter, {size[1]} satır)" if size else ""
+            self.slow_list.insert(tk.END, f"{clock}  {name}  {ms:.1f} ms{buffer}")
+        self._refresh_job = self.after(PERF_REFRESH_MS, self.refresh)
+
+    def reset(self):
+        MONITOR.reset()
+        self.refresh_now()
+
+    def refresh_now(self):
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+        self.refresh()
+
+    def export_json(self):
+        self._export(MONITOR.write_json, "perf.json")
+
+    def export_trace(self):
+        self._export(MONITOR.write_chrome_trace, "perf-trace.json")
+
+    def _export(self, writer, initial):
+        path = filedialog.asksaveasfilename(parent=self, defaultextension=".json", initialfile=initial,
+                                            filetypes=[("JSON", "*.json"), ("Tüm Dosyalar", "*.*")])
+        if not path:
+            return
+        try:
+            writer(path)
+        except OSError as e:
+            messagebox.showerror("Hata", f"Dışa aktarılamadı:\n{e}", parent=self)
+
+    def on_destroy(self, event):
+        if event.widget is not self:
+            return
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+            self._refresh_job = None
+        self.app.perf_panel = None
+
+
+class CompareSide:
+    # Karşılaştırmanın bir tarafı: açık bir editör ya da diskteki dosyanın satırları
+    def __init__(self, title, editor=None, lines=None):
+        self.title = title
+        self.editor = editor
+        self.lines = lines
+
+    @property
+    def line_count(self):
+        return self.editor.document.line_count if self.editor else len(self.lines)
+
+    def get_lines(self, first, last):
+        # 0 tabanlı first..last-1 satırları
+        if first >= last:
+            return []
+        if self.editor:
+            return self.editor.document.get_lines(first + 1, last).split("\n")
+        return self.lines[first:last]
+
+    def text(self):
+        return self.editor.document.text() if self.editor else "\n".join(self.lines)
+
+
+class CompareView(tk.Toplevel):
+    # İki tarafı yan yana, hizalı gösterir. Bölmeler yalnızca görünen satırları içerir;
+    # ortak dikey kaydırma çubuğu DiffMap'in hizalı satırları üzerinde çalışır. İlk
+    # karşılaştırma işçi süreçte yapılır; düzenlemelerden sonra yalnızca değişen bölge
+    # yeniden karşılaştırılır.
+    def __init__(self, master, app, left, right):
+        super().__init__(master)
+        self.app = app
+        self.sides = (left, right)
+        self.title(f"Karşılaştır: {left.title} ↔ {right.title}")
+        self.geometry("1100x650")
+        self.map = None
+        self.top = 0
+        self.visible = 1
+        self.current = -1       # Seçili fark (hunk) indeksi
+        self.version = 0        # Her düzenlemede artar; eski sonuçlar atılır
+        self._job = None        # (future, sürüm, yeniden karşılaştırılan hunk indeksleri ya da None)
+        self._poll_job = None
+        self._rediff_job = None
+        self._render_job = None
+        self._listeners = []
+        for index, side in enumerate(self.sides):
+            if side.editor is not None:
+                listener = lambda first, last, delta, index=index: self.on_edit(index, first, last, delta)
+                side.editor.edit_listeners.append(listener)
+                self._listeners.append((side.editor, listener))
+                side.editor.frame.bind("<Destroy>", lambda e: self.winfo_exists() and self.destroy(), add="+")
+        self.bind("<Destroy>", self.on_destroy)
+        self.create_widgets()
+        self.start_diff()
+
+    def create_widgets(self):
+        top = ttk.Frame(self)
+        top.pack(fill="x", padx=5, pady=5)
+        ttk.Button(top, text="◀ Önceki Fark", command=self.previous_hunk).pack(side="left")
+        ttk.Button(top, text="Sonraki Fark ▶", command=self.next_hunk).pack(side="left", padx=5)
+        ttk.Button(top, text="Yeniden Karşılaştır", command=self.start_diff).pack(side="left")
+        self.status_var = tk.StringVar()
+        ttk.Label(top, textvariable=self.status_var).pack(side="right")
+
+        body = ttk.Frame(self)
+        body.pack(fill="both", expand=True, padx=5, pady=(0, 5))
+        body.columnconfigure(0, weight=1, uniform="pane")
+        body.columnconfigure(1, weight=1, uniform="pane")
+        body.rowconfigure(1, weight=1)
+        editor = next((side.editor for side in self.sides if side.editor), None)
+        font = editor.text.cget("font") if editor else "TkFixedFont"
+        self.panes = []
+        for column, side in enumerate(self.sides):
+            ttk.Label(body, text=side.title).grid(row=0, column=column, sticky="w")
+            pane = tk.Text(body, wrap="none", font=font, cursor="arrow", state="disabled")
+            pane.grid(row=1, column=column, sticky="nsew", padx=(0, 2))
+            pane.tag_configure("diff_lineno", foreground="#808080")
+            pane.tag_configure("diff_changed", background="#f5e7b2", foreground="black")
+            pane.tag_configure("diff_removed", background="#f4c7c3", foreground="black")
+            pane.tag_configure("diff_added", background="#c8e6c9", foreground="black")
+            pane.tag_configure("diff_filler", background="#dddddd")
+            pane.tag_configure("diff_current", foreground="#c62828")
+            pane.bind("<Double-Button-1>", lambda e, column=column: self.open_line(column, e))
+            for sequence, rows in (("<Up>", -1), ("<Down>", 1), ("<Button-4>", -3), ("<Button-5>", 3)):
+                pane.bind(sequence, lambda e, rows=rows: self.scroll_rows(rows) or "break")
+            pane.bind("<MouseWheel>", lambda e: self.scroll_rows(-3 if e.delta > 0 else 3) or "break")
+            pane.bind("<Prior>", lambda e: self.scroll_rows(-self.visible) or "break")
+            pane.bind("<Next>", lambda e: self.scroll_rows(self.visible) or "break")
+            pane.bind("<Configure>", self.on_configure)
+            self.panes.append(pane)
+        self.v_scroll = ttk.Scrollbar(body, orient="vertical", command=self.on_scrollbar)
+        self.v_scroll.grid(row=1, column=2, sticky="ns")
+        h_scroll = ttk.Scrollbar(body, orient="horizontal",
+                                 command=lambda *args: [pane.xview(*args) for pane in self.panes])
+        h_scroll.grid(row=2, column=0, columnspan=2, sticky="ew")
+        self.panes[0].config(xscrollcommand=h_scroll.set)
+        self.bind("<Alt-Down>", lambda e: self.next_hunk())
+        self.bind("<Alt-Up>", lambda e: self.previous_hunk())
+        self.bind("<F7>", lambda e: self.next_hunk())
+        self.bind("<Shift-F7>", lambda e: self.previous_hunk())
+
+    # Karşılaştırma işleri
+    def start_diff(self):
+        # Bütün metnin karşılaştırılması (açılışta ve "Yeniden Karşılaştır" ile)
+        self.cancel_job()
+        self.map = None
+        self.status_var.set("Karşılaştırılıyor...")
+        self.submit([(self.sides[0].text(), self.sides[1].text())], None)
+
+    def submit(self, pairs, indexes):
+        started = time.perf_counter()
+        if indexes is not None and sum(len(a) + len(b) for a, b in pairs) < COMPARE_INLINE_LINES:
+            self.apply_result(diff_regions(pairs), indexes, started)
+            return
+        future = self.app.get_diff_worker().submit(pairs)
+        self._job = (future, self.version, indexes, pairs, started)
+        self._poll_job = self.after(COMPARE_POLL_MS, self.poll_job)
+
+    def poll_job(self):
+        self._poll_job = None
+        future, version, indexes, pairs, started = self._job
+        if not future.done():
+            self._poll_job = self.after(COMPARE_POLL_MS, self.poll_job)
+            return
+        self._job = None
+        try:
+            result = future.result()
+        except Exception as e:
+            # Havuz modülü açılışta yüklenmesin diye hata sınıfı yalnızca burada içe aktarılır
+            from concurrent.futures.process import BrokenProcessPool
+            if isinstance(e, BrokenProcessPool):
+                # İşçi süreç başlatılamadı ya da çöktü: iş parçacığıyla yeniden dene
+                self.app.get_diff_worker().fall_back()
+                self.submit(pairs, indexes)
+                return
+            self.status_var.set(f"Karşılaştırma başarısız: {e}")
+            return
+        if version != self.version:
+            # Sonuç hesaplanırken metin değişti
+            if indexes is None:
+                self.start_diff()
+            else:
+                self.schedule_rediff()
+            return
+        self.apply_result(result, indexes, started)
+
+    def apply_result(self, result, indexes, started):
+        if indexes is None:
+            self.map = DiffMap(self.sides[0].line_count, self.sides[1].line_count, result[0])
+            self.current = -1
+            if self.map.hunks:
+                self.show_hunk(0)
+        else:
+            for i, sub_hunks in sorted(zip(indexes, result), reverse=True):
+                self.map.resolve(i, sub_hunks)
+            self.current = min(self.current, len(self.map.hunks) - 1)
+        self.update_status(time.perf_counter() - started)
+        self.render()
+        if self.map.dirty():
+            self.schedule_rediff()
+
+    def on_edit(self, index, first, last, delta):
+        self.version += 1
+        if self.map is None:
+            return  # İlk karşılaştırma sürüyor; sonucu atılıp yeniden başlatılır
+        self.map.apply_edit(index, first, last, delta)
+        self.current = min(self.current, len(self.map.hunks) - 1)
+        self.schedule_rediff()
+        if self._render_job is None:
+            self._render_job = self.after_idle(self.render)
+
+    def schedule_rediff(self):
+        if self._rediff_job is not None:
+            self.after_cancel(self._rediff_job)
+        self._rediff_job = self.after(COMPARE_REDIFF_MS, self.rediff)
+
+    def rediff(self):
+        # Yalnızca düzenlemelerin kirlettiği bölgeler yeniden karşılaştırılır
+        self._rediff_job = None
+        if self._job is not None or self.map is None:
+            return  # Süren iş bitince yeniden bakılır
+        indexes = self.map.dirty()
+        if not indexes:
+            return
+        left, right = self.sides
+        pairs = []
+        for i in indexes:
+            a0, a1, b0, b1, _ = self.map.hunks[i]
+            pairs.append((left.get_lines(a0, a1), right.get_lines(b0, b1)))
+        self.status_var.set("Karşılaştırılıyor...")
+        self.submit(pairs, indexes)
+
+    def cancel_job(self):
+        # Süreçte çalışan iş durdurulamaz; sonucu yok sayılır
+        for job in (self._poll_job, self._rediff_job):
+            if job is not None:
+                self.after_cancel(job)
+        self._poll_job = self._rediff_job = None
+        self._job = None
+
+    def update_status(self, elapsed=None):
+        count = len(self.map.hunks)
+        if not count:
+            text = "Fark yok"
+        elif self.current >= 0:
+            text = f"Fark {self.current + 1}/{count}"
+        else:
+            text = f"{count} fark"
+        if elapsed is not None:
+            text += f"  ({elapsed:.2f} sn)"
+        self.status_var.set(text)
+
+    # Görünüm
+    def on_configure(self, event=None):
+        linespace = tkfont.Font(font=self.panes[0].cget("font")).metrics("linespace")
+        self.visible = max(1, self.panes[0].winfo_height() // max(linespace, 1))
+        self.render()
+
+    def scroll_to(self, row):
+        if self.map is None:
+            return
+        self.top = max(0, min(row, self.map.row_count - self.visible))
+        self.render()
+
+    def scroll_rows(self, rows):
+        self.scroll_to(self.top + rows)
+
+    def on_scrollbar(self, action, amount, unit=None):
+        if self.map is None:
+            return
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * self.map.row_count))
+        else:
+            self.scroll_rows(int(amount) * (self.visible if unit == "pages" else 1))
+
+    def render(self):
+        # Bölmelere yalnızca görünen satırlar yazılır ve yalnızca onlar etiketlenir
+        self._render_job = None
+        if self.map is None:
+            return
+        total = self.map.row_count
+        self.top = max(0, min(self.top, total - self.visible))
+        rows = self.map.rows(self.top, self.visible + 1)
+        for index, (side, pane) in enumerate(zip(self.sides, self.panes)):
+            numbers = [row[index] for row in rows if row[index] is not None]
+            first = numbers[0] if numbers else 0
+            lines = side.get_lines(first, numbers[-1] + 1) if numbers else []
+            width = len(str(side.line_count))
+            content = []
+            for row in rows:
+                line = row[index]
+                content.append("" if line is None else f"{line + 1:>{width}}  {lines[line - first]}")
+            pane.config(state="normal")
+            pane.delete("1.0", tk.END)
+            pane.insert("1.0", "\n".join(content))
+            for n, (a, b, hunk) in enumerate(rows, 1):
+                line = (a, b)[index]
+                if line is None:
+                    pane.tag_add("diff_filler", f"{n}.0", f"{n + 1}.0")
+                    continue
+                if hunk is not None:
+                    tag = "diff_changed" if a is not None and b is not None else \
+                        ("diff_removed" if index == 0 else "diff_added")
+                    pane.tag_add(tag, f"{n}.0", f"{n + 1}.0")
+                pane.tag_add("diff_current" if hunk == self.current else "diff_lineno", f"{n}.0", f"{n}.{width}")
+            pane.config(state="disabled")
+        self.v_scroll.set(self.top / max(total, 1), min(1.0, (self.top + self.visible) / max(total, 1)))
+
+    def show_hunk(self, i):
+        self.current = i
+        self.update_status()
+        self.scroll_to(self.map.hunk_row(i) - COMPARE_CONTEXT_ROWS)
+
+    def next_hunk(self):
+        if not self.map or not self.map.hunks:
+            return
+        # Seçili farktan, yoksa görünen alanın başından sonraki fark
+        if self.current >= 0 and self.top <= self.map.hunk_row(self.current) < self.top + self.visible:
+            i = self.current + 1
+        else:
+            i = self.map.hunk_at_row(self.top + COMPARE_CONTEXT_ROWS) + 1
+        if i < len(self.map.hunks):
+            self.show_hunk(i)
+
+    def previous_hunk(self):
+        if not self.map or not self.map.hunks:
+            return
+        if self.current >= 0 and self.top <= self.map.hunk_row(self.current) < self.top + self.visible:
+            i = self.current - 1
+        else:
+            i = self.map.hunk_at_row(self.top + COMPARE_CONTEXT_ROWS - 1)
+        if i >= 0:
+            self.show_hunk(i)
+
+    def open_line(self, index, event):
+        # Çift tıklanan satırı kendi sekmesinde göster
+        side = self.sides[index]
+        if side.editor is None or self.map is None:
+            return "break"
+        row = int(self.panes[index].index(f"@{event.x},{event.y}").split(".")[0]) - 1
+        rows = self.map.rows(self.top + row, 1)
+        if rows and rows[0][index] is not None:
+            self.app.notebook.select(side.editor.frame)
+            self.app.show_editor_line(side.editor, rows[0][index] + 1)
+        return "break"
+
+    def on_destroy(self, event):
+        if event.widget is not self:
+            return
+        self.cancel_job()
+        if self._render_job is not None:
+            self.after_cancel(self._render_job)
+        for editor, listener in self._listeners:
+            if listener in editor.edit_listeners:
+                editor.edit_listeners.remove(listener)
+
+
+class FindInFilesDialog(tk.Toplevel):
+    # Bir klasör ağacında arama; Bul/Değiştir penceresiyle aynı desen seçeneklerini kullanır
+    def __init__(self, master, app):
+        super().__init__(master)
+        self.app = app
+        self.title("Dosyalarda Bul")
+        self.geometry("560x230")
+        self.transient(master)
+        self.resizable(False, False)
+        self.create_widgets()
+
+    def create_widgets(self):
+        ttk.Label(self, text="Bul:").grid(row=0, column=0, padx=5, pady=5, sticky="e")
+        self.find_entry = ttk.Entry(self, width=40)
+        self.find_entry.grid(row=0, column=1, padx=5, pady=5, sticky="w")
+        self.find_entry.focus_set()
+        self.find_entry.bind("<Return>", lambda e: self.search())
+
+        ttk.Label(self, text="Klasör:").grid(row=1, column=0, padx=5, pady=5, sticky="e")
+        self.dir_entry = ttk.Entry(self, width=40)
+        self.dir_entry.grid(row=1, column=1, padx=5, pady=5, sticky="w")
+        editor = self.app.get_current_editor()
+        start_dir = os.path.dirname(editor.file_path) if editor and editor.file_path else os.getcwd()
+        self.dir_entry.insert(0, start_dir)
+        ttk.Button(self, text="Gözat...", command=self.browse).grid(row=1, column=2, padx=5)
+
+        ttk.Label(self, text="Dahil:").grid(row=2, column=0, padx=5, pady=5, sticky="e")
+        self.include_entry = ttk.Entry(self, width=40)
+        self.include_entry.grid(row=2, column=1, padx=5, pady=5, sticky="w")
+        ttk.Label(self, text="Hariç:").grid(row=3, column=0, padx=5, pady=5, sticky="e")
+        self.exclude_entry = ttk.Entry(self, width=40)
+        self.exclude_entry.grid(row=3, column=1, padx=5, pady=5, sticky="w")
+
+        self.regex_var = tk.BooleanVar()
+        self.case_var = tk.BooleanVar(value=True)
+        self.word_var = tk.BooleanVar()
+        self.gitignore_var = tk.BooleanVar(value=True)
+        options = ttk.Frame(self)
+        options.grid(row=4, column=1, columnspan=2, sticky="w", padx=5)
+        ttk.Checkbutton(options, text="Regex", variable=self.regex_var).pack(side="left")
+        ttk.Checkbutton(options, text="Büyük/küçük harf duyarlı", variable=self.case_var).pack(side="left", padx=5)
+        ttk.Checkbutton(options, text="Tam kelime", variable=self.word_var).pack(side="left")
+        ttk.Checkbutton(options, text=".gitignore", variable=self.gitignore_var).pack(side="left", padx=5)
+
+        btn_frame = ttk.Frame(self)
+        btn_frame.grid(row=5, column=0, columnspan=3, pady=10)
+        ttk.Button(btn_frame, text="Ara", command=self.search).pack(side="left", padx=5)
+        ttk.Button(btn_frame, text="Durdur", command=self.app.cancel_find_in_files).pack(side="left", padx=5)
+        ttk.Button(btn_frame, text="Kapat", command=self.destroy).pack(side="left", padx=5)
+
+    def browse(self):
+        directory = filedialog.askdirectory(initialdir=self.dir_entry.get() or None)
+        if directory:
+            self.dir_entry.delete(0, tk.END)
+            self.dir_entry.insert(0, directory)
+
+    def search(self):
+        pattern = self.find_entry.get()
+        directory = self.dir_entry.get()
+        if not pattern or not os.path.isdir(directory):
+            return
+        try:
+            query = SearchQuery(pattern, regex=self.regex_var.get(), case_sensitive=self.case_var.get(),
+                                whole_word=self.word_var.get())
+        except re.error as e:
+            messagebox.showerror("Hata", f"Geçersiz regex:\n{e}", parent=self)
+            return
+        from findinfiles import FindInFilesJob, split_globs
+        job = FindInFilesJob(directory, query, self.app.find_in_files_pool(), include=split_globs(self.include_entry.get()),
+                             exclude=split_globs(self.exclude_entry.get()),
+                             use_gitignore=self.gitignore_var.get())
+        self.app.start_find_in_files(job)
+
+
+class FindResultsPanel(ttk.Frame):
+    # Dosyalarda Bul sonuçları; pencerenin altına yerleşir ve Görünüm menüsünden açılıp kapanır
+    def __init__(self, master, app):
+        super().__init__(master)
+        self.app = app
+        self.job = None
+        self._poll_job = None
+        self.hits = {}  # Ağaç öğesi → (yol, satır, sütun)
+        header = ttk.Frame(self)
+        header.pack(side="top", fill="x")
+        self.summary_var = tk.StringVar()
+        ttk.Label(header, textvariable=self.summary_var, anchor="w").pack(side="left", padx=5)
+        ttk.Button(header, text="Kapat", command=self.app.toggle_find_results).pack(side="right")
+        ttk.Button(header, text="Durdur", command=self.cancel).pack(side="right")
+        self.tree = ttk.Treeview(self, show="tree", height=10)
+        scroll = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
+        self.tree.config(yscrollcommand=scroll.set)
+        scroll.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.tree.bind("<<TreeviewSelect>>", self.on_select)
+
+    def start(self, job):
+        self.cancel()
+        self.tree.delete(*self.tree.get_children())
+        self.hits = {}
+        self.job = job
+        self.hit_count = 0
+        job.start()
+        self.poll()
+
+    def poll(self):
+        # Kuyruğa düşen sonuçları ağaca ekle; iş bitene kadar after() ile tekrarla
+        self._poll_job = None
+        job = self.job
+        for path, hits in job.drain():
+            parent = self.tree.insert("", "end", text=f"{path} ({len(hits)})", open=len(hits) <= 20)
+            self.hits[parent] = (path, hits[0][0], hits[0][1])
+            for line, col, line_text in hits:
+                item = self.tree.insert(parent, "end", text=f"{line}: {line_text}")
+                self.hits[item] = (path, line, col)
+            self.hit_count += len(hits)
+        state = "tamamlandı" if job.done else "sürüyor..."
+        self.summary_var.set(f"{self.hit_count} eşleşme, {job.files_scanned}/{job.files_found} dosya tarandı ({state})")
+        if not job.done or not job.results.empty():
+            self._poll_job = self.after(100, self.poll)
+
+    def cancel(self):
+        # Bekleyen yoklama da durdurulur; yoksa yeni arama başlarken iki döngü üst üste biner
+        if self._poll_job is not None:
+            self.after_cancel(self._poll_job)
+            self._poll_job = None
+        if self.job and not self.job.done:
+            self.job.cancel()
+            self.summary_var.set(f"{self.hit_count} eşleşme, {self.job.files_scanned}/{self.job.files_found} "
+                                 "dosya tarandı (durduruldu)")
+
+    def on_select(self, event=None):
+        selection = self.tree.selection()
+        if selection and selection[0] in self.hits:
+            path, line, col = self.hits[selection[0]]
+            self.app.open_file(path, line=line, col=col)
 
 
 class NotepadPlusPlusApp:
-    def __init__(self, root):
+    def __init__(self, root, profile=None, profile_target=None):
         self.root = root
         self.root.title("PyNotepad++")
         self.root.geometry("1000x700")
-        sv_ttk.set_theme("dark")  # Uygulama genelinde tema
+        # Açılış ölçümü; tema ve alt menüler ilk boyamadan sonra yüklenir (finish_startup)
+        self.profile = profile or StartupProfile(time.perf_counter())
+        self.profile_target = profile_target
+        self._first_paint = False
+
+        # Menülerdeki seçenek değişkenleri
+        self.word_wrap = tk.BooleanVar(value=False)
+        self.indent_guides = tk.BooleanVar(value=False)
+        self.auto_save = tk.BooleanVar(value=False)
+        self.auto_save_interval = tk.IntVar(value=60)  # Dakika cinsinden
+        self.hibernate_tabs = tk.BooleanVar(value=False)
+        self.perf_enabled = tk.BooleanVar(value=False)
 
         # Menü ve araç çubuğu oluşturuluyor
-        self.create_menu()
+        with self.profile.phase("menus"):
+            self.create_menu()
 
         # Sekmeli editör (Notebook) oluşturuluyor
         self.notebook = ttk.Notebook(root)
@@ -220,39 +2005,124 @@ class NotepadPlusPlusApp:
         self.status_var = tk.StringVar(value="Hazır")
         self.status_bar = ttk.Label(root, textvariable=self.status_var, relief="sunken", anchor="w")
         self.status_bar.pack(side="bottom", fill="x")
+        # Ölçüm açıkken durum çubuğunun sağında kısa özet
+        self.perf_var = tk.StringVar()
+        self.perf_label = ttk.Label(self.status_bar, textvariable=self.perf_var, anchor="e")
+        self.status_bar.pack_propagate(False)  # Özet etiketi durum çubuğunun boyunu değiştirmesin
+        self.perf_panel = None
+        self._perf_job = None
+        self._perf_binding = None  # bind_all ile eklenen tuş bağının funcid değeri
+        MONITOR.context = self.perf_context
+
+        # Dosyalarda Bul sonuç paneli ilk aramada oluşturulur
+        self.find_results = None
+        # Karşılaştırma işçi süreci ve Dosyalarda Bul süreç havuzu ilk kullanımda başlatılır
+        self.diff_worker = None
+        self.search_pool = None
+        # Bütün sekmelerin ortak kelime dizini ve tamamlama listesi
+        self.word_index = WordIndex()
+        self.completion = CompletionPopup(self.root, self.word_index)
+
+        # Bu boyutun üzerindeki dosyalar büyük dosya modunda açılır (bayt)
+        self.large_file_threshold = LARGE_FILE_THRESHOLD
+
+        # Açık dosyaların diskte değişmesi tek bir izleyiciyle takip edilir; değişiklikler
+        # after() ile toplu olarak işlenir
+        self.watcher = FileWatcher()
+        self._changed_paths = set()  # Bir sonraki turda yeniden bakılacak yollar
+        self.root.after(WATCH_POLL_MS, self.poll_file_changes)
+
+        # Önceki oturumun sekmeleri yer tutucu olarak geri yüklenir; editör sekme ilk
+        # seçildiğinde oluşturulur. Oturum yoksa boş bir sekme açılır.
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+        with self.profile.phase("first_tab"):
+            if not self.restore_session():
+                self.new_file()
+        self.root.protocol("WM_DELETE_WINDOW", self.exit_app)
+        self.root.after(HIBERNATE_CHECK_MS, self.hibernate_idle_tabs)
+
+        # Makro: kayıt sürerken kaydedici ve kaydın yapıldığı editör; son kaydedilen/yüklenen makro
+        self.macro_recorder = None
+        self.macro_editor = None
+        self.macro = Macro()
+
+        # Kayıtlar tek bir arka plan yazıcısında yapılır; sonuçlar after() ile toplanır
+        self.saver = BackgroundSaver()
+        self.root.after(SAVE_POLL_MS, self.poll_saves)
+
+        # Otomatik kaydetme zamanlayıcısı toggle_auto_save ile başlar/durur
+        self._auto_save_job = None
+
+        # Kurtarma günlükleri birkaç saniyede bir diske yazılır; eski günlükler ilk boyamadan sonra sorulur
+        self.root.after(JOURNAL_FLUSH_MS, self.flush_journals)
+        self.root.bind("<Expose>", self.on_first_expose, add="+")
+
+    def on_first_expose(self, event=None):
+        # Kök pencereye bağlı olay bütün alt widget'ların ilk Expose olayını da yakalar
+        if self._first_paint:
+            return
+        self._first_paint = True
+        self.root.unbind("<Expose>")
+        self.root.update_idletasks()
+        self.profile.mark("first_paint")
+        self.root.after_idle(self.finish_startup)
+
+    def finish_startup(self):
+        # İlk boyamadan sonra yüklenenler
+        with self.profile.phase("theme"):
+            self.apply_theme("dark")
+        with self.profile.phase("submenus"):
+            self.populate_menus()
+        self.root.update_idletasks()
+        self.profile.mark("ready")
+        if self.profile_target:
+            self.profile.write(self.profile_target)
+            self.root.destroy()
+            return
+        self.offer_recovery()
 
-        # İlk sekmeyi aç
-        self.new_file()
-
-        # Makro kaydı değişkenleri
-        self.macro_recording = False
-        self.macro_actions = []
-
-        # Otomatik kaydetme ayarları
-        self.auto_save = tk.BooleanVar(value=False)
-        self.auto_save_interval = tk.IntVar(value=60)  # Dakika cinsinden
+    def apply_theme(self, name):
+        import sv_ttk  # Sun Valley teması
+        sv_ttk.set_theme(name)
 
-        # Otomatik kaydetme işlemini başlat
-        self.start_auto_save()
+    def toggle_theme(self):
+        import sv_ttk
+        sv_ttk.toggle_theme()
 
     def create_menu(self):
+        # Açılışta yalnızca menü çubuğu kurulur; alt menüler ilk boyamadan sonra
+        # (ya da daha önce açılırlarsa açılırken) doldurulur
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
-
-        # Dosya Menüsü
-        file_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Dosya", menu=file_menu)
+        self._pending_menus = {}
+        for label, builder in (("Dosya", self.build_file_menu), ("Düzen", self.build_edit_menu),
+                               ("Arama", self.build_search_menu), ("Görünüm", self.build_view_menu),
+                               ("Makro", self.build_macro_menu), ("Yardım", self.build_help_menu)):
+            menu = tk.Menu(menubar, tearoff=0)
+            menu.config(postcommand=lambda menu=menu: self.populate_menu(menu))
+            menubar.add_cascade(label=label, menu=menu)
+            self._pending_menus[str(menu)] = (menu, builder)
+
+    def populate_menu(self, menu):
+        pending = self._pending_menus.pop(str(menu), None)
+        if pending:
+            pending[1](menu)
+
+    def populate_menus(self):
+        for menu, builder in list(self._pending_menus.values()):
+            self.populate_menu(menu)
+
+    def build_file_menu(self, file_menu):
         file_menu.add_command(label="Yeni", accelerator="Ctrl+N", command=self.new_file)
         file_menu.add_command(label="Aç...", accelerator="Ctrl+O", command=self.open_file)
+        file_menu.add_command(label="Açmayı İptal Et", accelerator="Esc", command=self.cancel_loading)
         file_menu.add_command(label="Kaydet", accelerator="Ctrl+S", command=self.save_file)
         file_menu.add_command(label="Farklı Kaydet...", command=self.save_as)
         file_menu.add_command(label="Sekmeyi Kapat", accelerator="Ctrl+W", command=self.close_current_tab)
         file_menu.add_separator()
         file_menu.add_command(label="Çıkış", accelerator="Alt+F4", command=self.exit_app)
 
-        # Düzen Menüsü
-        edit_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Düzen", menu=edit_menu)
+    def build_edit_menu(self, edit_menu):
         edit_menu.add_command(label="Geri Al", accelerator="Ctrl+Z", command=self.undo)
         edit_menu.add_command(label="Yinele", accelerator="Ctrl+Y", command=self.redo)
         edit_menu.add_separator()
@@ -263,43 +2133,167 @@ class NotepadPlusPlusApp:
         edit_menu.add_separator()
         edit_menu.add_command(label="Tümünü Seç", accelerator="Ctrl+A", command=self.select_all)
         edit_menu.add_command(label="Go To Line...", accelerator="Ctrl+G", command=self.go_to_line)
+        edit_menu.add_command(label="Kelime Tamamla", accelerator="Ctrl+Space", command=self.show_completions)
+        edit_menu.add_separator()
+        edit_menu.add_command(label="Satırı Çoğalt", accelerator="Ctrl+D", command=lambda: self.line_operation("duplicate"))
+        edit_menu.add_command(label="Satırı Sil", accelerator="Ctrl+L", command=lambda: self.line_operation("delete"))
+        edit_menu.add_command(label="Satırı Yukarı Taşı", accelerator="Ctrl+Shift+Up", command=lambda: self.line_operation("up"))
+        edit_menu.add_command(label="Satırı Aşağı Taşı", accelerator="Ctrl+Shift+Down", command=lambda: self.line_operation("down"))
+        edit_menu.add_separator()
+        edit_menu.add_command(label="Büyük Dosyada Düzenlemeyi Etkinleştir", command=self.enable_large_file_editing)
 
-        # Arama Menüsü
-        search_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Arama", menu=search_menu)
+    def build_search_menu(self, search_menu):
         search_menu.add_command(label="Bul...", accelerator="Ctrl+F", command=self.find)
         search_menu.add_command(label="Değiştir...", accelerator="Ctrl+H", command=self.replace)
+        search_menu.add_separator()
+        search_menu.add_command(label="Dosyalarda Bul...", accelerator="Ctrl+Shift+F", command=self.find_in_files)
+        search_menu.add_separator()
+        search_menu.add_command(label="Eşleşen Ayraca Git", accelerator="Ctrl+B", command=self.jump_to_bracket)
 
-        # Görünüm Menüsü
-        view_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Görünüm", menu=view_menu)
-        self.word_wrap = tk.BooleanVar(value=False)
+    def build_view_menu(self, view_menu):
         view_menu.add_checkbutton(label="Kelime Sarma", variable=self.word_wrap, command=self.toggle_word_wrap)
-        view_menu.add_command(label="Tema Değiştir", command=sv_ttk.toggle_theme)
+        view_menu.add_checkbutton(label="Girinti Kılavuzları", variable=self.indent_guides,
+                                  command=self.toggle_indent_guides)
+        view_menu.add_command(label="Tema Değiştir", command=self.toggle_theme)
         view_menu.add_checkbutton(label="Otomatik Kaydet", variable=self.auto_save, command=self.toggle_auto_save)
-
-        # Makro Menüsü
-        macro_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Makro", menu=macro_menu)
+        view_menu.add_command(label="Büyük Dosya Eşiği...", command=self.set_large_file_threshold)
+        view_menu.add_command(label="Arama Sonuçları", command=self.toggle_find_results)
+        view_menu.add_command(label="Belge Özeti...", command=self.show_summary)
+        compare_menu = tk.Menu(view_menu, tearoff=0)
+        compare_menu.config(postcommand=lambda: self.populate_compare_menu(compare_menu))
+        view_menu.add_cascade(label="Karşılaştır", menu=compare_menu)
+        view_menu.add_checkbutton(label="Kullanılmayan Sekmeleri Uyut", variable=self.hibernate_tabs)
+        view_menu.add_command(label="Dosya Sonunu Takip Et (tail -f)", command=self.toggle_follow)
+        view_menu.add_separator()
+        view_menu.add_checkbutton(label="Performans Ölçümü", variable=self.perf_enabled, command=self.toggle_performance)
+        view_menu.add_command(label="Performans...", command=self.show_performance)
+
+    def build_macro_menu(self, macro_menu):
         macro_menu.add_command(label="Makro Kaydını Başlat", command=self.start_macro_recording)
         macro_menu.add_command(label="Makro Kaydını Durdur", command=self.stop_macro_recording)
         macro_menu.add_command(label="Makroyu Çalıştır", command=self.run_macro)
+        macro_menu.add_command(label="Birden Çok Kez Çalıştır...", command=self.run_macro_multiple)
+        macro_menu.add_separator()
+        macro_menu.add_command(label="Makroyu Kaydet...", command=self.save_macro)
+        macro_menu.add_command(label="Makro Yükle...", command=self.load_macro)
 
-        # Yardım Menüsü
-        help_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Yardım", menu=help_menu)
+    def build_help_menu(self, help_menu):
         help_menu.add_command(label="Hakkında", command=self.show_about)
 
     def get_current_editor(self):
         current_tab = self.notebook.select()
         if current_tab:
-            return self.notebook.nametowidget(current_tab).editor
+            frame = self.notebook.nametowidget(current_tab)
+            return frame.editor if frame.editor is not None else self.hydrate_tab(frame)
         return None
 
+    def iter_editors(self):
+        # Açılmış sekmelerin editörleri (yer tutucular atlanır)
+        for tab in self.notebook.tabs():
+            editor = self.notebook.nametowidget(tab).editor
+            if editor is not None:
+                yield editor
+
+    def add_placeholder(self, entry, index="end"):
+        # Henüz açılmamış sekme: yalnızca boş bir çerçeve ve oturum bilgisi
+        frame = ttk.Frame(self.notebook)
+        frame.editor = None
+        frame.session_entry = entry
+        self.notebook.insert(index, frame, text=os.path.basename(entry.path))
+        return frame
+
+    def hydrate_tab(self, frame):
+        # Yer tutucunun yerine dosyayı gerçek bir editörde aç ve konumunu geri yükle
+        entry = frame.session_entry
+        index = self.notebook.index(frame)
+        try:
+            size = os.path.getsize(entry.path)
+        except OSError as e:
+            self.notebook.forget(frame)
+            frame.destroy()
+            self.status_var.set(f"{os.path.basename(entry.path)} açılamadı: {e}")
+            return None
+        if size >= self.large_file_threshold:
+            editor = self.open_large_file(entry.path, index)
+        else:
+            editor = self.load_file(entry.path, index)
+        self.notebook.forget(frame)
+        frame.destroy()
+        if editor is None:
+            return None
+        if editor.large_view:
+            editor.large_view.show_line(entry.top - 1)
+        else:
+            def restore_position():
+                editor.text.mark_set("insert", f"{entry.line}.{entry.col}")
+                editor.text.yview(f"{entry.top}.0")
+            editor.when_loaded(restore_position)
+        return editor
+
+    def on_tab_changed(self, event=None):
+        current_tab = self.notebook.select()
+        if not current_tab:
+            return
+        self.completion.close()
+        frame = self.notebook.nametowidget(current_tab)
+        editor = frame.editor if frame.editor is not None else self.hydrate_tab(frame)
+        if editor is not None:
+            editor.last_active = time.monotonic()
+            editor.set_indent_guides(self.indent_guides.get())
+
+    def restore_session(self):
+        tabs, active = load_session()
+        if not tabs:
+            return False
+        frames = [self.add_placeholder(entry) for entry in tabs]
+        self.notebook.select(frames[active])
+        # Etkin sekme hemen açılır ki ilk boyamada içeriği görünsün
+        self.hydrate_tab(frames[active])
+        self.status_var.set(f"Oturum geri yüklendi ({len(tabs)} sekme)")
+        return True
+
+    def save_session(self):
+        # Yalnızca dosyaya bağlı sekmeler kaydedilir; açılmamış sekmeler bilgilerini korur
+        tabs, active = [], 0
+        current_tab = self.notebook.select()
+        for tab in self.notebook.tabs():
+            frame = self.notebook.nametowidget(tab)
+            if frame.editor is None:
+                entry = frame.session_entry
+            elif frame.editor.file_path:
+                entry = frame.editor.session_entry()
+            else:
+                continue
+            if tab == current_tab:
+                active = len(tabs)
+            tabs.append(entry)
+        try:
+            save_session(tabs, active)
+        except OSError as e:
+            messagebox.showerror("Hata", f"Oturum kaydedilemedi:\n{e}")
+
+    def hibernate_idle_tabs(self):
+        # Uzun süredir seçilmeyen, kaydedilmiş sekmeleri yer tutucuya döndürerek belleği boşalt
+        if self.hibernate_tabs.get():
+            now = time.monotonic()
+            current = self.notebook.select()
+            for editor in list(self.iter_editors()):
+                if (str(editor.frame) == current or not editor.file_path or editor._modified
+                        or editor.large_view or editor.follow or editor.loader or now - editor.last_active < HIBERNATE_AFTER_S):
+                    continue
+                # Başka bir bileşen (ör. açık bir Bul penceresi) editörü dinliyorsa dokunma
+                if any(getattr(listener, "__self__", None) is not editor for listener in editor.edit_listeners):
+                    continue
+                index = self.notebook.index(editor.frame)
+                self.add_placeholder(editor.session_entry(), index)
+                self.notebook.forget(editor.frame)
+                editor.close()
+        self.root.after(HIBERNATE_CHECK_MS, self.hibernate_idle_tabs)
+
     def new_file(self, file_path=None):
         # Yeni bir sekme oluştur
         tab_frame = ttk.Frame(self.notebook)
-        editor = EditorTab(self.root, self.notebook, file_path)
+        editor = EditorTab(self.root, self.notebook, file_path, self.word_index)
         # Editor nesnesini frame içine saklayalım
         tab_frame.editor = editor
         editor.frame.pack(expand=1, fill="both")
@@ -307,63 +2301,222 @@ class NotepadPlusPlusApp:
         self.notebook.select(editor.frame)
         self.status_var.set("Yeni dosya oluşturuldu")
 
-    def open_file(self):
-        file_path = filedialog.askopenfilename(filetypes=[("Tüm Dosyalar", "*.*"), ("Metin Dosyaları", "*.txt"), ("Python Dosyaları", "*.py")])
+    def find_editor(self, file_path):
+        # Dosya zaten bir sekmede açıksa o sekmenin editörü (yer tutucuysa açılır)
+        file_path = os.path.abspath(file_path)
+        for tab in self.notebook.tabs():
+            frame = self.notebook.nametowidget(tab)
+            if frame.editor is None:
+                if os.path.abspath(frame.session_entry.path) == file_path:
+                    return self.hydrate_tab(frame)
+            elif frame.editor.file_path and os.path.abspath(frame.editor.file_path) == file_path:
+                return frame.editor
+        return None
+
+    def show_editor_line(self, editor, line, col=0):
+        # 1 tabanlı satıra git ve imleci oraya koy
+        if editor.large_view:
+            editor.large_view.show_line(line - 1, place_cursor=True)
+        else:
+            editor.text.mark_set("insert", f"{line}.{col}")
+            editor.text.see(f"{line}.{col}")
+        editor.text.focus_set()
+
+    def open_file(self, file_path=None, line=None, col=0):
+        if file_path is None:
+            file_path = filedialog.askopenfilename(filetypes=[("Tüm Dosyalar", "*.*"), ("Metin Dosyaları", "*.txt"), ("Python Dosyaları", "*.py")])
         if file_path:
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                tab_frame = ttk.Frame(self.notebook)
-                editor = EditorTab(self.root, self.notebook, file_path)
-                editor.text.delete("1.0", tk.END)
-                editor.text.insert(tk.END, content)
-                editor.highlight_syntax()
-                tab_frame.editor = editor
-                editor.frame.pack(expand=1, fill="both")
-                self.notebook.add(editor.frame, text=os.path.basename(file_path))
+            editor = self.find_editor(file_path)
+            if editor is None:
+                try:
+                    size = os.path.getsize(file_path)
+                except OSError as e:
+                    messagebox.showerror("Hata", f"Dosya açılamadı:\n{e}")
+                    return
+                if size >= self.large_file_threshold:
+                    editor = self.open_large_file(file_path)
+                else:
+                    editor = self.load_file(file_path)
+            else:
                 self.notebook.select(editor.frame)
-                self.status_var.set(f"{os.path.basename(file_path)} dosyası açıldı")
-            except Exception as e:
-                messagebox.showerror("Hata", f"Dosya açılamadı:\n{e}")
+            if editor and line is not None:
+                editor.when_loaded(lambda: self.show_editor_line(editor, line, col))
+
+    def load_file(self, file_path, index="end"):
+        # Dosya arka planda açılır: editör hemen döner, metin parça parça gelir
+        try:
+            # İmza okumadan önce alınır; okuma sırasında değişirse sonraki kontrol yakalar
+            signature = file_signature(file_path)
+            loader = FileLoader(file_path)
+        except Exception as e:
+            messagebox.showerror("Hata", f"Dosya açılamadı:\n{e}")
+            return None
+        editor = EditorTab(self.root, self.notebook, file_path, self.word_index)
+        editor.disk_signature = signature
+        editor.frame.pack(expand=1, fill="both")
+        name = os.path.basename(file_path)
+        self.notebook.insert(index, editor.frame, text=f"{name} %0")
+        self.notebook.select(editor.frame)
+        self.status_var.set(f"{name} açılıyor... (iptal için Esc)")
+        editor.start_loading(loader, lambda fraction: self.notebook.tab(editor.frame, text=f"{name} %{fraction * 100:.0f}"),
+                             lambda error: self.on_file_loaded(editor, error))
+        return editor
+
+    def on_file_loaded(self, editor, error):
+        name = os.path.basename(editor.file_path)
+        if error is not None:
+            self.notebook.forget(editor.frame)
+            editor.close()
+            messagebox.showerror("Hata", f"Dosya açılamadı:\n{error}")
+            return
+        self.notebook.tab(editor.frame, text=name)
+        self.status_var.set(f"{name} dosyası açıldı ({editor.text_format.describe()})")
+
+    def cancel_loading(self):
+        # Açılmakta olan etkin sekmeyi iptal edip kapat
+        current_tab = self.notebook.select()
+        editor = self.notebook.nametowidget(current_tab).editor if current_tab else None
+        if editor is None or editor.loader is None:
+            return
+        name = os.path.basename(editor.file_path)
+        self.notebook.forget(editor.frame)
+        editor.close()
+        self.status_var.set(f"{name} açılışı iptal edildi")
+
+    def open_large_file(self, file_path, index="end"):
+        try:
+            with open(file_path, "rb") as f:
+                text_format = detect_format(f.read(SAMPLE_BYTES), final=False)
+        except OSError as e:
+            messagebox.showerror("Hata", f"Dosya açılamadı:\n{e}")
+            return None
+        if not text_format.byte_oriented:
+            # Büyük dosya modu satırları "\n" baytıyla bulur; UTF-16/32 dosyalar tam açılır
+            return self.load_file(file_path, index)
+        try:
+            large_file = LargeFile(file_path, text_format.encoding)
+        except Exception as e:
+            messagebox.showerror("Hata", f"Dosya açılamadı:\n{e}")
+            return None
+        editor = EditorTab(self.root, self.notebook, file_path, self.word_index)
+        # Pencere satır sonları ve BOM dahil olduğu gibi gösterilip yazılır; biçim bilgi amaçlıdır
+        editor.text_format = text_format
+        editor.disk_signature = file_signature(file_path)
+        editor.journal = None  # Büyük dosya penceresi günlüğe yazılmaz; kayıt durumu window_dirty'de
+        editor.frame.pack(expand=1, fill="both")
+        self.notebook.insert(index, editor.frame, text=os.path.basename(file_path))
+        self.notebook.select(editor.frame)
+        editor.large_view = LargeFileView(editor, large_file, self.status_var.set)
+        editor._modified = False
+        return editor
+
+    def enable_large_file_editing(self):
+        editor = self.get_current_editor()
+        if editor and editor.large_view and not editor.large_view.editable:
+            if messagebox.askyesno("Büyük Dosya", "Bu dosya büyük dosya modunda açıldı. Düzenleme etkinleştirilsin mi?\n"
+                                   "Değişiklikler yalnızca görünen pencerede yapılabilir; pencereyi kaydırmadan önce kaydetmelisiniz."):
+                if editor.large_view.enable_editing():
+                    self.status_var.set("Büyük dosyada düzenleme etkin")
+                else:
+                    messagebox.showwarning("Büyük Dosya", "Görünen bölüm bu kodlamayla diske aynen geri yazılamıyor; "
+                                           "düzenleme etkinleştirilmedi.")
+
+    def set_large_file_threshold(self):
+        value = simpledialog.askinteger("Büyük Dosya Eşiği", "Eşik (MB):",
+                                        initialvalue=self.large_file_threshold // (1024 * 1024), minvalue=1)
+        if value is not None:
+            self.large_file_threshold = value * 1024 * 1024
+            self.status_var.set(f"Büyük dosya eşiği {value} MB olarak ayarlandı")
 
     def save_file(self):
         editor = self.get_current_editor()
         if editor:
-            if editor.file_path:
+            if editor.large_view:
+                if not editor.large_view.editable:
+                    self.status_var.set("Dosya büyük dosya modunda salt okunur açık")
+                    return
                 try:
-                    content = editor.text.get("1.0", tk.END)
-                    with open(editor.file_path, "w", encoding="utf-8") as f:
-                        f.write(content)
+                    editor.large_view.save()
+                    editor.disk_signature = file_signature(editor.file_path)
                     self.status_var.set(f"{os.path.basename(editor.file_path)} kaydedildi")
                 except Exception as e:
                     messagebox.showerror("Hata", f"Kaydedilemedi:\n{e}")
+            elif editor.follow is not None:
+                self.status_var.set("Takip modundaki dosya kaydedilmez")
+            elif editor.loader is not None:
+                self.status_var.set("Dosya hâlâ açılıyor")
+            elif editor.file_path:
+                self.queue_save(editor, editor.file_path)
             else:
                 self.save_as()
 
     def save_as(self):
         editor = self.get_current_editor()
+        if editor and editor.large_view:
+            self.status_var.set("Büyük dosya modunda Farklı Kaydet desteklenmiyor")
+            return
+        if editor and editor.follow is not None:
+            self.status_var.set("Takip modundaki dosya için önce takibi durdurun")
+            return
+        if editor and editor.loader is not None:
+            self.status_var.set("Dosya hâlâ açılıyor")
+            return
         if editor:
             file_path = filedialog.asksaveasfilename(defaultextension=".txt", filetypes=[("Tüm Dosyalar", "*.*"), ("Metin Dosyaları", "*.txt")])
             if file_path:
-                try:
-                    content = editor.text.get("1.0", tk.END)
-                    with open(file_path, "w", encoding="utf-8") as f:
-                        f.write(content)
-                    editor.file_path = file_path
-                    self.notebook.tab("current", text=os.path.basename(file_path))
-                    self.status_var.set(f"{os.path.basename(file_path)} kaydedildi")
-                except Exception as e:
-                    messagebox.showerror("Hata", f"Kaydedilemedi:\n{e}")
+                editor.set_file_path(file_path)
+                self.notebook.tab("current", text=os.path.basename(file_path))
+                self.queue_save(editor, file_path)
+
+    def queue_save(self, editor, file_path, content=None):
+        # Arayüzde yalnızca anlık görüntü alınır; yazma işi arka plandaki yazıcıdadır
+        if content is None:
+            content = editor.document.text()
+        text_format = editor.text_format
+        self.saver.submit(SaveRequest(editor, file_path, content, text_format.encoding, text_format.newline,
+                                      editor.edit_generation, text_format.bom))
+        self.status_var.set(f"{os.path.basename(file_path)} kaydediliyor...")
+
+    def poll_saves(self):
+        for result in self.saver.drain():
+            name = os.path.basename(result.path)
+            if result.error is not None:
+                messagebox.showerror("Hata", f"{name} kaydedilemedi:\n{result.error}")
+                continue
+            result.key.mark_saved(result.path, result.digest, result.lines, result.generation)
+            if result.key.file_path == result.path:
+                result.key.disk_signature = result.signature
+            merged = f", {result.merged} kayıt birleştirildi" if result.merged else ""
+            self.status_var.set(f"{name} kaydedildi ({result.size} bayt, yazma {result.write_time * 1000:.0f} ms, "
+                                f"toplam {result.latency * 1000:.0f} ms{merged})")
+        self.root.after(SAVE_POLL_MS, self.poll_saves)
 
     def close_current_tab(self):
         current_tab = self.notebook.select()
         if current_tab:
             # Değişiklik var mı diye kontrol edilebilir...
+            frame = self.notebook.nametowidget(current_tab)
             self.notebook.forget(current_tab)
+            if frame.editor is None:
+                frame.destroy()
+            else:
+                # Kaydedilmeden kapatılan sekmenin günlüğü de silinir
+                frame.editor.close()
             self.status_var.set("Sekme kapatıldı")
 
-        def exit_app(self):
+    def exit_app(self):
         if messagebox.askyesno("Çıkış", "Çıkmak istediğinize emin misiniz?"):
+            self.save_session()
+            # Kuyruktaki kayıtların bitmesini bekle
+            self.saver.flush(timeout=30)
+            if self.diff_worker is not None:
+                self.diff_worker.close()
+            if self.search_pool is not None:
+                self.search_pool.close()
+            # Düzgün çıkışta kurtarma günlüklerine gerek kalmaz
+            for editor in self.iter_editors():
+                if editor.journal is not None:
+                    editor.journal.discard()
             self.root.quit()
 
     # Düzen İşlemleri
@@ -407,6 +2560,11 @@ class NotepadPlusPlusApp:
             except tk.TclError:
                 pass
 
+    def line_operation(self, name):
+        editor = self.get_current_editor()
+        if editor and not editor.large_view:
+            editor.line_operation(name)
+
     def select_all(self):
         editor = self.get_current_editor()
         if editor:
@@ -417,19 +2575,46 @@ class NotepadPlusPlusApp:
         if editor:
             line = simpledialog.askinteger("Go To Line", "Satır numarası:")
             if line is not None:
-                editor.text.mark_set("insert", f"{line}.0")
-                editor.text.see(f"{line}.0")
+                self.show_editor_line(editor, line)
 
     # Arama İşlemleri
     def find(self):
         editor = self.get_current_editor()
         if editor:
-            FindReplaceDialog(self.root, editor, mode="find")
+            FindReplaceDialog(self.root, editor, mode="find", status=self.status_var.set)
 
     def replace(self):
         editor = self.get_current_editor()
         if editor:
-            FindReplaceDialog(self.root, editor, mode="replace")
+            FindReplaceDialog(self.root, editor, mode="replace", status=self.status_var.set)
+
+    def find_in_files(self):
+        FindInFilesDialog(self.root, self)
+
+    def find_in_files_pool(self):
+        if self.search_pool is None:
+            from findinfiles import SearchPool
+            self.search_pool = SearchPool()
+        return self.search_pool
+
+    def start_find_in_files(self, job):
+        if self.find_results is None:
+            self.find_results = FindResultsPanel(self.root, self)
+        if not self.find_results.winfo_ismapped():
+            self.find_results.pack(side="bottom", fill="x", after=self.status_bar)
+        self.find_results.start(job)
+
+    def cancel_find_in_files(self):
+        if self.find_results:
+            self.find_results.cancel()
+
+    def toggle_find_results(self):
+        if self.find_results is None:
+            return
+        if self.find_results.winfo_ismapped():
+            self.find_results.pack_forget()
+        else:
+            self.find_results.pack(side="bottom", fill="x", after=self.status_bar)
 
     # Görünüm İşlemleri
     def toggle_word_wrap(self):
@@ -440,7 +2625,23 @@ class NotepadPlusPlusApp:
             else:
                 editor.text.config(wrap="none")
 
+    def show_completions(self):
+        # Açık sekmelerdeki kelimelerden imleçteki öneke uyanları listele
+        editor = self.get_current_editor()
+        if editor and not self.completion.open(editor):
+            self.status_var.set("Önerilecek kelime yok")
+
+    def toggle_indent_guides(self):
+        for editor in self.iter_editors():
+            editor.set_indent_guides(self.indent_guides.get())
+
+    def jump_to_bracket(self):
+        editor = self.get_current_editor()
+        if editor and not editor.jump_to_bracket():
+            self.status_var.set("İmleçte eşleşen ayraç yok" if editor.brackets.ready else "Ayraç dizini hazırlanıyor...")
+
     def toggle_auto_save(self):
+        self.schedule_auto_save()
         if self.auto_save.get():
             self.status_var.set("Otomatik kaydetme açık")
         else:
@@ -448,49 +2649,368 @@ class NotepadPlusPlusApp:
 
     # Makro İşlemleri
     def start_macro_recording(self):
-        self.macro_recording = True
-        self.macro_actions = []
+        editor = self.get_current_editor()
+        if not editor or editor.large_view:
+            return
+        if self.macro_recorder is not None:
+            self.macro_editor.set_macro_recorder(None)
+        self.macro_recorder = MacroRecorder()
+        self.macro_editor = editor
+        editor.set_macro_recorder(self.macro_recorder)
         self.status_var.set("Makro kaydı başladı")
 
     def stop_macro_recording(self):
-        self.macro_recording = False
-        self.status_var.set(f"Makro kaydı durduruldu. {len(self.macro_actions)} işlem kaydedildi.")
+        if self.macro_recorder is None:
+            return
+        self.macro_editor.set_macro_recorder(None)
+        self.macro = self.macro_recorder.macro
+        self.macro_recorder = self.macro_editor = None
+        self.status_var.set(f"Makro kaydı durduruldu. {len(self.macro)} işlem kaydedildi.")
 
-    def run_macro(self):
+    def run_macro(self, times=1, until_eof=False):
         editor = self.get_current_editor()
-        if editor:
-            for action in self.macro_actions:
-                # Basit örnek: yalnızca klavye tuşları (keysym) giriliyor
-                event_type, keysym, char = action
-                # Örneğin, 'BackSpace' gibi klavye tuşlarına bağlı işlemler uygulanabilir
-                # Bu kısım genişletilerek daha detaylı yapılabilir.
-                if keysym == "BackSpace":
-                    editor.text.delete("insert-1c")
-                else:
-                    editor.text.insert("insert", char)
-            self.status_var.set("Makro çalıştırıldı")
+        if not editor or editor.large_view or self.macro_recorder is not None or not self.macro:
+            return
+        started = time.perf_counter()
+        try:
+            runs = play_macro(editor, self.macro, times, until_eof)
+        except MacroError as e:
+            messagebox.showerror("Hata", str(e))
+            return
+        editor.text.see("insert")
+        elapsed = time.perf_counter() - started
+        self.status_var.set(f"Makro {runs} kez çalıştırıldı ({elapsed * 1000:.0f} ms)")
+
+    def run_macro_multiple(self):
+        if self.macro:
+            MacroRunDialog(self.root, self)
+
+    def save_macro(self):
+        if not self.macro:
+            self.status_var.set("Kaydedilecek makro yok")
+            return
+        file_path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("Makro Dosyaları", "*.json")])
+        if file_path:
+            try:
+                self.macro.save(file_path)
+                self.status_var.set(f"Makro {os.path.basename(file_path)} dosyasına kaydedildi")
+            except OSError as e:
+                messagebox.showerror("Hata", f"Makro kaydedilemedi:\n{e}")
+
+    def load_macro(self):
+        file_path = filedialog.askopenfilename(filetypes=[("Makro Dosyaları", "*.json"), ("Tüm Dosyalar", "*.*")])
+        if file_path:
+            try:
+                self.macro = Macro.load(file_path)
+                self.status_var.set(f"Makro yüklendi ({len(self.macro)} işlem)")
+            except (OSError, MacroError) as e:
+                messagebox.showerror("Hata", f"Makro yüklenemedi:\n{e}")
+
+    def show_summary(self):
+        # Belge istatistikleri Tk'ya dokunmadan belge modelinden hesaplanır
+        editor = self.get_current_editor()
+        if not editor:
+            return
+        stats = editor.document.stats()
+        scope = "\n(Büyük dosya modunda yalnızca yüklü pencere)" if editor.large_view else ""
+        messagebox.showinfo("Belge Özeti", f"{editor.file_path or 'Yeni Dosya'}\n\n"
+                            f"Karakter: {stats['chars']}\nKelime: {stats['words']}\nSatır: {stats['lines']}{scope}")
+
+    def get_diff_worker(self):
+        if self.diff_worker is None:
+            self.diff_worker = DiffWorker()
+        return self.diff_worker
+
+    def populate_compare_menu(self, menu):
+        # Karşılaştırılabilecek sekmeler menü her açıldığında yeniden listelenir
+        menu.delete(0, tk.END)
+        menu.add_command(label="Diskteki Sürümle", command=self.compare_with_disk)
+        current = self.notebook.select()
+        others = [tab for tab in self.notebook.tabs() if tab != current]
+        if others:
+            menu.add_separator()
+        for tab in others:
+            menu.add_command(label=self.notebook.tab(tab, "text"),
+                             command=lambda tab=tab: self.compare_with_tab(self.notebook.nametowidget(tab)))
+
+    def compare_with_disk(self):
+        # Sekmedeki metin ile dosyanın diskteki hali
+        editor = self.get_current_editor()
+        if not editor:
+            return
+        if not editor.file_path or editor.large_view or editor.loader:
+            self.status_var.set("Dosya henüz kaydedilmedi" if not editor.file_path else
+                                "Büyük dosya modundaki sekmeler karşılaştırılamaz" if editor.large_view else
+                                "Dosya hâlâ açılıyor")
+            return
+        try:
+            content, _ = read_text(editor.file_path)
+        except (OSError, UnicodeDecodeError) as e:
+            messagebox.showerror("Hata", f"Dosya okunamadı:\n{e}")
+            return
+        name = os.path.basename(editor.file_path)
+        CompareView(self.root, self, CompareSide(f"{name} (diskteki)", lines=content.split("\n")),
+                    CompareSide(f"{name} (düzenlenen)", editor))
+
+    def compare_with_tab(self, frame):
+        editor = self.get_current_editor()
+        other = frame.editor if frame.editor is not None else self.hydrate_tab(frame)
+        if not editor or not other:
+            return
+        if editor.large_view or other.large_view:
+            self.status_var.set("Büyük dosya modundaki sekmeler karşılaştırılamaz")
+            return
+        # Yer tutucudan yeni açılan sekme önce arka planda yüklenir
+        editor.when_loaded(lambda: other.when_loaded(lambda: self.open_compare(editor, other)))
+
+    def open_compare(self, editor, other):
+        if not (editor.text.winfo_exists() and other.text.winfo_exists()):
+            return  # Yükleme sırasında sekmelerden biri kapatıldı
+        CompareView(self.root, self, CompareSide(os.path.basename(editor.file_path or "Yeni Dosya"), editor),
+                    CompareSide(os.path.basename(other.file_path or "Yeni Dosya"), other))
+
+    def toggle_performance(self):
+        # Ölçüm yalnızca bayrakla açılıp kapanır; sarmalayıcılar her zaman yerindedir
+        MONITOR.enabled = self.perf_enabled.get()
+        if MONITOR.enabled:
+            if self._perf_binding is None:
+                self._perf_binding = self.root.bind_all("<KeyPress>", self._perf_on_key, add="+")
+            self.perf_label.pack(side="right", padx=5)
+            self.refresh_perf_status()
+            self.status_var.set("Performans ölçümü açık")
+        else:
+            self._remove_perf_binding()
+            if self._perf_job is not None:
+                self.root.after_cancel(self._perf_job)
+                self._perf_job = None
+            self.perf_label.pack_forget()
+            self.status_var.set("Performans ölçümü kapalı")
+
+    def _remove_perf_binding(self):
+        # unbind_all sıradaki bütün "all" bağlarını siler; yalnızca ölçüm bağının satırı çıkarılır
+        if self._perf_binding is None:
+            return
+        script = self.root.bind_all("<KeyPress>")
+        kept = [line for line in script.split("\n") if self._perf_binding not in line]
+        self.root.tk.call("bind", "all", "<KeyPress>", "\n".join(kept))
+        self.root.deletecommand(self._perf_binding)
+        self._perf_binding = None
+
+    def _perf_on_key(self, event=None):
+        MONITOR.key_pressed(self.root)
+
+    def perf_context(self):
+        # Yavaş işlem anında etkin sekmenin boyutu (karakter, satır); yer tutucular açılmaz
+        current_tab = self.notebook.select()
+        editor = self.notebook.nametowidget(current_tab).editor if current_tab else None
+        if editor is None:
+            return None
+        return len(editor.document), editor.document.line_count
+
+    def refresh_perf_status(self):
+        self._perf_job = None
+        keystroke = MONITOR.histograms.get(KEYSTROKE)
+        readout = f"tuş p95 {keystroke.percentile(95):.0f} ms" if keystroke else "tuş -"
+        if MONITOR.slow_log:
+            _, name, ms, _ = MONITOR.slow_log[-1]
+            readout += f" | son yavaş: {name.rpartition('.')[2]} {ms:.0f} ms"
+        self.perf_var.set(readout)
+        self._perf_job = self.root.after(PERF_REFRESH_MS, self.refresh_perf_status)
+
+    def show_performance(self):
+        if self.perf_panel is not None:
+            self.perf_panel.lift()
+            return
+        self.perf_panel = PerformancePanel(self.root, self)
 
     def show_about(self):
+        import datetime
         messagebox.showinfo("Hakkında", f"PyNotepad++\n\nGeliştirilme Tarihi: {datetime.date.today()}\nNotepad++ benzeri özellikler Tkinter ile uygulanmıştır.")
 
-    def start_auto_save(self):
+    def schedule_auto_save(self):
+        # Otomatik kaydetme Tk zamanlayıcısıyla arayüz iş parçacığında çalışır
+        if self._auto_save_job is not None:
+            self.root.after_cancel(self._auto_save_job)
+            self._auto_save_job = None
         if self.auto_save.get():
-            self.auto_save_thread = threading.Thread(target=self.auto_save_loop)
-            self.auto_save_thread.daemon = True  # Uygulama kapanınca thread de kapanır
-            self.auto_save_thread.start()
-
-    def auto_save_loop(self):
-        while True:
-            time.sleep(self.auto_save_interval.get() * 60)  # Dakika cinsinden
-            editor = self.get_current_editor()
-            if editor and editor.file_path:
+            self._auto_save_job = self.root.after(self.auto_save_interval.get() * 60 * 1000, self.auto_save_tick)
+
+    def auto_save_tick(self):
+        # Değişmiş bütün sekmeleri kaydet; içeriği son kayıtla aynı olanları atla
+        self._auto_save_job = None
+        for editor in self.iter_editors():
+            if not editor._modified or not editor.file_path or editor.large_view:
+                continue
+            content = editor.document.text()
+            if content_hash(content) == editor.saved_hash:
+                # Geri alınarak kayıtlı haline dönmüş
+                editor.mark_saved(editor.file_path, editor.saved_hash, content.count("\n") + 1, editor.edit_generation)
+                continue
+            self.queue_save(editor, editor.file_path, content)
+        self.schedule_auto_save()
+
+    def flush_journals(self):
+        for editor in self.iter_editors():
+            if editor.journal is not None:
                 try:
-                    content = editor.text.get("1.0", tk.END)
-                    with open(editor.file_path, "w", encoding="utf-8") as f:
-                        f.write(content)
-                    self.status_var.set(f"{os.path.basename(editor.file_path)} otomatik olarak kaydedildi")
-                except Exception as e:
-                    messagebox.showerror("Hata", f"Otomatik kaydetme sırasında hata oluştu:\n{e}")
+                    editor.journal.flush()
+                except OSError as e:
+                    self.status_var.set(f"Kurtarma günlüğü yazılamadı: {e}")
+        self.root.after(JOURNAL_FLUSH_MS, self.flush_journals)
+
+    def poll_file_changes(self):
+        # İzlenen yollar açık sekmelerle eşitlenir (açılan, kapatılan, uyutulan ve farklı
+        # kaydedilen sekmeler), ardından biriken değişiklikler sekme sekme işlenir
+        self.watcher.set_paths(editor.file_path for editor in self.iter_editors() if editor.file_path)
+        changed = self.watcher.drain() | self._changed_paths
+        self._changed_paths = set()
+        if changed:
+            for editor in list(self.iter_editors()):
+                if editor.file_path and os.path.abspath(editor.file_path) in changed:
+                    self.check_disk_change(editor)
+        self.root.after(WATCH_POLL_MS, self.poll_file_changes)
+
+    def check_disk_change(self, editor):
+        path = editor.file_path
+        name = os.path.basename(path)
+        if self.saver.is_pending(editor) or editor.loader is not None:
+            # Bildirim büyük olasılıkla kendi kaydımızdan (ya da dosya hâlâ açılıyor); sonra yeniden bakılır
+            self._changed_paths.add(os.path.abspath(path))
+            return
+        if editor.follow is not None:
+            self.follow_tail(editor)
+            return
+        signature = file_signature(path)
+        if signature == editor.disk_signature:
+            return
+        editor.disk_signature = signature
+        if signature is None:
+            self.status_var.set(f"{name} diskten silindi ya da taşındı")
+            return
+        if editor.large_view:
+            if editor.large_view.window_dirty:
+                self.status_var.set(f"{name} başka bir program tarafından değiştirildi; kaydetmek değişikliğin üzerine yazar")
+            else:
+                editor.large_view.reload()
+            return
+        try:
+            content, text_format = read_text(path)
+        except (OSError, UnicodeDecodeError) as e:
+            self.status_var.set(f"{name} yeniden okunamadı: {e}")
+            return
+        if content_hash(content) == editor.saved_hash:
+            return  # Yalnızca zaman damgası değişmiş ya da aynı içerik yeniden yazılmış
+        if editor._modified:
+            self.notebook.select(editor.frame)
+            if not messagebox.askyesno("Dosya Değişti", f"{name} başka bir program tarafından değiştirildi.\n"
+                                       "Diskteki sürüm yüklensin mi? Kaydedilmemiş değişiklikleriniz kaybolur."):
+                self.status_var.set(f"{name}: diskteki değişiklik yok sayıldı; kaydetmek onun üzerine yazar")
+                return
+        self.reload_editor(editor, content, text_format)
+
+    def reload_editor(self, editor, content, text_format):
+        # İmleç ve görünen ilk satır korunarak diskteki içerik yüklenir
+        insert = editor.text.index("insert")
+        top = editor.text.index("@0,0")
+        editor.text_format = text_format
+        editor.load_text(content)
+        editor.text.mark_set("insert", insert)
+        editor.text.yview(top)
+        self.status_var.set(f"{os.path.basename(editor.file_path)} diskten yeniden yüklendi")
+
+    def toggle_follow(self):
+        # Takip modu: dosya baştan okunur, sonra yalnızca yeni eklenen baytlar sona yazılır.
+        # Sekme bu sırada salt okunurdur.
+        editor = self.get_current_editor()
+        if not editor:
+            return
+        name = os.path.basename(editor.file_path or "")
+        if editor.follow is not None:
+            editor.follow = None
+            editor.text.config(state="normal")
+            editor.mark_clean(editor.document.text())
+            self.status_var.set(f"{name} takibi durduruldu")
+            return
+        if not editor.file_path or editor.large_view or editor.loader:
+            self.status_var.set("Takip modu yalnızca diske kayıtlı, normal modda açılmış dosyalarda kullanılabilir")
+            return
+        if editor._modified and not messagebox.askyesno("Takip", "Kaydedilmemiş değişiklikler atılacak. Devam edilsin mi?"):
+            return
+        if self.start_follow(editor):
+            self.status_var.set(f"{name} takip ediliyor")
+
+    def start_follow(self, editor):
+        reader = TailReader(editor.file_path, 0, editor.text_format.encoding)
+        try:
+            result = reader.read(-1)
+        except OSError as e:
+            result = None
+            self.status_var.set(f"Dosya okunamadı: {e}")
+        if result is None:
+            editor.follow = None
+            editor.text.config(state="normal")
+            return False
+        editor.follow = reader
+        editor.disk_signature = reader.signature
+        editor.text.config(state="normal")
+        editor.load_text(result[0])
+        editor.text.config(state="disabled")
+        editor.text.see("end")
+        return True
+
+    def follow_tail(self, editor):
+        try:
+            result = editor.follow.read(FOLLOW_READ_BYTES)
+        except OSError as e:
+            self.status_var.set(f"{os.path.basename(editor.file_path)} okunamadı: {e}")
+            return
+        if result is None:
+            # Dosya kısaldı ya da yerine yenisi geldi (günlük döndürme): baştan okunur
+            if self.start_follow(editor):
+                self.status_var.set(f"{os.path.basename(editor.file_path)} yeniden başladı; takip sürüyor")
+            return
+        chunk, more = result
+        editor.disk_signature = editor.follow.signature
+        if chunk:
+            editor.append_text(chunk)
+        if more:
+            # Okunmamış bayt kaldı; arayüzü kilitlememek için kalan kısım sonraki turda okunur
+            self._changed_paths.add(os.path.abspath(editor.file_path))
+
+    def offer_recovery(self):
+        # Önceki oturum beklenmedik şekilde kapandıysa günlükleri yeniden oynat
+        journals = find_journals()
+        if not journals:
+            return
+        if not messagebox.askyesno("Kurtarma", f"Önceki oturumdan kaydedilmemiş değişiklikler bulundu ({len(journals)} sekme).\n"
+                                   "Geri yüklensin mi?"):
+            for journal_path in journals:
+                discard_journal(journal_path)
+            return
+        restored = 0
+        errors = []
+        for journal_path in journals:
+            try:
+                file_path, base, content, text_format = replay_journal(journal_path)
+            except (OSError, JournalError) as e:
+                errors.append(str(e))
+                continue
+            self.new_file(file_path)
+            editor = self.get_current_editor()
+            # Temel metin temiz hal olarak yüklenir; kurtarılan metin geri alınabilir bir düzenleme olur
+            editor.text_format = text_format
+            editor.load_text(base)
+            if file_path:
+                editor.disk_signature = file_signature(file_path)
+            editor.text.delete("1.0", tk.END)
+            editor.text.insert("1.0", content)
+            name = os.path.basename(file_path) if file_path else "Yeni Dosya"
+            self.notebook.tab(editor.frame, text=f"{name} (kurtarıldı)")
+            discard_journal(journal_path)
+            restored += 1
+        self.status_var.set(f"{restored} sekme kurtarıldı")
+        if errors:
+            messagebox.showwarning("Kurtarma", "Bazı günlükler uygulanamadı:\n" + "\n".join(errors))
 
 
 def bind_global_shortcuts(app):
@@ -501,14 +3021,23 @@ def bind_global_shortcuts(app):
     app.root.bind("<Control-w>", lambda e: app.close_current_tab())
     app.root.bind("<Control-f>", lambda e: app.find())
     app.root.bind("<Control-h>", lambda e: app.replace())
+    app.root.bind("<Control-Shift-F>", lambda e: app.find_in_files())
     app.root.bind("<Control-g>", lambda e: app.go_to_line())
+    app.root.bind("<Control-space>", lambda e: app.show_completions())
     app.root.bind("<Control-a>", lambda e: app.select_all())
     app.root.bind("<Control-z>", lambda e: app.undo())
     app.root.bind("<Control-y>", lambda e: app.redo())
+    app.root.bind("<Escape>", lambda e: app.cancel_loading())
 
 
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = NotepadPlusPlusApp(root)
+    # "spawn" ile başlayan işçi süreçleri (Dosyalarda Bul, karşılaştırma) bu dosyayı
+    # __mp_main__ adıyla içe aktarır; pencere yalnızca asıl süreçte açılır
+    with STARTUP.phase("tk_init"):
+        root = tk.Tk()
+    app = NotepadPlusPlusApp(root, STARTUP, profile_target(sys.argv))
+    if PERF_FLAG in sys.argv[1:]:
+        app.perf_enabled.set(True)
+        app.toggle_performance()
     bind_global_shortcuts(app)
     root.mainloop()
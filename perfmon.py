@@ -0,0 +1,165 @@
+# Olay gecikmesi ölçümü (isteğe bağlı)
+# Tkinter bütün Python geri çağrılarını (bind, command, after, after_idle) CallWrapper
+# üzerinden çalıştırır; install() bu sınıfı süre ölçen bir alt sınıfla değiştirir. Ölçüm
+# kapalıyken tek maliyet bir bayrak kontrolüdür. Açıkken her işleyicinin süresi kendi
+# histogramına, bütçeyi aşanlar yavaş işlem günlüğüne ve son olaylar Chrome trace için
+# sınırlı bir kuyruğa yazılır.
+import collections
+import json
+import time
+import tkinter
+
+DEFAULT_BUDGET_MS = 16.0   # Bir kare süresi; bunu aşan işleyiciler günlüğe yazılır
+TRACE_EVENTS = 100000      # Chrome trace için tutulan en fazla olay
+SLOW_LOG_SIZE = 500
+# Histogram kova üst sınırları (ms): 0.05, 0.1, 0.2, ... ~1.6 sn; sonuncusundan büyükler taşma kovasına
+BUCKETS_MS = tuple(0.05 * 2 ** i for i in range(16))
+KEYSTROKE = "tuş→boşta"    # Tuş vuruşundan Tk'nın boşta kalmasına kadar geçen süre
+
+
+class LatencyHistogram:
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, ms):
+        i = 0
+        while i < len(BUCKETS_MS) and ms > BUCKETS_MS[i]:
+            i += 1
+        self.counts[i] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def percentile(self, p):
+        # Yüzdeliğin düştüğü kovanın üst sınırı (en büyük değeri aşmaz)
+        if not self.count:
+            return 0.0
+        target = p / 100 * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= target and count:
+                return min(BUCKETS_MS[i], self.max) if i < len(BUCKETS_MS) else self.max
+        return self.max
+
+    def to_json(self):
+        return {"count": self.count, "total_ms": round(self.total, 3), "max_ms": round(self.max, 3),
+                "p50_ms": round(self.percentile(50), 3), "p95_ms": round(self.percentile(95), 3),
+                "p99_ms": round(self.percentile(99), 3), "buckets_ms": list(BUCKETS_MS), "counts": self.counts}
+
+
+class PerfMonitor:
+    def __init__(self):
+        self.enabled = False
+        self.budget_ms = DEFAULT_BUDGET_MS
+        self.context = None  # Yavaş işlem anındaki tampon boyutu için: context() → (karakter, satır)
+        self.reset()
+
+    def reset(self):
+        self.origin = time.perf_counter()
+        self.histograms = collections.defaultdict(LatencyHistogram)
+        self.slow_log = collections.deque(maxlen=SLOW_LOG_SIZE)
+        self.trace = collections.deque(maxlen=TRACE_EVENTS)  # (ad, başlangıç, süre); saniye
+        self._key_started = None
+
+    def record(self, name, start, end):
+        ms = (end - start) * 1000
+        self.histograms[name].add(ms)
+        self.trace.append((name, start, end - start))
+        if ms > self.budget_ms:
+            size = None
+            if self.context is not None:
+                try:
+                    size = self.context()
+                except Exception:
+                    size = None
+            self.slow_log.append((time.time(), name, ms, size))
+
+    def key_pressed(self, widget):
+        # Tuş vuruşu: ilk tuştan sonraki ilk boşta anına kadar geçen süre ölçülür;
+        # boşta olmadan gelen tuşlar aynı ölçüme katılır
+        if not self.enabled or self._key_started is not None:
+            return
+        self._key_started = time.perf_counter()
+        widget.after_idle(self._perf_key_idle)
+
+    def _perf_key_idle(self):
+        if self._key_started is None:
+            return
+        end = time.perf_counter()
+        self.record(KEYSTROKE, self._key_started, end)
+        self._key_started = None
+
+    def summary(self):
+        # Toplam süreye göre sıralı (ad, histogram) listesi
+        return sorted(self.histograms.items(), key=lambda item: item[1].total, reverse=True)
+
+    def to_json(self):
+        return {
+            "budget_ms": self.budget_ms,
+            "duration_s": round(time.perf_counter() - self.origin, 3),
+            "handlers": {name: hist.to_json() for name, hist in self.summary()},
+            "slow": [{"time": round(at, 3), "handler": name, "ms": round(ms, 3),
+                      "buffer_chars": size[0] if size else None, "buffer_lines": size[1] if size else None}
+                     for at, name, ms, size in self.slow_log],
+        }
+
+    def write_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_json(), f, indent=2, ensure_ascii=False)
+
+    def write_chrome_trace(self, path):
+        # chrome://tracing ya da Perfetto ile açılabilen "tamamlanmış olay" biçimi
+        events = [{"name": name, "cat": "tk", "ph": "X", "pid": 1, "tid": 1,
+                   "ts": round((start - self.origin) * 1e6, 1), "dur": round(duration * 1e6, 1)}
+                  for name, start, duration in self.trace if start >= self.origin]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+MONITOR = PerfMonitor()
+
+
+def handler_name(func):
+    # Okunabilir işleyici adı; after() geri çağrıları tkinter'in callit sarmalayıcısının
+    # kapanışındaki asıl fonksiyonla adlandırılır
+    prefix = ""
+    code = getattr(func, "__code__", None)
+    if code is not None and code.co_name == "callit" and "func" in code.co_freevars:
+        func = func.__closure__[code.co_freevars.index("func")].cell_contents
+        prefix = "after:"
+    name = getattr(func, "__qualname__", None) or type(func).__name__
+    return prefix + name
+
+
+_CallWrapper = tkinter.CallWrapper
+
+
+class _TimedCallWrapper(_CallWrapper):
+    def __call__(self, *args):
+        if not MONITOR.enabled:
+            return _CallWrapper.__call__(self, *args)
+        name = self.__dict__.get("name")
+        if name is None:
+            # Ölçümün kendi geri çağrıları ("_perf" ile başlayan metotlar) ölçülmez
+            name = handler_name(self.func)
+            self.name = name = "" if name.rpartition(".")[2].startswith("_perf") else name
+        if not name:
+            return _CallWrapper.__call__(self, *args)
+        start = time.perf_counter()
+        try:
+            return _CallWrapper.__call__(self, *args)
+        finally:
+            MONITOR.record(name, start, time.perf_counter())
+
+
+def install():
+    # Tk kökü ve widget'lar oluşturulmadan önce çağrılmalı; daha önce kaydedilmiş
+    # geri çağrılar ölçülmez
+    tkinter.CallWrapper = _TimedCallWrapper
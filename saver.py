@@ -0,0 +1,157 @@
+# Arka planda, atomik dosya kaydı
+# Arayüz iş parçacığı yalnızca metnin bir anlık görüntüsünü alıp kuyruğa bırakır;
+# tek bir yazıcı iş parçacığı kodlama, geçici dosyaya yazma, fsync ve os.replace işlerini yapar.
+import hashlib
+import os
+import queue
+import stat
+import tempfile
+import threading
+import time
+
+from textfile import encode_text
+from watcher import file_signature
+
+# Yeni oluşturulan dosyalar için varsayılan izinler (umask uygulanmış 0o666)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def content_hash(text):
+    # Sekme içeriğinin özeti; son kayıttan beri gerçekten değişip değişmediğini anlamak için
+    return hashlib.sha1(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def atomic_write(path, data):
+    # Aynı klasörde geçici dosyaya yaz, diske zorla ve tek adımda yerine koy;
+    # yazma yarıda kalırsa eski dosya bozulmadan kalır
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".notep-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    if hasattr(os, "O_DIRECTORY"):
+        # Yeniden adlandırmanın da kalıcı olması için klasörü fsync et
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+class SaveRequest:
+    def __init__(self, key, path, text, encoding="utf-8", newline="\n", generation=None, bom=b""):
+        # key: aynı sekmenin kuyrukta bekleyen kayıtlarını birleştirmek için kullanılır
+        # generation: anlık görüntü alındığındaki düzenleme sayacı (sonuçla geri döner)
+        self.key = key
+        self.path = path
+        self.text = text
+        self.encoding = encoding
+        self.newline = newline
+        self.bom = bom
+        self.generation = generation
+        self.queued_at = time.perf_counter()
+
+
+class SaveResult:
+    def __init__(self, request, error=None, size=0, write_time=0.0):
+        self.key = request.key
+        self.path = request.path
+        self.generation = request.generation
+        self.digest = None   # Yazılan metnin content_hash değeri
+        self.lines = 0       # Yazılan metnin satır sayısı
+        self.signature = None  # Yazmadan hemen sonraki file_signature (kendi kaydımızı dış değişiklikten ayırmak için)
+        self.error = error
+        self.size = size
+        self.write_time = write_time
+        self.latency = time.perf_counter() - request.queued_at
+        self.merged = 0  # Bu kayda katılan (atlanan) eski istek sayısı
+
+
+class BackgroundSaver:
+    def __init__(self):
+        self.results = queue.Queue()
+        self._pending = {}   # key → (istek, birleştirilen istek sayısı); ekleme sırası korunur
+        self._busy = False
+        self._unreported = {}  # key → sonucu henüz drain ile alınmamış kayıt sayısı
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, request):
+        with self._cond:
+            previous = self._pending.pop(request.key, None)
+            merged = previous[1] + 1 if previous else 0
+            if previous:
+                # Bekleyen eski kaydın yerine yenisi yazılır, ama ilk istek zamanı korunur
+                request.queued_at = previous[0].queued_at
+            else:
+                self._unreported[request.key] = self._unreported.get(request.key, 0) + 1
+            self._pending[request.key] = (request, merged)
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._busy = False
+                    self._cond.notify_all()
+                    self._cond.wait()
+                key = next(iter(self._pending))
+                request, merged = self._pending.pop(key)
+                self._busy = True
+            started = time.perf_counter()
+            try:
+                data = encode_text(request.text, request.encoding, request.newline, request.bom)
+                atomic_write(request.path, data)
+                result = SaveResult(request, size=len(data), write_time=time.perf_counter() - started)
+            except Exception as e:
+                result = SaveResult(request, error=e, write_time=time.perf_counter() - started)
+            result.merged = merged
+            if result.error is None:
+                result.signature = file_signature(request.path)
+                result.digest = content_hash(request.text)
+                result.lines = request.text.count("\n") + 1
+            self.results.put(result)
+
+    def pending(self):
+        with self._cond:
+            return len(self._pending) + (1 if self._busy else 0)
+
+    def is_pending(self, key):
+        # key için kuyrukta, yazılmakta ya da sonucu alınmayı bekleyen kayıt var mı
+        with self._cond:
+            return key in self._unreported
+
+    def flush(self, timeout=None):
+        # Bekleyen bütün kayıtlar bitene kadar bekle (ör. çıkışta)
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def drain(self):
+        items = []
+        try:
+            while True:
+                items.append(self.results.get_nowait())
+        except queue.Empty:
+            pass
+        with self._cond:
+            for result in items:
+                count = self._unreported.pop(result.key, 1) - 1
+                if count:
+                    self._unreported[result.key] = count
+        return items
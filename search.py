@@ -0,0 +1,176 @@
+# Notep arama motoru (Tk bağımsız)
+# Eşleşmeler (satır, sütun) konumlarına göre sıralı dizilerde tutulur; tarama
+# zaman dilimleriyle ilerler ve düzenlemeler yalnızca etkilenen bölgeyi yeniden tarar.
+import bisect
+import re
+import time
+
+SCAN_CHUNK_CHARS = 256 * 1024  # Tarama bu kadar karakter ilerledikçe çağırana süre kontrolü için döner
+# Satır sonuyla eşleşebilen regex öğeleri: \n, \s, \W, \D, [^...], \x0a ve (?s)
+_SPANS_LINES_RE = re.compile(r"\\[nsWD]|\\x0[aA]|\[\^|\(\?[a-zA-Z]*s")
+
+
+class SearchQuery:
+    def __init__(self, pattern, regex=False, case_sensitive=True, whole_word=False):
+        # Desen sorgu başına bir kez derlenir; geçersiz regex re.error fırlatır
+        self.pattern = pattern
+        self.is_regex = regex
+        self.case_sensitive = case_sensitive
+        self.whole_word = whole_word
+        source = pattern if regex else re.escape(pattern)
+        if whole_word:
+            source = r"\b(?:" + source + r")\b"
+        flags = re.MULTILINE if case_sensitive else re.MULTILINE | re.IGNORECASE
+        self.regex = re.compile(source, flags)
+        # Eşleşme birden çok satıra yayılabilir mi; değilse düzenlemede yalnızca değişen satırlar taranır
+        self.spans_lines = "\n" in pattern or (regex and _SPANS_LINES_RE.search(pattern) is not None)
+
+    def expand(self, match, replacement):
+        # Regex modunda \1, \g<ad> gibi grup başvuruları açılır
+        return match.expand(replacement) if self.is_regex else replacement
+
+    def match_span(self, document, start, end):
+        # start..end ((satır, sütun)) aralığı tam olarak bir eşleşmeyse eşleşme, değilse None.
+        # Değiştir düğmesi ve makro aynı kontrolü kullanır: desen seçimin satırları içinde
+        # denenir, böylece \b, ^, $ ve ileri/geri bakışlar seçimin dışını da görür.
+        if start >= end:
+            return None
+        block = document.get_lines(start[0], end[0])
+        match = self.regex.match(block, start[1])
+        if match is None or match.end() != document.offset(*end) - document.line_start(start[0]):
+            return None
+        return match
+
+    def iter_matches(self, text, first_line=1, pos=0, endpos=None):
+        # ((satır, sütun), (satır, sütun), eşleşme) üçlüleri üretir. Tek bir finditer metnin
+        # tamamını görür (parçalara kesmek sınırı aşan eşleşmeleri kaçırırdı); her
+        # SCAN_CHUNK_CHARS ilerlemede ve sonda None verilir ki çağıran süre sınırını kontrol edebilsin.
+        endpos = len(text) if endpos is None else endpos
+        line = first_line + text.count("\n", 0, pos)
+        line_start = text.rfind("\n", 0, pos) + 1
+        last = pos
+        checkpoint = pos + SCAN_CHUNK_CHARS
+        for match in self.regex.finditer(text, pos, endpos):
+            start, end = match.span()
+            if start >= checkpoint:
+                yield None
+                checkpoint = start + SCAN_CHUNK_CHARS
+            if start == end:
+                continue
+            newlines = text.count("\n", last, start)
+            if newlines:
+                line += newlines
+                line_start = text.rfind("\n", last, start) + 1
+            last = start
+            newlines = text.count("\n", start, end)
+            if newlines:
+                end_pos = (line + newlines, end - text.rfind("\n", start, end) - 1)
+            else:
+                end_pos = (line, end - line_start)
+            yield (line, start - line_start), end_pos, match
+        yield None
+
+
+class SearchEngine:
+    def __init__(self, query):
+        self.query = query
+        self.starts = []  # Sıralı (satır, sütun) başlangıçları
+        self.ends = []
+        self._scan = None
+
+    @property
+    def scanning(self):
+        return self._scan is not None
+
+    def begin(self, text, first_line=1):
+        self.starts = []
+        self.ends = []
+        self._scan = self.query.iter_matches(text, first_line)
+
+    def step(self, budget):
+        # budget saniye boyunca tarar; tarama bittiyse True döner
+        if self._scan is None:
+            return True
+        deadline = time.perf_counter() + budget
+        starts, ends = self.starts, self.ends
+        for item in self._scan:
+            if item is None:
+                if time.perf_counter() >= deadline:
+                    return False
+                continue
+            starts.append(item[0])
+            ends.append(item[1])
+            if len(starts) & 1023 == 0 and time.perf_counter() >= deadline:
+                return False
+        self._scan = None
+        return True
+
+    def cancel(self):
+        self._scan = None
+
+    def __len__(self):
+        return len(self.starts)
+
+    def next_after(self, pos):
+        # pos konumunda veya sonrasında başlayan ilk eşleşmenin sırası (sona gelince başa sarar)
+        if not self.starts:
+            return None
+        i = bisect.bisect_left(self.starts, pos)
+        return i if i < len(self.starts) else 0
+
+    def previous_before(self, pos):
+        if not self.starts:
+            return None
+        i = bisect.bisect_left(self.starts, pos) - 1
+        return i if i >= 0 else len(self.starts) - 1
+
+    def in_lines(self, first, last):
+        # first..last satırlarında başlayan eşleşmelerin sıra aralığı
+        return bisect.bisect_left(self.starts, (first, 0)), bisect.bisect_left(self.starts, (last + 1, 0))
+
+    def replacements(self, text, replacement, first_line=1):
+        # Tümünü Değiştir için (başlangıç, bitiş, yeni metin) listesi; belge sırasıyla
+        return [(item[0], item[1], self.query.expand(item[2], replacement))
+                for item in self.query.iter_matches(text, first_line) if item is not None]
+
+    def apply_edit(self, first, last, delta, document):
+        # Düzenlemeden önceki first..last satırları şimdi document'ta first..last+delta satırları.
+        # Düzenlemeye uzanan eski eşleşmeler de çıkarılıp yeniden aranır. Tek satırlık desenlerde
+        # yalnızca bu satırlar taranır; satır aşabilenlerde tarama önceki eşleşmenin sonundan
+        # başlar ve bulunan bir eşleşme düzenlemeden sonraki eski bir eşleşmeyle çakışana kadar sürer.
+        lo, hi = self.in_lines(first, last)
+        while lo > 0 and self.ends[lo - 1][0] >= first:
+            lo -= 1
+        if delta:
+            self.starts[hi:] = [(line + delta, col) for line, col in self.starts[hi:]]
+            self.ends[hi:] = [(line + delta, col) for line, col in self.ends[hi:]]
+        new_last = last + delta
+        new_starts, new_ends = [], []
+        if not self.query.spans_lines:
+            scan_first = min(first, self.starts[lo][0]) if lo < hi else first
+            for item in self.query.iter_matches(document.get_lines(scan_first, new_last), scan_first):
+                if item is not None:
+                    new_starts.append(item[0])
+                    new_ends.append(item[1])
+        else:
+            # Düzenlemeden önce biten eşleşme de (açgözlü tekrar ya da ileri bakışla) düzenlenen
+            # metne bakmış olabilir; düzenlemeden önceki bir eşleşme daha yeniden aranır
+            if lo:
+                lo -= 1
+            pos = document.offset(*self.ends[lo - 1]) if lo else 0
+            for item in self.query.iter_matches(document.text(), 1, pos):
+                if item is None:
+                    continue
+                start, end, _ = item
+                if start[0] > new_last:
+                    # Düzenlemeden sonra: aynı eski eşleşmeye denk gelince sonrası değişmez
+                    while hi < len(self.starts) and self.starts[hi] < start:
+                        hi += 1
+                    if hi < len(self.starts) and self.starts[hi] == start and self.ends[hi] == end:
+                        break
+                new_starts.append(start)
+                new_ends.append(end)
+            else:
+                hi = len(self.starts)
+        self.starts[lo:hi] = new_starts
+        self.ends[lo:hi] = new_ends
@@ -0,0 +1,53 @@
+# Oturum kaydı: açık sekmeler, imleç konumları ve görünen ilk satırlar (Tk bağımsız)
+# Dosya sekme başına tek bir kısa liste içerir; açılışta yalnızca bu dosya okunur,
+# sekmelerin kendileri seçildiklerinde açılır.
+import json
+import os
+
+from saver import atomic_write
+
+SESSION_PATH = os.path.join(os.path.expanduser("~"), ".notep", "session.json")
+SESSION_VERSION = 1
+
+
+class SessionTab:
+    __slots__ = ("path", "line", "col", "top")
+
+    def __init__(self, path, line=1, col=0, top=1):
+        # line/top 1 tabanlı mantıksal satırlar (büyük dosya modunda da dosyanın tamamına göre)
+        self.path = path
+        self.line = line
+        self.col = col
+        self.top = top
+
+    def to_json(self):
+        return [self.path, self.line, self.col, self.top]
+
+
+def save_session(tabs, active=0, path=SESSION_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = {"version": SESSION_VERSION, "active": active, "tabs": [tab.to_json() for tab in tabs]}
+    atomic_write(path, json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def load_session(path=SESSION_PATH):
+    # (sekmeler, etkin sekmenin sırası); dosya yoksa ya da bozuksa boş oturum
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return [], 0
+    if not isinstance(data, dict) or data.get("version") != SESSION_VERSION:
+        return [], 0
+    tabs = []
+    for item in data.get("tabs", []):
+        try:
+            file_path, line, col, top = item
+            tabs.append(SessionTab(str(file_path), int(line), int(col), int(top)))
+        except (TypeError, ValueError):
+            continue
+    try:
+        active = int(data.get("active", 0))
+    except (TypeError, ValueError):
+        active = 0
+    return tabs, max(0, min(active, len(tabs) - 1))
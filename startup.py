@@ -0,0 +1,62 @@
+# Açılış süresi ölçümü (--profile-startup)
+# Evreler süreç başlangıcına (main.py'nin ilk satırına) göre milisaniye olarak tutulur;
+# asıl izlenecek sayı ilk boyamaya kadar geçen süredir.
+import contextlib
+import json
+import platform
+import sys
+import time
+
+PROFILE_FLAG = "--profile-startup"
+
+
+def profile_target(argv):
+    # "--profile-startup" → "-" (standart çıktı), "--profile-startup=yol" → yol; yoksa None
+    for arg in argv[1:]:
+        if arg == PROFILE_FLAG:
+            return "-"
+        if arg.startswith(PROFILE_FLAG + "="):
+            return arg.split("=", 1)[1] or "-"
+    return None
+
+
+class StartupProfile:
+    def __init__(self, origin):
+        self.origin = origin
+        self.phases = []   # (ad, başlangıç, süre); saniye
+        self.events = {}   # ad → başlangıçtan bu yana geçen süre
+
+    def record(self, name, start, end=None):
+        end = time.perf_counter() if end is None else end
+        self.phases.append((name, start - self.origin, end - start))
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start)
+
+    def mark(self, name):
+        self.events.setdefault(name, time.perf_counter() - self.origin)
+
+    def report(self):
+        import tkinter
+        return {
+            "time_to_first_paint_ms": round(self.events.get("first_paint", 0.0) * 1000, 2),
+            "phases": [{"name": name, "start_ms": round(start * 1000, 2), "duration_ms": round(duration * 1000, 2)}
+                       for name, start, duration in self.phases],
+            "events_ms": {name: round(at * 1000, 2) for name, at in self.events.items()},
+            "python": platform.python_version(),
+            "tk": tkinter.TkVersion,
+            "platform": sys.platform,
+        }
+
+    def write(self, target):
+        data = json.dumps(self.report(), indent=2)
+        if target == "-":
+            print(data)
+        else:
+            with open(target, "w", encoding="utf-8") as f:
+                f.write(data + "\n")
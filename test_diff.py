@@ -0,0 +1,82 @@
+# diff.py için gerileme testleri: tekrarlı girdide fark, difflib'in bulduğundan büyük olmamalı
+#   python -m unittest test_diff
+import difflib
+import json
+import random
+import unittest
+
+from diff import diff_lines
+
+
+def changed_rows(hunks):
+    # Hizalanmış görünümde değişmiş görünen satır sayısı
+    return sum(max(a1 - a0, b1 - b0) for a0, a1, b0, b1 in hunks)
+
+
+def difflib_hunks(a, b):
+    matcher = difflib.SequenceMatcher(None, a, b, autojunk=False)
+    return [(i1, i2, j1, j2) for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != "equal"]
+
+
+def apply_hunks(a, b, hunks):
+    result = []
+    i = 0
+    for a0, a1, b0, b1 in hunks:
+        result += a[i:a0] + b[b0:b1]
+        i = a1
+    return result + a[i:]
+
+
+class RepetitiveInputTest(unittest.TestCase):
+    def check(self, a, b, slack=0):
+        hunks = diff_lines(a, b)
+        expected = difflib_hunks(a, b)
+        self.assertEqual(apply_hunks(a, b, hunks), b)
+        self.assertLessEqual(len(hunks), len(expected) + slack)
+        self.assertLessEqual(changed_rows(hunks), changed_rows(expected) + slack)
+
+    def test_accidental_rare_line(self):
+        # Bir satır değişti, bir satır eklendi; tek satırlık rastlantısal eşleşme uzun ortak bloğu bölmemeli
+        self.check(list("acbcedacbbaeabbcbadedacbceeedadcaabaaaa"),
+                   list("acbczacbbaeabbcbadedacbceeedadccaabaaaa"))
+
+    def test_repetitive_json(self):
+        # Aynı anahtarları tekrarlayan bir yapılandırma dosyasında üç küçük düzenleme
+        rng = random.Random(3)
+        for _ in range(20):
+            config = [{"name": "svc", "enabled": rng.choice([True, False]), "port": rng.choice([80, 443, 8080]),
+                       "tags": ["a", "b"]} for _ in range(60)]
+            a = json.dumps(config, indent=2).split("\n")
+            for _ in range(3):
+                config[rng.randrange(len(config))]["port"] = rng.choice([80, 443, 8080, 9000])
+                k = rng.randrange(len(config))
+                config.insert(k, dict(config[k]))
+            self.check(a, json.dumps(config, indent=2).split("\n"))
+
+    def test_small_alphabet(self):
+        # Birkaç farklı satırdan oluşan rastgele metin ve birkaç düzenleme; histogram yöntemi
+        # difflib'den biraz farklı hizalayabilir, ama fark büyümemeli
+        rng = random.Random(0)
+        worse = 0
+        for _ in range(500):
+            alphabet = rng.choice(["ab", "abc", "abcde", "abcdefghij"])
+            a = [rng.choice(alphabet) for _ in range(rng.randrange(5, 200))]
+            b = list(a)
+            for _ in range(rng.randrange(1, 6)):
+                p = min(rng.randrange(len(b) + 1), len(b) - 1)
+                op = rng.random()
+                if op < 0.3 and b:
+                    b[p] = "z"
+                elif op < 0.6:
+                    b.insert(p, rng.choice(alphabet + "z"))
+                elif b:
+                    del b[p]
+            hunks = diff_lines(a, b)
+            self.assertEqual(apply_hunks(a, b, hunks), b)
+            if changed_rows(hunks) > changed_rows(difflib_hunks(a, b)) + 10:
+                worse += 1
+        self.assertLessEqual(worse, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,217 @@
+# Metin dosyalarını okuma: BOM ve kodlama tespiti, satır sonu biçimi ve arka planda
+# parça parça açma (Tk bağımsız)
+# Kodlama BOM'dan ya da dosyanın başından alınan örnekten tahmin edilir. Satır sonları
+# tek tipse (LF, CRLF ya da CR) metinde "\n"e çevrilir ve kayıtta geri yazılır; karışıksa
+# metin olduğu gibi bırakılır, böylece kayıt dosyayı bayt bayt aynı yazar.
+import codecs
+import os
+import queue
+import threading
+
+SAMPLE_BYTES = 64 * 1024         # Kodlama ve satır sonu tahmini için okunan örnek; ilk parça da budur
+CHUNK_BYTES = 1024 * 1024        # Sonraki okumaların boyutu
+QUEUE_CHUNKS = 16                # Arayüzün gerisinde kalınca iş parçacığı bu kadar parçada bekler
+FALLBACK_ENCODINGS = ("cp1254", "latin-1")  # UTF-8 olmayan dosyalar; latin-1 her baytı çözer
+
+# Uzun BOM'lar önce denenir (UTF-32 LE, UTF-16 LE ile başlar)
+BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32-le"),
+    (codecs.BOM_UTF32_BE, "utf-32-be"),
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+NEWLINE_NAMES = {"\n": "LF", "\r\n": "CRLF", "\r": "CR"}
+
+
+class TextFormat:
+    __slots__ = ("encoding", "bom", "newline", "mixed")
+
+    def __init__(self, encoding="utf-8", bom=b"", newline="\n", mixed=False):
+        self.encoding = encoding
+        self.bom = bom          # Dosyanın başındaki BOM baytları (kayıtta aynen yazılır)
+        self.newline = newline  # Kayıtta "\n" yerine yazılacak satır sonu
+        self.mixed = mixed      # Karışık satır sonları: metin çevrilmeden tutulur
+
+    def set_newlines(self, crlf, lf, cr):
+        styles = [style for count, style in ((crlf, "\r\n"), (lf, "\n"), (cr, "\r")) if count]
+        self.mixed = len(styles) > 1
+        self.newline = styles[0] if len(styles) == 1 else "\n"
+
+    def translate(self, text):
+        if self.mixed or self.newline == "\n":
+            return text
+        return text.replace(self.newline, "\n")
+
+    def conflicts(self, crlf, lf, cr):
+        # Parçadaki satır sonları varsayılan biçime uymuyor mu
+        if self.mixed:
+            return False
+        return (crlf, lf, cr) != tuple(count if style == self.newline else 0
+                                       for count, style in ((crlf, "\r\n"), (lf, "\n"), (cr, "\r")))
+
+    @property
+    def byte_oriented(self):
+        # Satır sonu tek "\n" baytı mı (büyük dosya modu satırları bayt düzeyinde bulur)
+        return "\n".encode(self.encoding) == b"\n"
+
+    def describe(self):
+        name = codecs.lookup(self.encoding).name.upper()
+        newline = "karışık" if self.mixed else NEWLINE_NAMES[self.newline]
+        return f"{name}{' BOM' if self.bom else ''}, {newline}"
+
+
+def count_newlines(text):
+    crlf = text.count("\r\n")
+    return crlf, text.count("\n") - crlf, text.count("\r") - crlf
+
+
+def _decodes(data, encoding, final):
+    try:
+        codecs.getincrementaldecoder(encoding)("strict").decode(data, final)
+        return True
+    except UnicodeDecodeError:
+        return False
+
+
+def guess_encoding(data, final=True, tried=()):
+    # BOM'suz veri için: NUL bayt dağılımı UTF-16'yı ele verir; sonra UTF-8, sonra yedekler
+    half = len(data) // 2
+    if half:
+        even, odd = data[0::2].count(0), data[1::2].count(0)
+        if odd > half * 0.3 and even < half * 0.05 and "utf-16-le" not in tried:
+            return "utf-16-le"
+        if even > half * 0.3 and odd < half * 0.05 and "utf-16-be" not in tried:
+            return "utf-16-be"
+    for encoding in ("utf-8",) + FALLBACK_ENCODINGS:
+        if encoding not in tried and _decodes(data, encoding, final):
+            return encoding
+    return FALLBACK_ENCODINGS[-1]
+
+
+def detect_format(data, final=True):
+    # data dosyanın tamamı (final) ya da başından alınmış bir örnek
+    bom, encoding = b"", None
+    for mark, name in BOMS:
+        if data.startswith(mark):
+            bom, encoding = mark, name
+            break
+    body = data[len(bom):]
+    if encoding is None:
+        encoding = guess_encoding(body, final)
+    text = codecs.getincrementaldecoder(encoding)("replace").decode(body, final)
+    if not final and text.endswith("\r"):
+        text = text[:-1]  # Ardından "\n" gelip gelmediği bilinmiyor
+    fmt = TextFormat(encoding, bom)
+    fmt.set_newlines(*count_newlines(text))
+    return fmt
+
+
+def read_text(path):
+    # Dosyanın tamamını okur: (metin, TextFormat); metin açılışta editöre yüklenenle aynıdır
+    with open(path, "rb") as f:
+        data = f.read()
+    fmt = detect_format(data)
+    return fmt.translate(data[len(fmt.bom):].decode(fmt.encoding)), fmt
+
+
+def encode_text(text, encoding, newline="\n", bom=b""):
+    if newline != "\n":
+        text = text.replace("\n", newline)
+    return bom + text.encode(encoding)
+
+
+class FileLoader:
+    # Dosyayı arka plandaki bir iş parçacığında çözer ve metni parçalar halinde kuyruğa koyar.
+    # İletiler: ("format", TextFormat), ("chunk", metin, okunan bayt), ("reset", TextFormat),
+    # ("done", None), ("error", istisna). "reset" tahminin yanlış çıktığını bildirir (örnekte
+    # görünmeyen geçersiz bayt ya da farklı satır sonu); o ana kadar gelen metin atılır ve
+    # dosya baştan, kesinleşmiş biçimle yeniden gönderilir.
+    def __init__(self, path):
+        self.path = path
+        self.size = os.path.getsize(path)
+        self.messages = queue.Queue(maxsize=QUEUE_CHUNKS)
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def _put(self, message):
+        while not self._cancel.is_set():
+            try:
+                self.messages.put(message, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self):
+        try:
+            with open(self.path, "rb") as f:
+                fmt = detect_format(f.read(SAMPLE_BYTES), final=False)
+                self._put(("format", fmt))
+                tried = [fmt.encoding]
+                while not self._cancel.is_set():
+                    problem = self._stream(f, fmt)
+                    if problem is None:
+                        self._put(("done", None))
+                        return
+                    if problem == "encoding":
+                        f.seek(len(fmt.bom))
+                        sample = f.read(SAMPLE_BYTES)
+                        fmt = TextFormat(guess_encoding(sample, False, tried), fmt.bom)
+                        tried.append(fmt.encoding)
+                    # Satır sonları dosyanın tamamı taranarak kesinleştirilir; ikinci kez yeniden başlamaz
+                    fmt.set_newlines(*self._count_all(f, fmt))
+                    if not self._put(("reset", fmt)):
+                        return
+        except Exception as e:
+            self._put(("error", e))
+
+    def _stream(self, f, fmt):
+        # Dosyayı baştan gönderir; None (bitti), "encoding" ya da "newline" döner
+        f.seek(len(fmt.bom))
+        decoder = codecs.getincrementaldecoder(fmt.encoding)("strict")
+        carry = ""
+        size = SAMPLE_BYTES
+        while not self._cancel.is_set():
+            data = f.read(size)
+            size = CHUNK_BYTES
+            final = not data
+            try:
+                text = carry + decoder.decode(data, final)
+            except UnicodeDecodeError:
+                return "encoding"
+            carry = ""
+            if not final and text.endswith("\r"):
+                carry, text = "\r", text[:-1]
+            if fmt.conflicts(*count_newlines(text)):
+                return "newline"
+            if text and not self._put(("chunk", fmt.translate(text), f.tell())):
+                return None
+            if final:
+                return None
+        return None
+
+    def _count_all(self, f, fmt):
+        f.seek(len(fmt.bom))
+        decoder = codecs.getincrementaldecoder(fmt.encoding)("replace")
+        crlf = lf = cr = 0
+        carry = ""
+        while not self._cancel.is_set():
+            data = f.read(CHUNK_BYTES)
+            text = carry + decoder.decode(data, not data)
+            carry = ""
+            if data and text.endswith("\r"):
+                carry, text = "\r", text[:-1]
+            counts = count_newlines(text)
+            crlf, lf, cr = crlf + counts[0], lf + counts[1], cr + counts[2]
+            if not data:
+                break
+        return crlf, lf, cr
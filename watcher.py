@@ -0,0 +1,198 @@
+# Açık dosyaların diskte değişmesini izleme (Tk bağımsız)
+# Linux'ta inotify (ctypes ile) dosyaların bulunduğu klasörleri izler; atomik kayıtlarda
+# dosyanın inode'u değiştiği için dosyanın kendisi değil klasörü izlenir. inotify yoksa
+# dosyalar belirli aralıklarla stat ile yoklanır. Her iki durumda da değişen yollar bir
+# kümede biriktirilir ve arayüz iş parçacığı bunları toplu olarak alır (drain).
+import codecs
+import ctypes
+import ctypes.util
+import io
+import os
+import select
+import struct
+import threading
+import time
+
+POLL_INTERVAL_S = 1.0    # inotify yoksa yoklama aralığı
+COALESCE_S = 0.05        # Ardışık inotify olaylarını tek okumada toplamak için bekleme
+READ_SIZE = 64 * 1024
+
+# inotify sabitleri (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+              | IN_CREATE | IN_DELETE | IN_ONLYDIR)
+_EVENT = struct.Struct("iIII")
+
+
+def file_signature(path):
+    # Dosyanın diskteki halini ayırt etmeye yeten özet; dosya yoksa None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+def _load_inotify():
+    if not hasattr(os, "O_CLOEXEC"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        init = libc.inotify_init1
+    except (OSError, AttributeError):
+        return None
+    init.argtypes = [ctypes.c_int]
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    return libc
+
+
+class FileWatcher:
+    def __init__(self, poll_interval=POLL_INTERVAL_S):
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._paths = {}      # yol → son yoklamadaki imza (yoklama modunda kullanılır)
+        self._dirs = {}       # klasör → (izleme tanımlayıcısı, klasördeki izlenen dosya adları)
+        self._wds = {}        # izleme tanımlayıcısı → klasör
+        self._changed = set()
+        self._closed = False
+        self._libc = _load_inotify()
+        self._fd = -1
+        if self._libc is not None:
+            self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if self._fd < 0:
+                self._libc = None
+        self.backend = "inotify" if self._libc is not None else "poll"
+        self._thread = threading.Thread(target=self._run_inotify if self._libc else self._run_poll, daemon=True)
+        self._thread.start()
+
+    def set_paths(self, paths):
+        # İzlenecek yolların tamamı; eklenen/çıkan yollar buna göre ayarlanır
+        paths = {os.path.abspath(path) for path in paths}
+        with self._lock:
+            for path in set(self._paths) - paths:
+                del self._paths[path]
+                self._unwatch(path)
+            for path in paths - set(self._paths):
+                self._paths[path] = file_signature(path)
+                self._watch(path)
+
+    def _watch(self, path):
+        if self._libc is None:
+            return
+        directory, name = os.path.split(path)
+        if directory in self._dirs:
+            self._dirs[directory][1].add(name)
+            return
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            return  # Klasör yok ya da izin yok; dosya açılınca yeniden denenmez
+        self._dirs[directory] = (wd, {name})
+        self._wds[wd] = directory
+
+    def _unwatch(self, path):
+        if self._libc is None:
+            return
+        directory, name = os.path.split(path)
+        entry = self._dirs.get(directory)
+        if entry is None:
+            return
+        entry[1].discard(name)
+        if not entry[1]:
+            del self._dirs[directory]
+            self._wds.pop(entry[0], None)
+            self._libc.inotify_rm_watch(self._fd, entry[0])
+
+    def drain(self):
+        # Son çağrıdan bu yana değiştiği bildirilen yollar
+        with self._lock:
+            changed, self._changed = self._changed, set()
+        return changed
+
+    def close(self):
+        self._closed = True
+
+    def _run_poll(self):
+        while not self._closed:
+            time.sleep(self.poll_interval)
+            with self._lock:
+                paths = list(self._paths.items())
+            for path, signature in paths:
+                current = file_signature(path)
+                if current != signature:
+                    with self._lock:
+                        if path in self._paths:
+                            self._paths[path] = current
+                            self._changed.add(path)
+
+    def _run_inotify(self):
+        while not self._closed:
+            ready, _, _ = select.select([self._fd], [], [], self.poll_interval)
+            if not ready:
+                continue
+            time.sleep(COALESCE_S)
+            try:
+                data = os.read(self._fd, READ_SIZE)
+            except BlockingIOError:
+                continue
+            changed = set()
+            overflow = False
+            with self._lock:
+                offset = 0
+                while offset + _EVENT.size <= len(data):
+                    wd, mask, _, length = _EVENT.unpack_from(data, offset)
+                    name = data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b"\0")
+                    offset += _EVENT.size + length
+                    if mask & IN_Q_OVERFLOW:
+                        overflow = True
+                        continue
+                    if mask & IN_IGNORED:
+                        # Klasör silindi ya da taşındı; içindeki dosyalar değişmiş sayılır
+                        directory = self._wds.pop(wd, None)
+                        entry = self._dirs.pop(directory, None)
+                        if entry is not None:
+                            changed.update(os.path.join(directory, n) for n in entry[1])
+                        continue
+                    directory = self._wds.get(wd)
+                    if directory is None:
+                        continue
+                    name = os.fsdecode(name)
+                    if name in self._dirs[directory][1]:
+                        changed.add(os.path.join(directory, name))
+                if overflow:
+                    changed.update(self._paths)
+                self._changed.update(changed)
+
+
+class TailReader:
+    # Büyüyen bir dosyanın bilinen ofsetten sonra eklenen baytlarını metne çevirir.
+    # Kod çözücü artımlıdır: okuma sınırında bölünen çok baytlı karakterler ve \r\n
+    # çiftleri bir sonraki okumaya kadar bekletilir.
+    def __init__(self, path, offset, encoding="utf-8"):
+        self.path = path
+        self.offset = offset
+        self.signature = file_signature(path)
+        self._decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder(encoding)("replace"), True)
+
+    def read(self, limit):
+        # (metin, dosyada okunmamış bayt kaldı mı); dosya kısaldıysa ya da yerine başka
+        # bir dosya geldiyse (ör. günlük döndürme) None döner ve baştan okunması gerekir
+        signature = file_signature(self.path)
+        if signature is None or self.signature is None or signature[0] != self.signature[0] \
+                or signature[1] < self.offset:
+            return None
+        self.signature = signature
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read(limit)
+        self.offset += len(data)
+        return self._decoder.decode(data), self.offset < signature[1]
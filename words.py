@@ -0,0 +1,161 @@
+# Sekmeler arası kelime dizini: tamamlama önerileri için (Tk bağımsız)
+# Ortak dizin kelime → toplam sayı sözlüğü ile önek sorguları için sıralı bir kelime listesi
+# tutar. Her sekme metnini satır bloklarına böler ve her bloğun kelime sayımını ortak dizine
+# ekler; bir düzenleme yalnızca dokunduğu blokların katkısını geri alıp onları kirli işaretler,
+# kirli bloklar daha sonra zaman dilimleriyle yeniden sayılır.
+import bisect
+import heapq
+import re
+import time
+from collections import Counter
+from itertools import accumulate
+
+WORD_RE = re.compile(r"[^\W\d]\w{2,}")  # Harfle başlayan, en az 3 karakterli tanımlayıcılar
+BLOCK_LINES = 256   # Yeniden sayımda tek bloğun en fazla satır sayısı
+RESORT_RATIO = 8    # Bekleyen ekleme/silme sıralı listenin 1/8'ini aşarsa liste baştan sıralanır
+PREFIX_END = "\U0010ffff"
+
+
+class WordIndex:
+    def __init__(self):
+        self.counts = {}      # kelime → bütün sekmelerdeki toplam sayı
+        self._sorted = []     # Önek aramaları için sıralı kelimeler (sorguda güncellenir)
+        self._added = set()
+        self._removed = set()
+
+    def __len__(self):
+        return len(self.counts)
+
+    def add(self, counter):
+        counts = self.counts
+        for word, n in counter.items():
+            total = counts.get(word)
+            if total is None:
+                counts[word] = n
+                self._added.add(word)
+            else:
+                counts[word] = total + n
+
+    def subtract(self, counter):
+        counts = self.counts
+        for word, n in counter.items():
+            total = counts[word] - n
+            if total:
+                counts[word] = total
+            else:
+                del counts[word]
+                self._removed.add(word)
+
+    def _words(self):
+        # Sıralı listeyi bekleyen değişikliklerle güncelle; az değişiklik yerinde eklenip silinir
+        added, removed = self._added, self._removed
+        if not added and not removed:
+            return self._sorted
+        words, counts = self._sorted, self.counts
+        if len(added) + len(removed) > len(words) // RESORT_RATIO:
+            self._sorted = words = sorted(counts)
+        else:
+            # Silinip yeniden eklenen (ya da tersi) kelimeler iki kümede birden olabilir
+            for word in removed:
+                if word not in counts:
+                    i = bisect.bisect_left(words, word)
+                    if i < len(words) and words[i] == word:
+                        del words[i]
+            for word in added:
+                if word in counts:
+                    i = bisect.bisect_left(words, word)
+                    if i == len(words) or words[i] != word:
+                        words.insert(i, word)
+        added.clear()
+        removed.clear()
+        return words
+
+    def complete(self, prefix, limit):
+        # prefix ile başlayan en sık limit kelime (prefix'in kendisi hariç); eşitlikte alfabetik
+        words = self._words()
+        lo = bisect.bisect_left(words, prefix)
+        hi = bisect.bisect_left(words, prefix + PREFIX_END, lo)
+        found = heapq.nlargest(limit + 1, words[lo:hi], key=self.counts.__getitem__)
+        return [word for word in found if word != prefix][:limit]
+
+
+class DocumentWords:
+    # Bir sekmenin ortak dizine katkısı: satır blokları ve her bloğun kelime sayımı
+    # (None: düzenlendi, yeniden sayılacak). Satır numaraları 1 tabanlıdır.
+    def __init__(self, index, line_count=1):
+        self.index = index
+        self._sizes = [line_count]
+        self._counts = [None]
+        self._starts = None
+
+    def reset(self, line_count):
+        self.discard()
+        self._sizes = [line_count]
+        self._counts = [None]
+
+    def discard(self):
+        # Sekme kapanırken (ya da uyutulurken) bütün katkıları dizinden çıkar
+        for counts in self._counts:
+            if counts is not None:
+                self.index.subtract(counts)
+        self._sizes, self._counts, self._starts = [], [], None
+
+    @property
+    def dirty(self):
+        return None in self._counts
+
+    def _block_starts(self):
+        # starts[i]: i. bloğun ilk satırı; son eleman satır sayısı + 1
+        if self._starts is None:
+            self._starts = list(accumulate(self._sizes, initial=1))
+        return self._starts
+
+    def _replace(self, starts, first, last, count):
+        # first..last satırlarını kapsayan bloklar tek bir kirli blokta birleşir
+        if not self._sizes:
+            return
+        last = max(min(last, starts[-1] - 1), first)
+        i = max(bisect.bisect_right(starts, first) - 1, 0)
+        j = min(bisect.bisect_right(starts, last) - 1, len(self._sizes) - 1)
+        for counts in self._counts[i:j + 1]:
+            if counts is not None:
+                self.index.subtract(counts)
+        self._sizes[i:j + 1] = [sum(self._sizes[i:j + 1]) + count - (last - first + 1)]
+        self._counts[i:j + 1] = [None]
+
+    def replace(self, first, last, count):
+        # Düzenleme öncesi first..last satırlarının yerini count satır aldı
+        self._replace(self._block_starts(), first, last, count)
+        self._starts = None
+
+    def replace_many(self, edits):
+        # Artan sırada, çakışmayan (first, last, delta) düzenlemeleri; sondan başa uygulanınca
+        # öndeki blokların başlangıçları geçerli kalır
+        starts = self._block_starts()
+        for first, last, delta in reversed(edits):
+            self._replace(starts, first, last, last + delta - first + 1)
+        self._starts = None
+
+    def refresh(self, get_lines, deadline):
+        # Kirli blokları deadline'a (perf_counter) kadar say; iş kaldıysa True.
+        # get_lines(first, last): satırların "\n" ile birleştirilmiş metni
+        sizes, blocks = self._sizes, self._counts
+        line, i, counted = 1, 0, 0
+        while i < len(sizes):
+            if blocks[i] is None:
+                if counted and time.perf_counter() >= deadline:
+                    self._starts = None
+                    return True
+                size = sizes[i]
+                if size > BLOCK_LINES:
+                    sizes[i:i + 1] = [BLOCK_LINES, size - BLOCK_LINES]
+                    blocks.insert(i + 1, None)
+                    size = BLOCK_LINES
+                counts = Counter(WORD_RE.findall(get_lines(line, line + size - 1)))
+                self.index.add(counts)
+                blocks[i] = counts
+                counted += 1
+            line += sizes[i]
+            i += 1
+        self._starts = None
+        return False